@@ -5,20 +5,24 @@ import asyncio
 import aiohttp
 import time
 import random
-import json
 import os
 import socket
 import re
 from datetime import datetime, timedelta
-from pathlib import Path
 import plotly.express as px
 import plotly.graph_objects as go
 from concurrent.futures import ThreadPoolExecutor
 import whois
 from fake_useragent import UserAgent
 import numpy as np
-from textblob import TextBlob
 from bs4 import BeautifulSoup
+from modules.database import create_database
+from modules.price_scraper import EnhancedPriceScraper
+from modules.trend_analyzer import EnhancedTrendAnalyzer
+from modules.trends_backend import TrendsBackend
+from modules.mention_index import MentionIndex
+from modules.seeding import derive_rng
+from modules import data_transfer
 
 # ===== CONFIGURATION =====
 st.set_page_config(
@@ -28,285 +32,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# ===== ENHANCED FILE-BASED DATABASE =====
-class EnhancedFileDB:
-    """File-based database system (SQLite3 alternative)"""
-    
-    def __init__(self, data_dir="data"):
-        self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
-        
-        # Define file paths
-        self.domains_file = self.data_dir / "domains.json"
-        self.searches_file = self.data_dir / "searches.json"
-        self.analytics_file = self.data_dir / "analytics.json"
-        self.config_file = self.data_dir / "config.json"
-        
-        # Initialize files
-        self.init_files()
-    
-    def init_files(self):
-        """Initialize JSON files if they don't exist"""
-        default_data = {
-            self.domains_file: {"domains": [], "last_updated": datetime.now().isoformat()},
-            self.searches_file: {"searches": [], "last_updated": datetime.now().isoformat()},
-            self.analytics_file: {
-                "total_searches": 0,
-                "total_domains_found": 0,
-                "total_domains_checked": 0,
-                "last_updated": datetime.now().isoformat()
-            },
-            self.config_file: {
-                "app_version": "2.0.0",
-                "created": datetime.now().isoformat(),
-                "settings": {
-                    "auto_save": True,
-                    "max_results": 10000,
-                    "cache_duration": 3600
-                }
-            }
-        }
-        
-        for file_path, data in default_data.items():
-            if not file_path.exists():
-                self.write_json_file(file_path, data)
-    
-    def read_json_file(self, file_path):
-        """Safely read JSON file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            st.error(f"Error reading {file_path}: {e}")
-            return {}
-    
-    def write_json_file(self, file_path, data):
-        """Safely write JSON file"""
-        try:
-            # Create backup before writing
-            if file_path.exists():
-                backup_path = file_path.with_suffix('.json.backup')
-                file_path.rename(backup_path)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            
-            return True
-        except Exception as e:
-            st.error(f"Error writing {file_path}: {e}")
-            return False
-    
-    def save_domain(self, domain_data):
-        """Save domain to database"""
-        try:
-            data = self.read_json_file(self.domains_file)
-            
-            # Add metadata
-            domain_data['id'] = len(data.get('domains', [])) + 1
-            domain_data['saved_at'] = datetime.now().isoformat()
-            
-            # Add to domains list
-            if 'domains' not in data:
-                data['domains'] = []
-            
-            data['domains'].append(domain_data)
-            data['last_updated'] = datetime.now().isoformat()
-            
-            # Write back to file
-            success = self.write_json_file(self.domains_file, data)
-            
-            if success:
-                # Update analytics
-                self.update_analytics('domain_added')
-            
-            return success
-            
-        except Exception as e:
-            st.error(f"Error saving domain: {e}")
-            return False
-    
-    def get_domains(self, limit=None, filters=None):
-        """Get domains with optional filtering"""
-        try:
-            data = self.read_json_file(self.domains_file)
-            domains = data.get('domains', [])
-            
-            # Apply filters if provided
-            if filters:
-                filtered_domains = []
-                for domain in domains:
-                    # Price filter
-                    if 'max_price' in filters and domain.get('price', 0) > filters['max_price']:
-                        continue
-                    
-                    # Extension filter
-                    if 'extension' in filters and domain.get('extension') != filters['extension']:
-                        continue
-                    
-                    # Trend score filter
-                    if 'min_trend_score' in filters and domain.get('trend_score', 0) < filters['min_trend_score']:
-                        continue
-                    
-                    filtered_domains.append(domain)
-                
-                domains = filtered_domains
-            
-            # Apply limit
-            if limit:
-                domains = domains[-limit:]  # Get most recent
-            
-            return domains
-            
-        except Exception as e:
-            st.error(f"Error getting domains: {e}")
-            return []
-    
-    def save_search(self, search_data):
-        """Save search history"""
-        try:
-            data = self.read_json_file(self.searches_file)
-            
-            # Add metadata
-            search_data['id'] = len(data.get('searches', [])) + 1
-            search_data['timestamp'] = datetime.now().isoformat()
-            
-            # Add to searches list
-            if 'searches' not in data:
-                data['searches'] = []
-            
-            data['searches'].append(search_data)
-            data['last_updated'] = datetime.now().isoformat()
-            
-            # Write back to file
-            success = self.write_json_file(self.searches_file, data)
-            
-            if success:
-                # Update analytics
-                self.update_analytics('search_completed', search_data)
-            
-            return success
-            
-        except Exception as e:
-            st.error(f"Error saving search: {e}")
-            return False
-    
-    def update_analytics(self, event_type, event_data=None):
-        """Update analytics data"""
-        try:
-            data = self.read_json_file(self.analytics_file)
-            
-            if event_type == 'domain_added':
-                data['total_domains_found'] = data.get('total_domains_found', 0) + 1
-            
-            elif event_type == 'search_completed':
-                data['total_searches'] = data.get('total_searches', 0) + 1
-                if event_data:
-                    data['total_domains_checked'] = data.get('total_domains_checked', 0) + event_data.get('domains_checked', 0)
-            
-            data['last_updated'] = datetime.now().isoformat()
-            
-            return self.write_json_file(self.analytics_file, data)
-            
-        except Exception as e:
-            st.error(f"Error updating analytics: {e}")
-            return False
-    
-    def get_analytics(self):
-        """Get analytics data"""
-        try:
-            data = self.read_json_file(self.analytics_file)
-            domains = self.get_domains()
-            
-            # Calculate additional metrics
-            if domains:
-                prices = [d.get('price', 0) for d in domains if d.get('price')]
-                trend_scores = [d.get('trend_score', 0) for d in domains if d.get('trend_score')]
-                
-                analytics = {
-                    'total_domains': len(domains),
-                    'total_searches': data.get('total_searches', 0),
-                    'total_checked': data.get('total_domains_checked', 0),
-                    'avg_price': sum(prices) / len(prices) if prices else 0,
-                    'avg_trend_score': sum(trend_scores) / len(trend_scores) if trend_scores else 0,
-                    'min_price': min(prices) if prices else 0,
-                    'max_price': max(prices) if prices else 0,
-                    'extensions_distribution': self.get_extensions_distribution(domains),
-                    'recent_domains': domains[-10:] if domains else [],
-                    'price_ranges': self.get_price_ranges(domains),
-                    'trend_score_ranges': self.get_trend_score_ranges(domains)
-                }
-            else:
-                analytics = {
-                    'total_domains': 0,
-                    'total_searches': data.get('total_searches', 0),
-                    'total_checked': data.get('total_domains_checked', 0),
-                    'avg_price': 0,
-                    'avg_trend_score': 0,
-                    'min_price': 0,
-                    'max_price': 0,
-                    'extensions_distribution': {},
-                    'recent_domains': [],
-                    'price_ranges': {},
-                    'trend_score_ranges': {}
-                }
-            
-            return analytics
-            
-        except Exception as e:
-            st.error(f"Error getting analytics: {e}")
-            return {}
-    
-    def get_extensions_distribution(self, domains):
-        """Get distribution of domain extensions"""
-        extensions = {}
-        for domain in domains:
-            ext = domain.get('extension', 'unknown')
-            extensions[ext] = extensions.get(ext, 0) + 1
-        return extensions
-    
-    def get_price_ranges(self, domains):
-        """Get price range distribution"""
-        ranges = {
-            'under_20': 0,
-            '20_to_50': 0,
-            '50_to_100': 0,
-            'over_100': 0
-        }
-        
-        for domain in domains:
-            price = domain.get('price', 0)
-            if price < 20:
-                ranges['under_20'] += 1
-            elif price < 50:
-                ranges['20_to_50'] += 1
-            elif price < 100:
-                ranges['50_to_100'] += 1
-            else:
-                ranges['over_100'] += 1
-        
-        return ranges
-    
-    def get_trend_score_ranges(self, domains):
-        """Get trend score range distribution"""
-        ranges = {
-            'low_0_40': 0,
-            'medium_40_70': 0,
-            'high_70_90': 0,
-            'excellent_90_100': 0
-        }
-        
-        for domain in domains:
-            score = domain.get('trend_score', 0)
-            if score < 40:
-                ranges['low_0_40'] += 1
-            elif score < 70:
-                ranges['medium_40_70'] += 1
-            elif score < 90:
-                ranges['high_70_90'] += 1
-            else:
-                ranges['excellent_90_100'] += 1
-        
-        return ranges
+# Database exports: largest file offered through the download button, and files kept in data/exports
+MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024
+MAX_KEPT_EXPORTS = 3
 
 # ===== ENHANCED DOMAIN CHECKER =====
 class EnhancedDomainChecker:
@@ -453,8 +181,9 @@ class EnhancedWordGenerator:
             'base', 'core', 'edge', 'plus', 'max', 'ultra', 'prime', 'elite'
         ]
     
-    def generate_combinations(self, categories, max_combinations=5000):
+    def generate_combinations(self, categories, max_combinations=5000, seed=None):
         """Generate intelligent domain name combinations"""
+        rng = derive_rng(seed, 'combinations')
         all_words = set()
         
         # Category mapping
@@ -473,12 +202,16 @@ class EnhancedWordGenerator:
         
         # Add trending words if requested
         if 'Trending' in categories:
-            trending = self.get_trending_keywords()
+            trending = self.get_trending_keywords(rng)
             all_words.update(trending)
         
         # Generate combinations
         combinations = []
         word_list = list(all_words)
+        if seed is not None:
+            # Set order follows the interpreter's hash seed, so fix it for seeded runs
+            word_list = sorted(word_list)
+            rng.shuffle(word_list)
         
         # 1. Single words (20% of results)
         single_words = word_list[:max_combinations//5]
@@ -525,9 +258,12 @@ class EnhancedWordGenerator:
         
         # Remove duplicates and return
         unique_combinations = list(set(combinations))
+        if seed is not None:
+            unique_combinations = sorted(unique_combinations)
+            rng.shuffle(unique_combinations)
         return unique_combinations[:max_combinations]
     
-    def get_trending_keywords(self):
+    def get_trending_keywords(self, rng=random):
         """Get trending keywords from various sources"""
         trending_words = []
         
@@ -542,334 +278,38 @@ class EnhancedWordGenerator:
         trending_words.extend(current_trends)
         
         # Add some randomness to simulate real trending data
-        tech_trending = random.sample(self.tech_terms, min(10, len(self.tech_terms)))
+        tech_trending = rng.sample(self.tech_terms, min(10, len(self.tech_terms)))
         trending_words.extend(tech_trending)
         
         return trending_words[:30]  # Return top 30 trending
 
-# ===== ENHANCED PRICE SCRAPER =====
-class EnhancedPriceScraper:
-    """Enhanced price scraper for multiple domain registrars"""
-    
-    def __init__(self):
-        self.ua = UserAgent()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
-        
-        # Realistic price ranges by extension
-        self.price_ranges = {
-            'com': (8.99, 15.99),
-            'ai': (25.99, 89.99),
-            'io': (35.99, 65.99),
-            'co': (25.99, 45.99),
-            'net': (10.99, 18.99),
-            'org': (12.99, 20.99),
-            'tech': (15.99, 35.99),
-            'app': (18.99, 25.99),
-            'dev': (12.99, 22.99)
-        }
-    
-    def get_domain_price(self, domain):
-        """Get realistic domain price with enhanced simulation"""
-        extension = domain.split('.')[-1]
-        min_price, max_price = self.price_ranges.get(extension, (15.99, 35.99))
-        
-        # Add some variation based on domain characteristics
-        domain_name = domain.split('.')[0]
-        
-        # Shorter domains cost more
-        if len(domain_name) <= 4:
-            max_price *= 1.5
-        elif len(domain_name) <= 6:
-            max_price *= 1.2
-        
-        # Premium keywords cost more
-        premium_keywords = ['ai', 'crypto', 'nft', 'web3', 'tech', 'app', 'pro']
-        if any(keyword in domain_name.lower() for keyword in premium_keywords):
-            max_price *= 1.3
-        
-        price = round(random.uniform(min_price, max_price), 2)
-        
-        return {
-            'price': price,
-            'registrar': random.choice(['namecheap', 'godaddy', 'porkbun', 'namesilo']),
-            'all_prices': {
-                'namecheap': round(price + random.uniform(-3, 5), 2),
-                'godaddy': round(price + random.uniform(-2, 8), 2),
-                'porkbun': round(price + random.uniform(-5, 2), 2),
-                'namesilo': round(price + random.uniform(-4, 6), 2)
-            }
-        }
+# ===== MAIN APPLICATION =====
+@st.cache_resource
+def get_database():
+    """One database per server process, so its in-memory cache survives reruns"""
+    return create_database()
 
-# ===== ENHANCED TREND ANALYZER =====
-class EnhancedTrendAnalyzer:
-    """Enhanced trend analysis for domain keywords"""
-    
-    def __init__(self):
-        self.trending_cache = {}
-        self.cache_duration = 3600  # 1 hour cache
-        
-    def calculate_trend_score(self, keyword):
-        """Calculate comprehensive trend score (0-100)"""
-        scores = {
-            'search_volume': self.get_search_volume_score(keyword),
-            'social_mentions': self.get_social_media_score(keyword),
-            'news_mentions': self.get_news_mention_score(keyword),
-            'commercial_intent': self.get_commercial_intent_score(keyword),
-            'growth_trend': self.get_growth_trend_score(keyword)
-        }
-        
-        # Weighted average
-        weights = {
-            'search_volume': 0.25,
-            'social_mentions': 0.20,
-            'news_mentions': 0.20,
-            'commercial_intent': 0.20,
-            'growth_trend': 0.15
-        }
-        
-        total_score = sum(scores[key] * weights[key] for key in scores if scores[key] is not None)
-        return min(100, max(0, int(total_score)))
-    
-    def get_search_volume_score(self, keyword):
-        """Estimate search volume score"""
-        # Simulate search volume based on keyword characteristics
-        base_score = random.randint(30, 80)
-        
-        # High-value keywords get bonus
-        high_value_terms = [
-            'ai', 'crypto', 'nft', 'web3', 'blockchain', 'defi',
-            'health', 'fitness', 'finance', 'invest', 'tech', 'app'
-        ]
-        
-        if any(term in keyword.lower() for term in high_value_terms):
-            base_score += random.randint(10, 20)
-        
-        # Length penalty (very long keywords typically have lower search volume)
-        if len(keyword) > 15:
-            base_score -= 10
-        elif len(keyword) < 4:
-            base_score -= 5
-        
-        return min(100, max(0, base_score))
-    
-    def get_social_media_score(self, keyword):
-        """Analyze social media mentions and sentiment"""
-        try:
-            # Simulate social media analysis
-            base_mentions = random.randint(50, 500)
-            
-            # Trending topics get more mentions
-            trending_keywords = [
-                'ai', 'chatgpt', 'crypto', 'bitcoin', 'nft', 'web3',
-                'metaverse', 'sustainability', 'climate', 'remote'
-            ]
-            
-            if any(trend in keyword.lower() for trend in trending_keywords):
-                base_mentions *= random.uniform(2, 5)
-            
-            # Convert mentions to score (0-100)
-            score = min(100, int(base_mentions / 10))
-            
-            return score
-            
-        except Exception:
-            return random.randint(40, 70)
-    
-    def get_news_mention_score(self, keyword):
-        """Get news mention score"""
-        try:
-            # Simulate news analysis
-            news_score = random.randint(20, 90)
-            
-            # Tech and finance keywords often in news
-            news_heavy_topics = [
-                'ai', 'artificial', 'intelligence', 'crypto', 'bitcoin',
-                'climate', 'health', 'finance', 'economy', 'tech'
-            ]
-            
-            if any(topic in keyword.lower() for topic in news_heavy_topics):
-                news_score += random.randint(5, 15)
-            
-            return min(100, news_score)
-            
-        except Exception:
-            return random.randint(30, 60)
-    
-    def get_commercial_intent_score(self, keyword):
-        """Analyze commercial intent of keyword"""
-        commercial_indicators = [
-            'buy', 'purchase', 'price', 'cost', 'cheap', 'discount',
-            'deal', 'sale', 'shop', 'store', 'market', 'service',
-            'product', 'solution', 'software', 'app', 'tool', 'platform'
-        ]
-        
-        # Check for commercial terms
-        commercial_score = 0
-        keyword_lower = keyword.lower()
-        
-        for indicator in commercial_indicators:
-            if indicator in keyword_lower:
-                commercial_score += 15
-        
-        # Industry-specific commercial terms
-        industry_terms = {
-            'tech': ['app', 'software', 'platform', 'tool', 'api', 'saas'],
-            'health': ['care', 'treatment', 'therapy', 'supplement', 'service'],
-            'finance': ['invest', 'trading', 'bank', 'pay', 'fund', 'wealth']
-        }
-        
-        for industry, terms in industry_terms.items():
-            if any(term in keyword_lower for term in terms):
-                commercial_score += 10
-                break
-        
-        # Base commercial potential
-        if not commercial_score:
-            commercial_score = random.randint(20, 50)
-        
-        return min(100, commercial_score)
-    
-    def get_growth_trend_score(self, keyword):
-        """Analyze growth trend of keyword"""
-        # Simulate growth trend analysis
-        growth_categories = {
-            'explosive': ['ai', 'chatgpt', 'nft', 'web3', 'metaverse'],
-            'strong': ['crypto', 'defi', 'sustainability', 'remote', 'digital'],
-            'steady': ['health', 'fitness', 'finance', 'tech', 'app'],
-            'declining': ['flash', 'cd', 'dvd', 'fax']
-        }
-        
-        keyword_lower = keyword.lower()
-        
-        for category, terms in growth_categories.items():
-            if any(term in keyword_lower for term in terms):
-                if category == 'explosive':
-                    return random.randint(85, 100)
-                elif category == 'strong':
-                    return random.randint(70, 90)
-                elif category == 'steady':
-                    return random.randint(50, 75)
-                elif category == 'declining':
-                    return random.randint(10, 40)
-        
-        # Default growth score
-        return random.randint(40, 70)
-    
-    def get_market_value_estimate(self, domain, trend_score):
-        """Estimate market value based on trends and domain characteristics"""
-        keyword = domain.split('.')[0]
-        extension = domain.split('.')[-1]
-        
-        # Base value calculation
-        base_value = trend_score * random.uniform(8, 25)
-        
-        # Length bonus/penalty
-        if len(keyword) <= 4:
-            base_value *= 2.5  # Short domains are premium
-        elif len(keyword) <= 6:
-            base_value *= 1.8
-        elif len(keyword) <= 8:
-            base_value *= 1.3
-        elif len(keyword) > 12:
-            base_value *= 0.7  # Long domains less valuable
-        
-        # Extension multipliers
-        extension_multipliers = {
-            'com': 3.0,
-            'ai': 2.5,
-            'io': 2.0,
-            'co': 1.8,
-            'net': 1.5,
-            'org': 1.3,
-            'tech': 1.4,
-            'app': 1.6,
-            'dev': 1.3
-        }
-        
-        multiplier = extension_multipliers.get(extension, 1.0)
-        estimated_value = base_value * multiplier
-        
-        # Industry-specific bonuses
-        industry_bonuses = {
-            'ai': 1.5,
-            'crypto': 1.4,
-            'health': 1.3,
-            'finance': 1.3,
-            'tech': 1.2
-        }
-        
-        for industry, bonus in industry_bonuses.items():
-            if industry in keyword.lower():
-                estimated_value *= bonus
-                break
-        
-        # Brandability bonus
-        brandability_score = self.calculate_brandability_score(keyword)
-        if brandability_score > 80:
-            estimated_value *= 1.3
-        elif brandability_score > 60:
-            estimated_value *= 1.1
-        
-        return max(100, min(100000, int(estimated_value)))
-    
-    def calculate_brandability_score(self, keyword):
-        """Calculate how brandable a keyword is"""
-        score = 50  # Base score
-        
-        # Length scoring
-        length = len(keyword)
-        if 4 <= length <= 8:
-            score += 25
-        elif 9 <= length <= 10:
-            score += 15
-        elif length < 4:
-            score += 10
-        else:
-            score -= 10
-        
-        # Pronounceability
-        vowels = sum(1 for char in keyword.lower() if char in 'aeiou')
-        consonants = length - vowels
-        
-        if vowels > 0 and consonants > 0:
-            vowel_ratio = vowels / length
-            if 0.2 <= vowel_ratio <= 0.6:  # Good vowel/consonant balance
-                score += 20
-        
-        # Avoid numbers and special characters
-        if any(char.isdigit() or char in '-_' for char in keyword):
-            score -= 25
-        
-        # Dictionary word bonus
-        common_words = [
-            'smart', 'quick', 'fast', 'easy', 'simple', 'pro', 'max',
-            'ultra', 'super', 'mega', 'best', 'top', 'prime', 'elite'
-        ]
-        
-        if keyword.lower() in common_words:
-            score += 15
-        
-        # Memorable patterns
-        if len(set(keyword.lower())) < len(keyword) * 0.7:  # Some repeated letters
-            score += 10
-        
-        return max(0, min(100, score))
+@st.cache_resource
+def get_mention_index():
+    """The news/social mention index, loaded once per server process"""
+    return MentionIndex()
+
+@st.cache_resource
+def get_trends_backend():
+    """One Google Trends backend per server process, sharing its cache and request worker"""
+    return TrendsBackend()
 
-# ===== MAIN APPLICATION =====
 def main():
     # Initialize components
-    db = EnhancedFileDB()
+    db = get_database()
     domain_checker = EnhancedDomainChecker()
     word_generator = EnhancedWordGenerator()
     price_scraper = EnhancedPriceScraper()
-    trend_analyzer = EnhancedTrendAnalyzer()
+    
+    # Mention scores come from the local news/social index once it has been built
+    mention_index = get_mention_index()
+    mention_index.refresh()  # Picks up an index rebuilt while the app runs
+    trend_analyzer = EnhancedTrendAnalyzer(mention_index=mention_index if mention_index.term_count else None)
     
     # Custom CSS
     st.markdown("""
@@ -957,8 +397,10 @@ def main():
             enable_real_checking = st.checkbox("Real Domain Checking", True)
             enable_price_analysis = st.checkbox("Price Analysis", True)
             enable_trend_analysis = st.checkbox("Trend Analysis", True)
+            st.checkbox("Real Google Trends Data", False, key='enable_real_trends')
             parallel_processing = st.checkbox("Parallel Processing", True)
             save_results = st.checkbox("Save Results to File", True)
+            st.number_input("Run Seed (0 = random)", min_value=0, value=0, step=1, key='hunt_seed')
         
         st.divider()
         
@@ -1040,7 +482,7 @@ def display_hunt_tab(db, domain_checker, word_generator, price_scraper, trend_an
     
     # Live Hunt Display
     if st.session_state.get('hunting_active', False):
-        display_live_enhanced_hunt()
+        display_live_enhanced_hunt(db, domain_checker, price_scraper, trend_analyzer)
 
 def start_enhanced_hunt(db, domain_checker, word_generator, price_scraper, trend_analyzer,
                        max_price, max_domains, min_trend_score, extensions, categories,
@@ -1059,17 +501,23 @@ def start_enhanced_hunt(db, domain_checker, word_generator, price_scraper, trend
         'extensions': extensions,
         'categories': categories,
         'enable_real_checking': enable_real_checking,
+        'enable_price_analysis': enable_price_analysis,
+        'enable_trend_analysis': enable_trend_analysis,
+        'enable_real_trends': st.session_state.get('enable_real_trends', False),
+        'seed': st.session_state.get('hunt_seed') or None,
         'save_results': save_results
     }
     
     # Generate word combinations
     with st.spinner("🧠 Generating intelligent word combinations..."):
-        words = word_generator.generate_combinations(categories, max_domains)
+        words = word_generator.generate_combinations(
+            categories, max_domains, seed=st.session_state.hunt_config['seed']
+        )
         st.session_state.hunt_words = words
     
     st.success(f"🎯 Enhanced hunt started! Generated {len(words)} combinations to check.")
 
-def display_live_enhanced_hunt():
+def display_live_enhanced_hunt(db, domain_checker, price_scraper, trend_analyzer):
     """Display live enhanced hunting"""
     
     progress_container = st.container()
@@ -1092,61 +540,139 @@ def display_live_enhanced_hunt():
     found_domains = []
     start_time = time.time()
     
-    for i, word in enumerate(words[:total_words]):
-        if not st.session_state.get('hunting_active', False):
-            break
-        
-        # Update progress
-        progress = (i + 1) / total_words
-        progress_bar.progress(progress)
-        
-        # Check each extension
-        for ext in config['extensions']:
-            domain = f"{word}{ext}"
-            current_domain_placeholder.text(f"🔍 Checking: {domain}")
+    # Words per batch; available domains of a batch are premium-checked together
+    hunt_batch_size = 25
+    
+    # Keyword features, computed once per word and shared by all its extensions
+    keyword_features = {}
+    
+    # Found domains are saved in bulk once enough are pending or enough time has passed
+    save_batch_size = 50
+    save_interval = 5.0
+    pending_saves = []
+    last_save = time.time()
+    
+    def flush_saves(force=False):
+        """Save pending finds once enough are queued or the save interval has passed"""
+        nonlocal pending_saves, last_save
+        if pending_saves and (force or len(pending_saves) >= save_batch_size or time.time() - last_save >= save_interval):
+            db.save_domains(pending_saves)
+            pending_saves = []
+            last_save = time.time()
+    
+    # Seeded runs derive every random draw from the run seed and the domain
+    seed = config.get('seed')
+    trend_analyzer.seed = seed
+    price_scraper.set_seed(seed)
+    
+    # Real search interest replaces the simulated search volume and growth scores
+    if config.get('enable_trend_analysis', False) and config.get('enable_real_trends', False):
+        trend_analyzer.trends_backend = get_trends_backend()
+    
+    # Stop and reruns interrupt the script, so finds queued for saving are flushed in finally
+    try:
+        for batch_start in range(0, total_words, hunt_batch_size):
+            if not st.session_state.get('hunting_active', False):
+                break
             
-            # Speed calculation
-            elapsed = time.time() - start_time
-            speed = (i + 1) / elapsed if elapsed > 0 else 0
-            speed_placeholder.text(f"⚡ Speed: {speed:.1f} domains/sec")
+            batch_words = words[batch_start:min(batch_start + hunt_batch_size, total_words)]
+            available_domains = []
             
-            # Enhanced domain checking
-            is_available = False
-            if config.get('enable_real_checking', False):
-                is_available = domain_checker.check_domain_availability(domain)
-            else:
-                # Simulation mode
-                is_available = random.random() < 0.08  # 8% success rate
+            for offset, word in enumerate(batch_words):
+                if not st.session_state.get('hunting_active', False):
+                    break
+                
+                i = batch_start + offset
+                
+                # Update progress
+                progress = (i + 1) / total_words
+                progress_bar.progress(progress)
+                
+                # Check each extension
+                for ext in config['extensions']:
+                    domain = f"{word}{ext}"
+                    current_domain_placeholder.text(f"🔍 Checking: {domain}")
+                    
+                    # Speed calculation
+                    elapsed = time.time() - start_time
+                    speed = (i + 1) / elapsed if elapsed > 0 else 0
+                    speed_placeholder.text(f"⚡ Speed: {speed:.1f} domains/sec")
+                    
+                    # Enhanced domain checking
+                    is_available = False
+                    if config.get('enable_real_checking', False):
+                        is_available = domain_checker.check_domain_availability(domain)
+                    else:
+                        # Simulation mode
+                        is_available = derive_rng(seed, 'available', domain).random() < 0.08  # 8% success rate
+                    
+                    if is_available:
+                        available_domains.append((word, ext, domain))
+                    
+                    time.sleep(0.05)  # Realistic delay
+                
+                st.session_state.hunt_checked = i + 1
+                
+                # Slow hunts still save within the interval
+                flush_saves()
+            
+            # Mark premium names for the whole batch before the price filter
+            premium_checks = {}
+            if available_domains and config.get('enable_price_analysis', False):
+                premium_checks = price_scraper.check_premiums([domain for _, _, domain in available_domains])
             
-            if is_available:
+            # Fetch search interest for the batch in full payloads
+            if trend_analyzer.trends_backend and available_domains:
+                trend_analyzer.prefetch_trends(
+                    [word for word in dict.fromkeys(word for word, _, _ in available_domains) if word not in keyword_features],
+                    min_score=config['min_trend_score']
+                )
+            
+            for word, ext, domain in available_domains:
+                features = keyword_features.get(word)
+                if features is None:
+                    features = trend_analyzer.get_keyword_features(
+                        word,
+                        include_trend=config.get('enable_trend_analysis', False),
+                        min_trend_score=config['min_trend_score']
+                    )
+                    keyword_features[word] = features
+                
+                # Calculate trend score; None once the keyword cannot reach the minimum
+                if config.get('enable_trend_analysis', False):
+                    trend_score = features['trend_score']
+                else:
+                    trend_score = derive_rng(seed, 'trend', word).randint(config['min_trend_score'], 100)
+                
+                # Skip the price lookup for keywords already below the trend threshold
+                if trend_score is None or trend_score < config['min_trend_score']:
+                    continue
+                
                 # Get price
+                is_premium = False
                 if config.get('enable_price_analysis', False):
-                    price_data = price_scraper.get_domain_price(domain)
+                    price_data = price_scraper.get_domain_price(domain, premium_checks.get(domain))
                     price = price_data['price']
+                    is_premium = price_data.get('premium', False)
                 else:
-                    price = random.uniform(10, config['max_price'])
-                
-                # Calculate trend score
-                if config.get('enable_trend_analysis', False):
-                    trend_score = trend_analyzer.calculate_trend_score(word)
-                else:
-                    trend_score = random.randint(config['min_trend_score'], 100)
+                    price = derive_rng(seed, 'price', domain).uniform(10, config['max_price'])
                 
                 # Only include if meets criteria
-                if price <= config['max_price'] and trend_score >= config['min_trend_score']:
+                if price <= config['max_price']:
                     # Estimate market value
-                    market_value = trend_analyzer.get_market_value_estimate(domain, trend_score)
+                    market_value = trend_analyzer.get_market_value_estimate(domain, trend_score, features)
                     
                     domain_result = {
                         'domain': domain,
                         'extension': ext,
                         'price': round(price, 2),
+                        'premium': is_premium,
                         'trend_score': trend_score,
                         'market_value': market_value,
                         'keyword': word,
                         'found_at': datetime.now().isoformat(),
                         'roi_potential': round((market_value / price) * 100, 1) if price > 0 else 0,
-                        'brandability_score': trend_analyzer.calculate_brandability_score(word)
+                        'brandability_score': features['brandability_score']
                     }
                     
                     found_domains.append(domain_result)
@@ -1154,7 +680,8 @@ def display_live_enhanced_hunt():
                     
                     # Save to database if enabled
                     if config.get('save_results', False):
-                        db.save_domain(domain_result)
+                        pending_saves.append(domain_result)
+                        flush_saves()
                     
                     # Display real-time result
                     with results_container:
@@ -1166,14 +693,18 @@ def display_live_enhanced_hunt():
                         </div>
                         """, unsafe_allow_html=True)
             
-            time.sleep(0.05)  # Realistic delay
+            # Update average price
+            if found_domains:
+                avg_price = sum(d['price'] for d in found_domains) / len(found_domains)
+                st.session_state.hunt_avg_price = avg_price
         
-        st.session_state.hunt_checked = i + 1
+    finally:
+        # Save whatever is still pending
+        flush_saves(force=True)
         
-        # Update average price
-        if found_domains:
-            avg_price = sum(d['price'] for d in found_domains) / len(found_domains)
-            st.session_state.hunt_avg_price = avg_price
+        # Keep fetched search interest for later hunts
+        if trend_analyzer.trends_backend:
+            trend_analyzer.trends_backend.save_cache()
     
     # Hunt completed
     st.session_state.hunting_active = False
@@ -1349,32 +880,35 @@ def display_database_tab(db):
     
     with col1:
         if st.button("📥 Export All Data", use_container_width=True):
-            all_domains = db.get_domains()
-            if all_domains:
-                df = pd.DataFrame(all_domains)
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    "Download Database Export",
-                    csv,
-                    f"domain_database_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    "text/csv"
-                )
+            # Streamed to disk in chunks rather than built in memory
+            export_path = db.data_dir / "exports" / f"domain_database_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            export_size = db.export_to_file(export_path, format='csv')
+            if export_size:
+                # Only the newest few exports are kept on disk
+                data_transfer.prune_exports(export_path.parent, keep=MAX_KEPT_EXPORTS)
+                
+                # The download button holds its data in memory, so large exports stay on disk only
+                if export_size <= MAX_DOWNLOAD_BYTES:
+                    with open(export_path, 'rb') as f:
+                        st.download_button(
+                            "Download Database Export",
+                            f.read(),
+                            export_path.name,
+                            "text/csv"
+                        )
+                else:
+                    st.info(f"Export is {export_size / 1024 / 1024:.0f} MB, too large to download here; copy it from the path below")
+                st.caption(f"Saved to {export_path}")
             else:
+                export_path.unlink(missing_ok=True)
                 st.warning("No data to export")
     
     with col2:
         if st.button("🗑️ Clear Database", use_container_width=True):
             if st.session_state.get('confirm_clear', False):
-                # Clear database files
-                try:
-                    with open(db.domains_file, 'w') as f:
-                        json.dump({"domains": []}, f)
-                    with open(db.searches_file, 'w') as f:
-                        json.dump({"searches": []}, f)
+                if db.clear():
                     st.success("Database cleared!")
                     st.session_state.confirm_clear = False
-                except Exception as e:
-                    st.error(f"Error clearing database: {e}")
             else:
                 st.session_state.confirm_clear = True
                 st.warning("Click again to confirm database clearing")
@@ -0,0 +1,67 @@
+"""Per-page parse time of the price extraction tiers on saved registrar pages.
+
+Run from the repository root:
+
+    python benchmarks/bench_price_extraction.py [iterations]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.price_extraction import RegexPriceExtractor, SoupPriceExtractor, PriceExtractor
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# Same selectors EnhancedPriceScraper.search_pages uses for each registrar
+REGISTRAR_SELECTORS = {
+    'namecheap': ['.price', '.domain-price', '[data-cy="price"]', '.registration-price'],
+    'godaddy': ['[data-cy="price-display"]', '.price-display', '.domain-price', '.price'],
+    'namesilo': ['.domain_price', '.price', '.registration-price']
+}
+
+# Edge-case pages checked with a registrar's selectors: {fixture: registrar}
+EXTRA_FIXTURES = {
+    'nested_price': 'namecheap'  # Price element wrapping a badge of the same tag
+}
+
+def time_extractor(extractor, content, iterations):
+    """Return (price, milliseconds per page)"""
+    price = extractor.extract(content)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        extractor.extract(content)
+    elapsed = time.perf_counter() - start
+    return price, elapsed / iterations * 1000
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    print(f"{'page':<12}{'size KB':>9}{'regex ms':>11}{'soup ms':>11}{'tiered ms':>11}{'speedup':>9}  price")
+
+    fixtures = {registrar: registrar for registrar in REGISTRAR_SELECTORS}
+    fixtures.update(EXTRA_FIXTURES)
+
+    for name, registrar in fixtures.items():
+        selectors = REGISTRAR_SELECTORS[registrar]
+        fixture = FIXTURES_DIR / f"{name}.html"
+        content = fixture.read_bytes()
+
+        regex_price, regex_ms = time_extractor(RegexPriceExtractor(selectors), content, iterations)
+        soup_price, soup_ms = time_extractor(SoupPriceExtractor(selectors), content, iterations)
+        tiered_price, tiered_ms = time_extractor(PriceExtractor(selectors), content, iterations)
+
+        # Fast tier must agree with the full parse on every fixture, or defer to it
+        if tiered_price != soup_price or regex_price not in (None, soup_price):
+            status = f"MISMATCH regex={regex_price} soup={soup_price}"
+        else:
+            status = "ok" if regex_price is not None else "ok (deferred to soup)"
+
+        print(
+            f"{name:<12}{len(content) / 1024:>9.1f}{regex_ms:>11.3f}{soup_ms:>11.3f}"
+            f"{tiered_ms:>11.3f}{soup_ms / regex_ms:>8.1f}x  {soup_price} {status}"
+        )
+
+if __name__ == "__main__":
+    main()
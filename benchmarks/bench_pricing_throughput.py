@@ -0,0 +1,57 @@
+"""Offline load test of the pricing subsystem against the mock registrar server.
+
+Run from the repository root:
+
+    python benchmarks/bench_pricing_throughput.py [domains] [latency]
+"""
+import sys
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.mock_registrar import MockRegistrarServer
+from modules.price_scraper import EnhancedPriceScraper
+
+async def run(domain_count, latency):
+    server = MockRegistrarServer(latency=latency)
+    base_urls = await server.start()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        scraper = EnhancedPriceScraper(data_dir=data_dir, registrar_urls=base_urls)
+
+        # Local server: lift the politeness limits so the pipeline itself is measured
+        for plugin in scraper.registrars.values():
+            plugin.set_rate_limit(None)
+            plugin.max_concurrency = 50
+
+        # Keep the catalog from refreshing against the mock in the background
+        scraper.price_catalog.refreshed_at = time.time()
+
+        # Premium candidates always take the per-domain path
+        domains = [f"ai{i}.com" for i in range(domain_count)]
+
+        for label in ('cold', 'revalidate'):
+            start = time.perf_counter()
+            results = await scraper.get_prices_async(domains)
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{label:<11} {len(results)} domains in {elapsed:.2f}s "
+                f"({len(results) / elapsed:.0f} domains/s)"
+            )
+
+        print(f"requests    {server.request_counts}")
+        print(f"http cache  {scraper.get_cache_stats()}")
+
+    await server.stop()
+
+def main():
+    domain_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.0
+    asyncio.run(run(domain_count, latency))
+
+if __name__ == "__main__":
+    main()
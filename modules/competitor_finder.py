@@ -0,0 +1,127 @@
+import socket
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from modules.score_cache import ScoreCache, MISSING
+
+# Variant parts competitors typically register around a keyword
+COMPETITOR_PREFIXES = ['get', 'my', 'the', 'pro', 'best']
+COMPETITOR_SUFFIXES = ['app', 'hub', 'pro', 'ly', 'io']
+COMPETITOR_EXTENSIONS = ['com', 'net', 'org', 'io', 'co']
+
+class SystemResolver:
+    """Async DNS through the system resolver on a dedicated thread pool"""
+
+    def __init__(self, max_workers=64, timeout=3.0):
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    async def resolve(self, domain):
+        """True if the domain resolves, False if it does not, None if uncertain"""
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.wait_for(
+                loop.run_in_executor(self.executor, socket.getaddrinfo, domain, None),
+                self.timeout
+            )
+            return True
+        except socket.gaierror:
+            return False
+        except Exception:
+            return None
+
+class StandInResolver:
+    """Local stand-in resolver: a fixed set of live domains, or a stable hash-based share"""
+
+    def __init__(self, live_domains=None, live_ratio=0.3, latency=0.0):
+        self.live_domains = set(live_domains) if live_domains is not None else None
+        self.live_ratio = live_ratio
+        self.latency = latency  # Seconds added to every lookup
+        self.queries = 0
+
+    async def resolve(self, domain):
+        """Deterministic liveness for a domain"""
+        self.queries += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self.live_domains is not None:
+            return domain in self.live_domains
+        digest = hashlib.md5(domain.encode('utf-8')).digest()
+        return digest[0] / 256 < self.live_ratio
+
+class CompetitorFinder:
+    """Discovers registered prefix/suffix variants of keywords, cached per keyword"""
+
+    def __init__(self, resolver=None, cache_file="data/competitor_cache.json", ttl=7 * 86400,
+                 max_concurrency=200, prefixes=None, suffixes=None, extensions=None):
+        self.resolver = resolver or SystemResolver()
+        self.cache = ScoreCache(max_size=50000, ttl=ttl, cache_file=cache_file)
+        self.max_concurrency = max_concurrency
+
+        self.prefixes = prefixes or COMPETITOR_PREFIXES
+        self.suffixes = suffixes or COMPETITOR_SUFFIXES
+        self.extensions = extensions or COMPETITOR_EXTENSIONS
+
+    def expand_variants(self, keyword):
+        """Every prefix x keyword x suffix x extension variant, excluding the bare keyword"""
+        keyword = keyword.lower()
+        variants = []
+        for prefix in [''] + self.prefixes:
+            for suffix in [''] + self.suffixes:
+                if not prefix and not suffix:
+                    continue
+                for extension in self.extensions:
+                    variants.append({
+                        'domain': f"{prefix}{keyword}{suffix}.{extension}",
+                        'prefix': prefix,
+                        'suffix': suffix,
+                        'extension': extension
+                    })
+        return variants
+
+    async def discover_async(self, keywords):
+        """Live variants per keyword: {keyword: [variant, ...]}; all lookups run concurrently"""
+        results = {}
+        pending = {}
+        for keyword in dict.fromkeys(keyword.lower() for keyword in keywords):
+            cached = self.cache.get(keyword, MISSING)
+            if cached is not MISSING:
+                results[keyword] = cached
+            else:
+                pending[keyword] = self.expand_variants(keyword)
+
+        # Variants shared between keywords are resolved once
+        domains = list(dict.fromkeys(variant['domain'] for variants in pending.values() for variant in variants))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def limited(domain):
+            async with semaphore:
+                try:
+                    return await self.resolver.resolve(domain)
+                except Exception:
+                    return None
+
+        resolved = dict(zip(domains, await asyncio.gather(*[limited(domain) for domain in domains])))
+
+        for keyword, variants in pending.items():
+            live = [dict(variant, live=True) for variant in variants if resolved.get(variant['domain'])]
+            results[keyword] = live
+
+            # Don't cache keywords whose lookups were uncertain
+            if all(resolved.get(variant['domain']) is not None for variant in variants):
+                self.cache.set(keyword, live)
+
+        return results
+
+    def discover(self, keywords):
+        """Sync wrapper around discover_async"""
+        return asyncio.run(self.discover_async(keywords))
+
+    def get_stats(self):
+        """Cache statistics"""
+        return self.cache.get_stats()
+
+    def save_cache(self):
+        """Persist discovered competitors"""
+        return self.cache.save()
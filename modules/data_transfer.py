@@ -0,0 +1,140 @@
+import io
+import csv
+import json
+import math
+import os
+from pathlib import Path
+
+CHUNK_SIZE = 1000  # Records per yielded chunk and per import commit
+
+# Domain fields CSV turns into text that imports convert back; '*_score' fields are numeric too.
+# Everything else stays a string, so keywords like '007' or 'nan' survive a round trip.
+NUMERIC_FIELDS = {'id', 'price', 'market_value', 'roi_potential'}
+BOOLEAN_FIELDS = {'premium'}
+
+def iter_chunks(records, chunk_size=CHUNK_SIZE):
+    """Lists of up to chunk_size records"""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_export(db, format='jsonl', chunk_size=CHUNK_SIZE):
+    """Stream a database as text chunks: JSON Lines of domains and searches, or CSV of domains"""
+    if format == 'jsonl':
+        # One record per line, tagged so imports can tell domains from searches
+        for record_type, records in [('domain', db.iter_domain_records()), ('search', db.iter_search_records())]:
+            for chunk in iter_chunks(records, chunk_size):
+                yield ''.join(
+                    json.dumps(dict(record, record_type=record_type), ensure_ascii=False, default=str) + '\n'
+                    for record in chunk
+                )
+
+    elif format == 'csv':
+        # Columns are the union of every domain's keys, gathered in a first streaming pass
+        fieldnames = {}
+        for record in db.iter_domain_records():
+            fieldnames.update(dict.fromkeys(record))
+        if not fieldnames:
+            return
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(fieldnames), restval='', extrasaction='ignore')
+        writer.writeheader()
+        for chunk in iter_chunks(db.iter_domain_records(), chunk_size):
+            writer.writerows(chunk)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    else:
+        raise ValueError(f"Unsupported export format: {format}")
+
+def export_to_file(db, path, format='jsonl', chunk_size=CHUNK_SIZE):
+    """Write a streamed export to path via a temp file; returns the bytes written"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+
+    with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+        for chunk in iter_export(db, format, chunk_size):
+            f.write(chunk)
+
+    os.replace(temp_path, path)
+    return path.stat().st_size
+
+def is_numeric_field(field):
+    """True for domain fields stored as numbers"""
+    return field in NUMERIC_FIELDS or field.endswith('_score')
+
+def prune_exports(directory, keep=3, pattern="*.csv"):
+    """Delete all but the newest `keep` export files in directory; returns the number deleted"""
+    files = sorted(Path(directory).glob(pattern), key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in files[keep:]:
+        path.unlink(missing_ok=True)
+    return len(files[keep:])
+
+def parse_csv_value(field, value):
+    """Undo CSV's stringification of a known numeric or boolean field; other values stay strings"""
+    if value == '':
+        return None
+    if field in BOOLEAN_FIELDS and value in ('True', 'False'):
+        return value == 'True'
+    if is_numeric_field(field):
+        for convert in (int, float):
+            try:
+                number = convert(value)
+            except ValueError:
+                continue
+            if math.isfinite(number):
+                return number
+    return value
+
+def iter_import_records(lines, format='jsonl'):
+    """(record_type, record) pairs parsed one line at a time from a file or any iterable of lines"""
+    if format == 'jsonl':
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            yield record.pop('record_type', 'domain'), record
+
+    elif format == 'csv':
+        for row in csv.DictReader(lines):
+            record = {key: parse_csv_value(key, value) for key, value in row.items() if key}
+            yield 'domain', {key: value for key, value in record.items() if value is not None}
+
+    else:
+        raise ValueError(f"Unsupported import format: {format}")
+
+def import_records(db, lines, format='jsonl', batch_size=CHUNK_SIZE):
+    """Import records in batches of batch_size; returns {'domains': n, 'searches': n}"""
+    batches = {'domain': [], 'search': []}
+    savers = {
+        'domain': lambda records: db.save_domains(records, preserve_timestamps=True),
+        'search': lambda records: db.save_searches(records, preserve_timestamps=True)
+    }
+    counts = {'domain': 0, 'search': 0}
+
+    for record_type, record in iter_import_records(lines, format):
+        if record_type not in batches:
+            continue
+        batches[record_type].append(record)
+        if len(batches[record_type]) >= batch_size:
+            savers[record_type](batches[record_type])
+            counts[record_type] += len(batches[record_type])
+            batches[record_type] = []
+
+    for record_type, records in batches.items():
+        if records:
+            savers[record_type](records)
+            counts[record_type] += len(records)
+
+    return {'domains': counts['domain'], 'searches': counts['search']}
@@ -1,14 +1,147 @@
+import io
 import json
 import os
+import atexit
+import shutil
+import threading
 from pathlib import Path
-from datetime import datetime
-import pandas as pd
+from datetime import datetime, timedelta
 import streamlit as st
+from modules.sqlite_db import SQLiteDB
+from modules.segment_log import PartitionedLog
+from modules.file_lock import FileLock, atomic_write
+from modules import data_transfer
+
+ANALYTICS_COUNTERS = ['total_searches', 'total_domains_found', 'total_domains_checked']
+
+class DatabaseError(Exception):
+    """A database file is missing or unreadable"""
+
+def create_database(data_dir="data"):
+    """Open the storage backend chosen by settings.storage_backend in config.json"""
+    backend = 'json'
+    try:
+        with open(Path(data_dir) / "config.json", 'r', encoding='utf-8') as f:
+            backend = json.load(f).get('settings', {}).get('storage_backend', 'json')
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    
+    if backend == 'sqlite':
+        return SQLiteDB(data_dir)
+    return EnhancedFileDB(data_dir)
+
+def domain_matches(domain, filters):
+    """Check a domain record against get_domains filters"""
+    # Price filter
+    if 'max_price' in filters and domain.get('price', 0) > filters['max_price']:
+        return False
+    
+    # Extension filter
+    if 'extension' in filters and domain.get('extension') != filters['extension']:
+        return False
+    
+    # Trend score filter
+    if 'min_trend_score' in filters and domain.get('trend_score', 0) < filters['min_trend_score']:
+        return False
+    
+    # Date filter
+    if 'date_from' in filters:
+        domain_date = datetime.fromisoformat(domain.get('saved_at', ''))
+        filter_date = datetime.fromisoformat(filters['date_from'])
+        if domain_date < filter_date:
+            return False
+    
+    return True
+
+def price_range(price):
+    """Price range bucket of a domain"""
+    if price < 20:
+        return 'under_20'
+    elif price < 50:
+        return '20_to_50'
+    elif price < 100:
+        return '50_to_100'
+    return 'over_100'
+
+def trend_score_range(score):
+    """Trend score range bucket of a domain"""
+    if score < 40:
+        return 'low_0_40'
+    elif score < 70:
+        return 'medium_40_70'
+    elif score < 90:
+        return 'high_70_90'
+    return 'excellent_90_100'
+
+def empty_aggregates():
+    """Running totals behind get_analytics"""
+    return {
+        'count': 0,
+        'price_count': 0,
+        'price_sum': 0.0,
+        'min_price': None,
+        'max_price': None,
+        'trend_count': 0,
+        'trend_sum': 0.0,
+        'extensions': {},
+        'price_ranges': {'under_20': 0, '20_to_50': 0, '50_to_100': 0, 'over_100': 0},
+        'trend_score_ranges': {'low_0_40': 0, 'medium_40_70': 0, 'high_70_90': 0, 'excellent_90_100': 0}
+    }
+
+def update_aggregates(aggregates, domains):
+    """Add domains to the running totals"""
+    for domain in domains:
+        price = domain.get('price', 0) or 0
+        score = domain.get('trend_score', 0) or 0
+        ext = domain.get('extension', 'unknown')
+        
+        aggregates['count'] += 1
+        aggregates['extensions'][ext] = aggregates['extensions'].get(ext, 0) + 1
+        aggregates['price_ranges'][price_range(price)] += 1
+        aggregates['trend_score_ranges'][trend_score_range(score)] += 1
+        
+        # Averages and bounds only count domains with a price or trend score, as before
+        if price:
+            aggregates['price_count'] += 1
+            aggregates['price_sum'] += price
+            aggregates['min_price'] = price if aggregates['min_price'] is None else min(aggregates['min_price'], price)
+            aggregates['max_price'] = price if aggregates['max_price'] is None else max(aggregates['max_price'], price)
+        
+        if score:
+            aggregates['trend_count'] += 1
+            aggregates['trend_sum'] += score
+    
+    return aggregates
+
+def merge_aggregates(target, delta):
+    """Fold running totals from delta into target"""
+    for key in ['count', 'price_count', 'price_sum', 'trend_count', 'trend_sum']:
+        target[key] += delta[key]
+    for bound, pick in [('min_price', min), ('max_price', max)]:
+        values = [value for value in (target[bound], delta[bound]) if value is not None]
+        target[bound] = pick(values) if values else None
+    
+    for key in ['extensions', 'price_ranges', 'trend_score_ranges']:
+        for bucket, count in delta[key].items():
+            target[key][bucket] = target[key].get(bucket, 0) + count
+    
+    return target
+
+def total_aggregates(partition_aggregates):
+    """Running totals of all partitions together"""
+    total = empty_aggregates()
+    for aggregates in partition_aggregates.values():
+        merge_aggregates(total, aggregates)
+    return total
+
+def empty_delta():
+    """Analytics changes not yet written to analytics.json; aggregates are kept per domain partition"""
+    return dict({key: 0 for key in ANALYTICS_COUNTERS}, aggregates={})
 
 class EnhancedFileDB:
     """File-based database system (SQLite3 alternative)"""
     
-    def __init__(self, data_dir="data"):
+    def __init__(self, data_dir="data", flush_interval=2.0, flush_size=500):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         
@@ -18,14 +151,38 @@ class EnhancedFileDB:
         self.analytics_file = self.data_dir / "analytics.json"
         self.config_file = self.data_dir / "config.json"
         
+        # Domains and searches are append-only segment logs, partitioned by month so retention
+        # drops whole months and date-filtered reads skip them
+        self.domains_log = PartitionedLog(self.data_dir / "domains", 'saved_at')
+        self.searches_log = PartitionedLog(self.data_dir / "searches", 'timestamp')
+        
+        self.logs = {'domains': self.domains_log, 'searches': self.searches_log}
+        
+        # Write-behind cache: parsed records stay in memory and writes reach disk in batches
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._records = {'domains': None, 'searches': None}
+        self._pending = {'domains': [], 'searches': []}
+        self._analytics = None
+        self._analytics_version = None
+        self._delta = empty_delta()
+        self._lock = threading.RLock()
+        self._timer = None
+        
+        # Every process sharing data_dir takes this lock to flush, migrate or repair
+        self.file_lock = FileLock(self.data_dir / ".lock")
+        
         # Initialize files
         self.init_files()
+        with self.file_lock:
+            self.migrate_json_files()
+        
+        # Pending writes still reach disk at shutdown
+        atexit.register(self.flush)
     
     def init_files(self):
         """Initialize JSON files if they don't exist"""
         default_data = {
-            self.domains_file: {"domains": [], "last_updated": datetime.now().isoformat()},
-            self.searches_file: {"searches": [], "last_updated": datetime.now().isoformat()},
             self.analytics_file: {
                 "total_searches": 0,
                 "total_domains_found": 0,
@@ -38,7 +195,8 @@ class EnhancedFileDB:
                 "settings": {
                     "auto_save": True,
                     "max_results": 10000,
-                    "cache_duration": 3600
+                    "cache_duration": 3600,
+                    "storage_backend": "json"
                 }
             }
         }
@@ -47,26 +205,44 @@ class EnhancedFileDB:
             if not file_path.exists():
                 self.write_json_file(file_path, data)
     
+    def migrate_json_files(self):
+        """Move records from the old whole-file domains.json/searches.json into the logs, once"""
+        for file_path, key, log in [
+            (self.domains_file, 'domains', self.domains_log),
+            (self.searches_file, 'searches', self.searches_log)
+        ]:
+            if not file_path.exists():
+                continue
+            
+            if not len(log):
+                records = self.read_json_file(file_path).get(key, [])
+                for record, record_id in zip(records, log.reserve_ids(len(records))):
+                    record['id'] = record_id
+                if records:
+                    log.append_many(records)
+            
+            file_path.rename(file_path.with_suffix('.json.migrated'))
+    
     def read_json_file(self, file_path):
-        """Safely read JSON file"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            st.error(f"Error reading {file_path}: {e}")
-            return {}
+        """Read a JSON file, falling back to its backup; raises DatabaseError rather than returning {}"""
+        errors = []
+        for path in [file_path, file_path.with_suffix('.json.backup')]:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                errors.append(f"{path}: {e}")
+        
+        raise DatabaseError(f"Cannot read {file_path} ({'; '.join(errors)})")
     
     def write_json_file(self, file_path, data):
-        """Safely write JSON file"""
+        """Safely write JSON file: backup copy, then an atomic rename of a complete temp file"""
         try:
             # Create backup before writing
             if file_path.exists():
-                backup_path = file_path.with_suffix('.json.backup')
-                file_path.rename(backup_path)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+                shutil.copyfile(file_path, file_path.with_suffix('.json.backup'))
             
+            atomic_write(file_path, json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8'))
             return True
         except Exception as e:
             st.error(f"Error writing {file_path}: {e}")
@@ -74,164 +250,316 @@ class EnhancedFileDB:
     
     def save_domain(self, domain_data):
         """Save domain to database"""
+        return self.save_domains([domain_data])
+    
+    def save_domains(self, domains, preserve_timestamps=False):
+        """Save a batch of domains with one append and one analytics update"""
         try:
-            data = self.read_json_file(self.domains_file)
-            
-            # Add metadata
-            domain_data['id'] = len(data.get('domains', [])) + 1
-            domain_data['saved_at'] = datetime.now().isoformat()
-            
-            # Add to domains list
-            if 'domains' not in data:
-                data['domains'] = []
-            
-            data['domains'].append(domain_data)
-            data['last_updated'] = datetime.now().isoformat()
+            if not domains:
+                return True
             
-            # Write back to file
-            success = self.write_json_file(self.domains_file, data)
+            # Add metadata; ids are reserved across every process sharing the data directory
+            saved_at = datetime.now().isoformat()
+            for domain_data, record_id in zip(domains, self.domains_log.reserve_ids(len(domains))):
+                domain_data['id'] = record_id
+                if not (preserve_timestamps and domain_data.get('saved_at')):
+                    domain_data['saved_at'] = saved_at
             
-            if success:
-                # Update analytics
-                self.update_analytics('domain_added')
+            # One buffered append, whatever the database size
+            with self._lock:
+                self.queue_records('domains', domains)
+                for domain in domains:
+                    key = self.domains_log.partition_key(domain)
+                    update_aggregates(self._delta['aggregates'].setdefault(key, empty_aggregates()), [domain])
             
-            return success
+            # Update analytics
+            return self.update_analytics('domain_added', count=len(domains))
             
         except Exception as e:
-            st.error(f"Error saving domain: {e}")
+            st.error(f"Error saving domains: {e}")
             return False
     
     def get_domains(self, limit=None, filters=None):
         """Get domains with optional filtering"""
         try:
-            data = self.read_json_file(self.domains_file)
-            domains = data.get('domains', [])
-            
-            # Apply filters if provided
-            if filters:
-                filtered_domains = []
-                for domain in domains:
-                    # Price filter
-                    if 'max_price' in filters and domain.get('price', 0) > filters['max_price']:
-                        continue
-                    
-                    # Extension filter
-                    if 'extension' in filters and domain.get('extension') != filters['extension']:
-                        continue
-                    
-                    # Trend score filter
-                    if 'min_trend_score' in filters and domain.get('trend_score', 0) < filters['min_trend_score']:
-                        continue
-                    
-                    # Date filter
-                    if 'date_from' in filters:
-                        domain_date = datetime.fromisoformat(domain.get('saved_at', ''))
-                        filter_date = datetime.fromisoformat(filters['date_from'])
-                        if domain_date < filter_date:
-                            continue
-                    
-                    filtered_domains.append(domain)
-                
-                domains = filtered_domains
-            
-            # Apply limit
-            if limit:
-                domains = domains[-limit:]  # Get most recent
-            
+            if not filters and limit and self._records['domains'] is None:
+                # Cold cache: read just the tail through the offset index
+                return self.recent_records('domains', limit)
+            
+            if filters and 'date_from' in filters and self._records['domains'] is None:
+                # Cold cache: read only the partitions that reach date_from
+                domains = self.domains_since(datetime.fromisoformat(filters['date_from']), filters)
+                return domains[-limit:] if limit else domains
+            
+            records = self.cached_records('domains')
+            
+            if not filters:
+                return records[-limit:] if limit else list(records)
+            
+            if not limit:
+                return [domain for domain in records if domain_matches(domain, filters)]
+            
+            # Scan newest first and stop at the limit
+            domains = []
+            for domain in reversed(records):
+                if domain_matches(domain, filters):
+                    domains.append(domain)
+                    if len(domains) == limit:
+                        break
+            domains.reverse()
             return domains
             
         except Exception as e:
             st.error(f"Error getting domains: {e}")
             return []
     
+    def domains_since(self, since, filters):
+        """Matching domains from partitions that end after `since`, without loading the cache"""
+        with self._lock:
+            self.refresh_log('domains')
+            domains = [domain for domain in self.domains_log.iter_records(since=since) if domain_matches(domain, filters)]
+            return domains + [domain for domain in self._pending['domains'] if domain_matches(domain, filters)]
+    
     def save_search(self, search_data):
         """Save search history"""
+        return self.save_searches([search_data])
+    
+    def save_searches(self, searches, preserve_timestamps=False):
+        """Save a batch of searches with one append and one analytics update"""
         try:
-            data = self.read_json_file(self.searches_file)
+            if not searches:
+                return True
             
             # Add metadata
-            search_data['id'] = len(data.get('searches', [])) + 1
-            search_data['timestamp'] = datetime.now().isoformat()
-            
-            # Add to searches list
-            if 'searches' not in data:
-                data['searches'] = []
-            
-            data['searches'].append(search_data)
-            data['last_updated'] = datetime.now().isoformat()
-            
-            # Write back to file
-            success = self.write_json_file(self.searches_file, data)
+            timestamp = datetime.now().isoformat()
+            for search_data, record_id in zip(searches, self.searches_log.reserve_ids(len(searches))):
+                search_data['id'] = record_id
+                if not (preserve_timestamps and search_data.get('timestamp')):
+                    search_data['timestamp'] = timestamp
             
-            if success:
-                # Update analytics
-                self.update_analytics('search_completed', search_data)
+            self.queue_records('searches', searches)
             
-            return success
+            # Update analytics
+            domains_checked = sum(search.get('domains_checked', 0) for search in searches)
+            return self.update_analytics('search_completed', {'domains_checked': domains_checked}, count=len(searches))
             
         except Exception as e:
-            st.error(f"Error saving search: {e}")
+            st.error(f"Error saving searches: {e}")
             return False
     
     def get_searches(self, limit=None):
         """Get search history"""
         try:
-            data = self.read_json_file(self.searches_file)
-            searches = data.get('searches', [])
+            if limit and self._records['searches'] is None:
+                return self.recent_records('searches', limit)
             
-            if limit:
-                searches = searches[-limit:]
-            
-            return searches
+            records = self.cached_records('searches')
+            return records[-limit:] if limit else list(records)
             
         except Exception as e:
             st.error(f"Error getting searches: {e}")
             return []
     
-    def update_analytics(self, event_type, event_data=None):
-        """Update analytics data"""
-        try:
+    def refresh_log(self, name):
+        """Pick up records other processes appended to a log"""
+        with self._lock:
+            changes = self.logs[name].take_changes()
+            records = self._records[name]
+            if records is None or not changes:
+                if changes is None:
+                    self._records[name] = None
+                return
+            
+            # Plain appends join the cache ahead of our own pending records; anything else re-reads it
+            if any(record.get('_deleted') for record in changes):
+                self._records[name] = None
+            else:
+                position = len(records) - len(self._pending[name])
+                records[position:position] = changes
+    
+    def cached_records(self, name):
+        """Parsed records of a log, re-read only when another writer rewrote it"""
+        with self._lock:
+            self.refresh_log(name)
+            if self._records[name] is None:
+                self._records[name] = list(self.logs[name].iter_records()) + self._pending[name]
+            return self._records[name]
+    
+    def recent_records(self, name, limit):
+        """The last `limit` records without loading the whole log"""
+        with self._lock:
+            self.refresh_log(name)
+            pending = self._pending[name][-limit:]
+            older = self.logs[name].tail(limit - len(pending)) if len(pending) < limit else []
+            return older + pending
+    
+    def stale_partitions(self, partition_aggregates):
+        """Domain partitions whose stored totals don't match the log"""
+        if partition_aggregates is None:
+            return set(self.domains_log.partitions) or {None}
+        
+        counts = self.domains_log.partition_counts()
+        return {
+            key for key in set(counts) | set(partition_aggregates)
+            if counts.get(key, 0) != partition_aggregates.get(key, {}).get('count', 0)
+        }
+    
+    def get_aggregates(self):
+        """Running analytics totals, including unflushed saves"""
+        with self._lock:
+            with self.file_lock.shared():
+                self.refresh_log('domains')
+                stored = self.read_analytics().get('partition_aggregates')
+                stale = self.stale_partitions(stored)
+            
+            if stale:
+                stored = self.repair_aggregates()
+            
+            total = total_aggregates(stored)
+            for delta in self._delta['aggregates'].values():
+                merge_aggregates(total, delta)
+            return total
+    
+    def repair_aggregates(self):
+        """Rebuild the stored totals of missing or out-of-step partitions, reading only those"""
+        with self._lock, self.file_lock:
+            self.flush()
+            self.refresh_log('domains')
             data = self.read_json_file(self.analytics_file)
+            partition_aggregates = data.get('partition_aggregates')
+            stale = self.stale_partitions(partition_aggregates)
+            if not stale:
+                return partition_aggregates  # Another process repaired it meanwhile
+            
+            partition_aggregates = partition_aggregates or {}
+            for key in stale:
+                self.rebuild_partition_aggregates(partition_aggregates, key)
+            
+            data.pop('aggregates', None)  # Unpartitioned totals of older versions
+            data['partition_aggregates'] = partition_aggregates
+            self.write_json_file(self.analytics_file, data)
+            self._analytics = None
+            return partition_aggregates
+    
+    def rebuild_partition_aggregates(self, partition_aggregates, key):
+        """Recompute one partition's totals from its records, or forget a partition that is gone"""
+        log = self.domains_log.partitions.get(key)
+        if log is None or not len(log):
+            partition_aggregates.pop(key, None)
+        else:
+            partition_aggregates[key] = update_aggregates(empty_aggregates(), log.iter_records())
+    
+    def queue_records(self, name, records):
+        """Add records to the cache, if loaded, now and to disk with the next flush"""
+        with self._lock:
+            # A cold cache stays cold: cached_records merges _pending whenever it loads
+            self.refresh_log(name)
+            if self._records[name] is not None:
+                self._records[name].extend(records)
+            self._pending[name].extend(records)
+            self.schedule_flush()
+    
+    def schedule_flush(self):
+        """Flush once enough writes are pending, otherwise after the flush interval"""
+        with self._lock:
+            pending = sum(len(records) for records in self._pending.values())
+            if not self.flush_interval or pending >= self.flush_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def flush(self):
+        """Append pending records and merge pending analytics into analytics.json, under the file lock"""
+        try:
+            with self._lock, self.file_lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                
+                for name, records in self._pending.items():
+                    if records:
+                        self.logs[name].append_many(records)
+                        self._pending[name] = []
+                
+                if self._delta != empty_delta():
+                    # Read-modify-write of the latest file, so other processes' updates survive
+                    data = self.read_json_file(self.analytics_file)
+                    for key in ANALYTICS_COUNTERS:
+                        data[key] = data.get(key, 0) + self._delta[key]
+                    if data.get('partition_aggregates') is not None:
+                        for key, delta in self._delta['aggregates'].items():
+                            merge_aggregates(data['partition_aggregates'].setdefault(key, empty_aggregates()), delta)
+                    data['last_updated'] = datetime.now().isoformat()
+                    
+                    if self.write_json_file(self.analytics_file, data):
+                        self._delta = empty_delta()
+                        self._analytics = None
             
-            if event_type == 'domain_added':
-                data['total_domains_found'] = data.get('total_domains_found', 0) + 1
-            
-            elif event_type == 'search_completed':
-                data['total_searches'] = data.get('total_searches', 0) + 1
-                if event_data:
-                    data['total_domains_checked'] = data.get('total_domains_checked', 0) + event_data.get('domains_checked', 0)
-            
-            data['last_updated'] = datetime.now().isoformat()
+            return True
             
-            return self.write_json_file(self.analytics_file, data)
+        except Exception as e:
+            st.error(f"Error flushing database: {e}")
+            return False
+    
+    def read_analytics(self):
+        """analytics.json as last written by any process, re-read when the file changes"""
+        with self._lock:
+            if not self.analytics_file.exists():
+                self.init_files()
+            stat = self.analytics_file.stat()
+            version = (stat.st_mtime_ns, stat.st_ino)
+            
+            if self._analytics is None or version != self._analytics_version:
+                self._analytics = self.read_json_file(self.analytics_file)
+                self._analytics_version = version
+            return self._analytics
+    
+    def update_analytics(self, event_type, event_data=None, count=1):
+        """Update analytics data for `count` events at once"""
+        try:
+            with self._lock:
+                if event_type == 'domain_added':
+                    self._delta['total_domains_found'] += count
+                
+                elif event_type == 'search_completed':
+                    self._delta['total_searches'] += count
+                    if event_data:
+                        self._delta['total_domains_checked'] += event_data.get('domains_checked', 0)
+                
+                self.schedule_flush()
+                return True
             
         except Exception as e:
             st.error(f"Error updating analytics: {e}")
             return False
     
     def get_analytics(self):
-        """Get analytics data"""
+        """Get analytics data from the running totals"""
         try:
-            data = self.read_json_file(self.analytics_file)
-            domains = self.get_domains()
-            
-            # Calculate additional metrics
-            if domains:
-                prices = [d.get('price', 0) for d in domains if d.get('price')]
-                trend_scores = [d.get('trend_score', 0) for d in domains if d.get('trend_score')]
+            with self._lock:
+                aggregates = self.get_aggregates()
+                data = dict(self.read_analytics())
+                for key in ANALYTICS_COUNTERS:
+                    data[key] = data.get(key, 0) + self._delta[key]
+            
+            if aggregates['count']:
+                price_count = aggregates['price_count']
+                trend_count = aggregates['trend_count']
                 
                 analytics = {
-                    'total_domains': len(domains),
+                    'total_domains': aggregates['count'],
                     'total_searches': data.get('total_searches', 0),
                     'total_checked': data.get('total_domains_checked', 0),
-                    'avg_price': sum(prices) / len(prices) if prices else 0,
-                    'avg_trend_score': sum(trend_scores) / len(trend_scores) if trend_scores else 0,
-                    'min_price': min(prices) if prices else 0,
-                    'max_price': max(prices) if prices else 0,
-                    'extensions_distribution': self.get_extensions_distribution(domains),
-                    'recent_domains': domains[-10:] if domains else [],
-                    'price_ranges': self.get_price_ranges(domains),
-                    'trend_score_ranges': self.get_trend_score_ranges(domains)
+                    'avg_price': aggregates['price_sum'] / price_count if price_count else 0,
+                    'avg_trend_score': aggregates['trend_sum'] / trend_count if trend_count else 0,
+                    'min_price': aggregates['min_price'] if price_count else 0,
+                    'max_price': aggregates['max_price'] if price_count else 0,
+                    'extensions_distribution': dict(aggregates['extensions']),
+                    'recent_domains': self.get_domains(limit=10),
+                    'price_ranges': dict(aggregates['price_ranges']),
+                    'trend_score_ranges': dict(aggregates['trend_score_ranges'])
                 }
             else:
                 analytics = {
@@ -272,15 +600,7 @@ class EnhancedFileDB:
         }
         
         for domain in domains:
-            price = domain.get('price', 0)
-            if price < 20:
-                ranges['under_20'] += 1
-            elif price < 50:
-                ranges['20_to_50'] += 1
-            elif price < 100:
-                ranges['50_to_100'] += 1
-            else:
-                ranges['over_100'] += 1
+            ranges[price_range(domain.get('price', 0))] += 1
         
         return ranges
     
@@ -294,21 +614,46 @@ class EnhancedFileDB:
         }
         
         for domain in domains:
-            score = domain.get('trend_score', 0)
-            if score < 40:
-                ranges['low_0_40'] += 1
-            elif score < 70:
-                ranges['medium_40_70'] += 1
-            elif score < 90:
-                ranges['high_70_90'] += 1
-            else:
-                ranges['excellent_90_100'] += 1
+            ranges[trend_score_range(domain.get('trend_score', 0))] += 1
         
         return ranges
     
+    def iter_domain_records(self):
+        """Every domain, streamed from disk segment by segment"""
+        self.flush()
+        return self.domains_log.iter_records()
+    
+    def iter_search_records(self):
+        """Every search, streamed from disk segment by segment"""
+        self.flush()
+        return self.searches_log.iter_records()
+    
+    def iter_export(self, format='jsonl', chunk_size=data_transfer.CHUNK_SIZE):
+        """Stream an export as JSON Lines or CSV text chunks with bounded memory"""
+        return data_transfer.iter_export(self, format, chunk_size)
+    
+    def export_to_file(self, path, format='jsonl'):
+        """Stream an export into a file; returns the bytes written"""
+        try:
+            return data_transfer.export_to_file(self, path, format)
+        except Exception as e:
+            st.error(f"Error exporting data: {e}")
+            return 0
+    
+    def import_stream(self, lines, format='jsonl', batch_size=data_transfer.CHUNK_SIZE):
+        """Import a JSON Lines or CSV file (or any iterable of lines), committing in batches"""
+        try:
+            return data_transfer.import_records(self, lines, format, batch_size)
+        except Exception as e:
+            st.error(f"Error importing data: {e}")
+            return None
+    
     def export_data(self, format='json'):
         """Export all data"""
         try:
+            if format in ('jsonl', 'csv'):
+                return ''.join(self.iter_export(format)) or "No data to export"
+            
             all_data = {
                 'domains': self.get_domains(),
                 'searches': self.get_searches(),
@@ -318,13 +663,6 @@ class EnhancedFileDB:
             
             if format == 'json':
                 return json.dumps(all_data, indent=2, default=str)
-            elif format == 'csv':
-                # Convert domains to CSV
-                if all_data['domains']:
-                    df = pd.DataFrame(all_data['domains'])
-                    return df.to_csv(index=False)
-                else:
-                    return "No data to export"
             
         except Exception as e:
             st.error(f"Error exporting data: {e}")
@@ -333,19 +671,17 @@ class EnhancedFileDB:
     def import_data(self, data, format='json'):
         """Import data from external source"""
         try:
+            if format in ('jsonl', 'csv'):
+                return self.import_stream(io.StringIO(data) if isinstance(data, str) else data, format) is not None
+            
             if format == 'json':
                 imported_data = json.loads(data) if isinstance(data, str) else data
                 
-                # Import domains
-                if 'domains' in imported_data:
-                    for domain in imported_data['domains']:
-                        self.save_domain(domain)
-                
-                # Import searches
-                if 'searches' in imported_data:
-                    search_data = self.read_json_file(self.searches_file)
-                    search_data['searches'].extend(imported_data['searches'])
-                    self.write_json_file(self.searches_file, search_data)
+                # Import domains and searches in batches, keeping their timestamps
+                for chunk in data_transfer.iter_chunks(imported_data.get('domains', [])):
+                    self.save_domains(chunk, preserve_timestamps=True)
+                for chunk in data_transfer.iter_chunks(imported_data.get('searches', [])):
+                    self.save_searches(chunk, preserve_timestamps=True)
                 
                 return True
                 
@@ -358,39 +694,70 @@ class EnhancedFileDB:
         try:
             cutoff_date = datetime.now() - timedelta(days=days_old)
             
-            # Clean domains
-            domains_data = self.read_json_file(self.domains_file)
-            original_count = len(domains_data.get('domains', []))
-            
-            domains_data['domains'] = [
-                domain for domain in domains_data.get('domains', [])
-                if datetime.fromisoformat(domain.get('saved_at', '')) > cutoff_date
-            ]
-            
-            self.write_json_file(self.domains_file, domains_data)
-            
-            # Clean searches
-            searches_data = self.read_json_file(self.searches_file)
-            searches_data['searches'] = [
-                search for search in searches_data.get('searches', [])
-                if datetime.fromisoformat(search.get('timestamp', '')) > cutoff_date
-            ]
-            
-            self.write_json_file(self.searches_file, searches_data)
+            with self._lock, self.file_lock:
+                self.flush()
+                self.repair_aggregates()
+                
+                # Expired months are deleted unread; only the month spanning the cutoff is rewritten
+                removed = self.domains_log.drop_before(
+                    cutoff_date, lambda domain: datetime.fromisoformat(domain['saved_at']) > cutoff_date
+                )
+                self.searches_log.drop_before(
+                    cutoff_date, lambda search: datetime.fromisoformat(search['timestamp']) > cutoff_date
+                )
+                
+                self._records = {name: None for name in self._records}
+                
+                data = self.read_json_file(self.analytics_file)
+                for key in removed:
+                    self.rebuild_partition_aggregates(data['partition_aggregates'], key)
+                self.write_json_file(self.analytics_file, data)
+                self._analytics = None
             
-            cleaned_count = original_count - len(domains_data['domains'])
-            return cleaned_count
+            return sum(removed.values())
             
         except Exception as e:
             st.error(f"Error cleaning up data: {e}")
             return 0
     
+    def clear(self):
+        """Delete all domains and searches"""
+        try:
+            with self._lock, self.file_lock:
+                self._pending = {name: [] for name in self._pending}
+                self._delta['aggregates'] = {}
+                self.domains_log.clear()
+                self.searches_log.clear()
+                self._records = {name: None for name in self._records}
+                
+                data = self.read_json_file(self.analytics_file)
+                data.pop('aggregates', None)
+                data['partition_aggregates'] = {}
+                self.write_json_file(self.analytics_file, data)
+                self._analytics = None
+            return True
+        except Exception as e:
+            st.error(f"Error clearing database: {e}")
+            return False
+    
     def get_database_stats(self):
         """Get database statistics"""
         try:
+            self.flush()
             stats = {}
             
-            for file_path in [self.domains_file, self.searches_file, self.analytics_file]:
+            for name, log in [('domains', self.domains_log), ('searches', self.searches_log)]:
+                file_size = log.size_bytes()
+                stats[name] = {
+                    'size_bytes': file_size,
+                    'size_kb': round(file_size / 1024, 2),
+                    'records': len(log),
+                    'partitions': len(log.partitions),
+                    'segments': log.segment_count(),
+                    'last_modified': datetime.fromtimestamp(log.last_modified()).isoformat()
+                }
+            
+            for file_path in [self.analytics_file]:
                 if file_path.exists():
                     file_size = file_path.stat().st_size
                     stats[file_path.name] = {
@@ -0,0 +1,89 @@
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+class FileLock:
+    """Inter-process lock on a lock file; re-entrant, and exclusive between threads of one process"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._handle = None
+        self._depth = 0
+
+    def acquire(self, shared=False):
+        """Block until the lock is held; nested calls reuse the outer lock"""
+        self._thread_lock.acquire()
+        try:
+            if self._depth == 0:
+                if self._handle is None:
+                    self._handle = open(self.path, 'a+b')
+                if fcntl:
+                    fcntl.flock(self._handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+                else:
+                    # msvcrt has no shared locks; LK_LOCK retries for about 10 seconds before raising
+                    self._handle.seek(0)
+                    while True:
+                        try:
+                            msvcrt.locking(self._handle.fileno(), msvcrt.LK_LOCK, 1)
+                            break
+                        except OSError:
+                            continue
+            self._depth += 1
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        """Release one level of the lock"""
+        try:
+            self._depth -= 1
+            if self._depth == 0:
+                if fcntl:
+                    fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+                else:
+                    self._handle.seek(0)
+                    msvcrt.locking(self._handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def close(self):
+        """Close the lock file handle, e.g. before deleting its directory"""
+        with self._thread_lock:
+            if self._depth == 0 and self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    @contextmanager
+    def shared(self):
+        """Shared lock for readers; inside an exclusive hold it reuses that"""
+        self.acquire(shared=True)
+        try:
+            yield self
+        finally:
+            self.release()
+
+def atomic_write(path, data, durable=True):
+    """Write bytes to a temp file and rename it over path, so readers never see a partial file"""
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temp_path, path)
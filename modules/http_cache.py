@@ -0,0 +1,362 @@
+import gzip
+import json
+import os
+import time
+import hashlib
+import threading
+from pathlib import Path
+from email.utils import parsedate_to_datetime
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Response headers kept with each cached body
+STORED_HEADERS = ['Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date']
+
+def parse_cache_control(value):
+    """Parse a Cache-Control header into a {directive: value} dict"""
+    directives = {}
+    for part in (value or '').split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg = part.partition('=')
+        directives[name.strip().lower()] = arg.strip().strip('"') or True
+    return directives
+
+def vary_names(headers):
+    """Request header names a response's Vary header selects on, lowercased and sorted"""
+    return sorted({name.strip().lower() for name in (headers.get('Vary') or '').split(',') if name.strip()})
+
+class HTTPCache:
+    """On-disk HTTP cache with conditional revalidation, compressed bodies and LRU eviction"""
+
+    def __init__(self, cache_dir="data/http_cache", default_max_age=0, max_entries=10000, max_bytes=256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.default_max_age = default_max_age  # Without Cache-Control, always revalidate
+
+        # Caps on stored bodies (None for no cap); a body's mtime is its last use
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._usage = None  # [entries, compressed bytes], counted on the first store
+
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,            # Served fresh from disk, no request
+            'revalidated': 0,     # 304 Not Modified
+            'misses': 0,          # Full download
+            'bytes_downloaded': 0,
+            'bytes_saved': 0
+        }
+
+    def vary_path(self, url):
+        """Path of the Vary header names last seen for a URL"""
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.vary"
+
+    def load_vary(self, url):
+        """Request header names the URL's responses vary on"""
+        try:
+            with open(self.vary_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def write_vary(self, url, names):
+        """Remember the Vary header names of a URL's latest response"""
+        vary_path = self.vary_path(url)
+        if not names:
+            vary_path.unlink(missing_ok=True)
+            return
+        temp_path = vary_path.with_suffix('.vary.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(names, f)
+        os.replace(temp_path, vary_path)
+
+    def entry_paths(self, url, request_headers=None, vary=None):
+        """Get (metadata, body) paths for a URL and the request headers its Vary selects"""
+        vary = self.load_vary(url) if vary is None else vary
+        key = url
+        if vary:
+            request_headers = CaseInsensitiveDict(request_headers or {})
+            key += ''.join(f"\n{name}: {request_headers.get(name, '')}" for name in vary)
+        key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.gz"
+
+    def load_entry(self, url, request_headers=None):
+        """Load cached metadata for a URL"""
+        meta_path, _ = self.entry_paths(url, request_headers)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def load_body(self, url, request_headers=None):
+        """Load and decompress a cached body, marking it as recently used"""
+        _, body_path = self.entry_paths(url, request_headers)
+        try:
+            with gzip.open(body_path, 'rb') as f:
+                body = f.read()
+            os.utime(body_path)
+            return body
+        except (FileNotFoundError, OSError, EOFError):
+            return None
+
+    def write_entry(self, url, entry, request_headers=None):
+        """Atomically write cached metadata"""
+        meta_path, _ = self.entry_paths(url, request_headers)
+        temp_path = meta_path.with_suffix('.json.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(temp_path, meta_path)
+
+    def drop_entry(self, url, request_headers=None):
+        """Forget a cached response"""
+        for path in self.entry_paths(url, request_headers):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def count_usage(self):
+        """[entries, compressed bytes] of the stored bodies"""
+        usage = [0, 0]
+        for body_path in self.cache_dir.glob("*.gz"):
+            try:
+                usage[1] += body_path.stat().st_size
+                usage[0] += 1
+            except FileNotFoundError:
+                continue
+        return usage
+
+    def over_limit(self, usage):
+        return (
+            (self.max_entries is not None and usage[0] > self.max_entries) or
+            (self.max_bytes is not None and usage[1] > self.max_bytes)
+        )
+
+    def evict(self):
+        """Drop least recently used entries until the cache is back under 90% of its caps"""
+        bodies = []
+        for body_path in self.cache_dir.glob("*.gz"):
+            try:
+                stat = body_path.stat()
+            except FileNotFoundError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, body_path))
+        bodies.sort()
+
+        usage = [len(bodies), sum(size for _, size, _ in bodies)]
+        target = [
+            int(self.max_entries * 0.9) if self.max_entries is not None else None,
+            int(self.max_bytes * 0.9) if self.max_bytes is not None else None
+        ]
+        for _, size, body_path in bodies:
+            if (target[0] is None or usage[0] <= target[0]) and (target[1] is None or usage[1] <= target[1]):
+                break
+            for path in (body_path, body_path.with_suffix('.json')):
+                path.unlink(missing_ok=True)
+            usage[0] -= 1
+            usage[1] -= size
+        return usage
+
+    def expires_at(self, headers, now):
+        """Work out when a response stops being fresh"""
+        cache_control = parse_cache_control(headers.get('Cache-Control'))
+
+        if 'no-cache' in cache_control:
+            return now
+        if 'max-age' in cache_control:
+            try:
+                return now + int(cache_control['max-age'])
+            except (TypeError, ValueError):
+                return now
+        if headers.get('Expires'):
+            try:
+                return parsedate_to_datetime(headers['Expires']).timestamp()
+            except (TypeError, ValueError):
+                return now
+
+        return now + self.default_max_age
+
+    def is_cacheable(self, headers):
+        """Check if a response may be stored"""
+        cache_control = parse_cache_control(headers.get('Cache-Control'))
+        if 'no-store' in cache_control or headers.get('Vary') == '*':
+            return False
+
+        # Worth storing only if it can be reused or revalidated
+        return bool(
+            headers.get('ETag') or headers.get('Last-Modified') or
+            'max-age' in cache_control or headers.get('Expires') or self.default_max_age
+        )
+
+    def get_fresh(self, url, request_headers=None):
+        """Get (entry, body) if the cached response is still fresh"""
+        entry = self.load_entry(url, request_headers)
+        if entry and time.time() < entry.get('expires_at', 0):
+            body = self.load_body(url, request_headers)
+            if body is not None:
+                self.record('hits', saved=len(body))
+                return entry, body
+        return None
+
+    def conditional_headers(self, url, request_headers=None):
+        """Build If-None-Match / If-Modified-Since headers for a URL"""
+        entry = self.load_entry(url, request_headers)
+        headers = {}
+        if entry and not self.entry_paths(url, request_headers)[1].exists():
+            # Metadata without a body: a 304 would have nothing to serve, so fetch afresh
+            self.drop_entry(url, request_headers)
+        elif entry:
+            if entry['headers'].get('ETag'):
+                headers['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+        return headers
+
+    def store(self, url, headers, body, request_headers=None):
+        """Store a full 200 response, keyed on the request headers its Vary names"""
+        self.record('misses', downloaded=len(body))
+
+        if not self.is_cacheable(headers):
+            return False
+
+        try:
+            vary = vary_names(headers)
+            self.write_vary(url, vary)
+            _, body_path = self.entry_paths(url, request_headers, vary)
+            replaced = body_path.stat().st_size if body_path.exists() else None
+
+            temp_path = body_path.with_suffix('.gz.tmp')
+            with gzip.open(temp_path, 'wb') as f:
+                f.write(body)
+            size = temp_path.stat().st_size
+            os.replace(temp_path, body_path)
+
+            now = time.time()
+            self.write_entry(url, {
+                'url': url,
+                'headers': {name: headers[name] for name in STORED_HEADERS if headers.get(name)},
+                'stored_at': now,
+                'expires_at': self.expires_at(headers, now),
+                'size': len(body)
+            }, request_headers)
+
+            self.track_usage(size, replaced)
+            return True
+        except Exception:
+            return False
+
+    def track_usage(self, size, replaced=None):
+        """Count a stored body and evict once the cache is over its caps"""
+        with self._lock:
+            if self._usage is None:
+                self._usage = self.count_usage()
+            elif replaced is None:
+                self._usage[0] += 1
+                self._usage[1] += size
+            else:
+                self._usage[1] += size - replaced
+
+            if self.over_limit(self._usage):
+                self._usage = self.evict()
+
+    def revalidated(self, url, headers, request_headers=None):
+        """Handle a 304: refresh freshness and return the cached body"""
+        entry = self.load_entry(url, request_headers)
+        body = self.load_body(url, request_headers)
+        if entry is None or body is None:
+            # Lost or unreadable body; the caller refetches without validators
+            self.drop_entry(url, request_headers)
+            return None
+
+        # 304 responses may carry updated validators and freshness
+        for name in STORED_HEADERS:
+            if headers.get(name):
+                entry['headers'][name] = headers[name]
+        entry['expires_at'] = self.expires_at(headers, time.time())
+
+        try:
+            self.write_entry(url, entry, request_headers)
+        except Exception:
+            pass
+
+        self.record('revalidated', saved=len(body))
+        return body
+
+    def record(self, event, downloaded=0, saved=0):
+        """Update cache statistics"""
+        with self._lock:
+            self.stats[event] += 1
+            self.stats['bytes_downloaded'] += downloaded
+            self.stats['bytes_saved'] += saved
+
+    def get_stats(self):
+        """Get hit ratio and bytes saved"""
+        with self._lock:
+            stats = dict(self.stats)
+
+        total = stats['hits'] + stats['revalidated'] + stats['misses']
+        stats['requests'] = total
+        stats['hit_ratio'] = (stats['hits'] + stats['revalidated']) / total if total else 0
+        return stats
+
+    def clear(self):
+        """Remove all cached entries"""
+        for path in self.cache_dir.iterdir():
+            try:
+                path.unlink()
+            except OSError:
+                continue
+        with self._lock:
+            self._usage = None
+
+class CachedSession(requests.Session):
+    """requests.Session that serves GETs through an HTTPCache"""
+
+    def __init__(self, cache=None):
+        super().__init__()
+        self.cache = cache or HTTPCache()
+
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != 'GET':
+            return super().request(method, url, *args, **kwargs)
+
+        # Session defaults plus per-request headers, as sent; a Vary response is cached per their values
+        headers = dict(kwargs.pop('headers', None) or {})
+        request_headers = CaseInsensitiveDict(self.headers)
+        request_headers.update(headers)
+
+        fresh = self.cache.get_fresh(url, request_headers)
+        if fresh:
+            return self.build_cached_response(url, *fresh)
+
+        conditional = self.cache.conditional_headers(url, request_headers)
+        response = super().request(method, url, *args, headers=dict(headers, **conditional), **kwargs)
+
+        if response.status_code == 304:
+            body = self.cache.revalidated(url, response.headers, request_headers)
+            if body is not None:
+                return self.build_cached_response(url, self.cache.load_entry(url, request_headers), body)
+            if conditional:
+                # The cached body was gone and the entry is dropped; fetch the full page once
+                response = super().request(method, url, *args, headers=headers, **kwargs)
+                if response.status_code == 200:
+                    self.cache.store(url, response.headers, response.content, request_headers)
+        elif response.status_code == 200:
+            self.cache.store(url, response.headers, response.content, request_headers)
+
+        return response
+
+    def build_cached_response(self, url, entry, body):
+        """Build a 200 response from a cached entry"""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = body
+        response.from_cache = True
+        return response
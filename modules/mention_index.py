@@ -0,0 +1,297 @@
+import re
+import csv
+import json
+import math
+import time
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime
+import numpy as np
+from textblob import TextBlob
+
+SECONDS_PER_DAY = 86400
+SOURCES = ['news', 'social']
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Postings sorted by (term, source, day); offsets[term_id] is where a term's rows start
+POSTING_DTYPE = np.dtype([
+    ('term', np.int32),
+    ('source', np.int8),
+    ('day', np.int32),
+    ('count', np.int32),
+    ('sentiment', np.float32)  # Sum of document polarity
+])
+
+def to_timestamp(value):
+    """Convert ISO string, datetime or epoch seconds to epoch seconds"""
+    if value is None or value == '':
+        return time.time()
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    return float(value)
+
+def tokenize(text):
+    """Distinct lowercase alphanumeric tokens of a document"""
+    return set(TOKEN_PATTERN.findall(text.lower()))
+
+class MentionIndex:
+    """Inverted index from term to daily mention counts and sentiment, per source"""
+
+    def __init__(self, index_dir="data/mention_index", max_segment_length=20):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.max_segment_length = max_segment_length
+
+        self.vocabulary = {}  # {term: term_id}
+        self.postings = np.empty(0, dtype=POSTING_DTYPE)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.term_totals = np.empty((0, len(SOURCES)), dtype=np.int64)  # All-time mentions per term and source
+        self.reference_counts = {}  # Most mentions of any term, per source and overall
+        self.last_day = None  # Newest day with postings
+        self.version = None  # (mtime_ns, inode) of postings.npz as last loaded
+
+        self.pending = {}  # {(term, source, day): [count, sentiment]} not yet merged
+        self._lock = threading.Lock()
+
+        self.load()
+
+    @property
+    def term_count(self):
+        return len(self.vocabulary)
+
+    def postings_version(self):
+        """Identity of postings.npz on disk, or None if there is none"""
+        try:
+            stat = (self.index_dir / "postings.npz").stat()
+            return (stat.st_mtime_ns, stat.st_ino)
+        except FileNotFoundError:
+            return None
+
+    def load(self):
+        """Load the index from disk"""
+        version = self.postings_version()
+        try:
+            data = np.load(self.index_dir / "postings.npz")
+            if 'vocabulary' in data:
+                vocabulary = json.loads(str(data['vocabulary']))
+            else:
+                # Indexes saved before the vocabulary moved into postings.npz
+                with open(self.index_dir / "vocabulary.json", 'r', encoding='utf-8') as f:
+                    vocabulary = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError, ValueError):
+            return False
+
+        with self._lock:
+            self.vocabulary = vocabulary
+            self.postings = data['postings']
+            self.offsets = data['offsets']
+            self.term_totals = data['term_totals']
+            self.update_reference_counts()
+            self.version = version
+        return True
+
+    def refresh(self):
+        """Reload the index if it was rebuilt on disk since it was loaded"""
+        version = self.postings_version()
+        if version is not None and version != self.version:
+            return self.load()
+        return False
+
+    def save(self):
+        """Persist the index"""
+        with self._lock:
+            vocabulary = dict(self.vocabulary)
+            postings, offsets, term_totals = self.postings, self.offsets, self.term_totals
+
+        try:
+            # One file, so a reader never pairs postings with another save's vocabulary
+            np.savez(self.index_dir / "postings.tmp.npz", postings=postings, offsets=offsets, term_totals=term_totals,
+                     vocabulary=np.array(json.dumps(vocabulary)))
+            (self.index_dir / "postings.tmp.npz").replace(self.index_dir / "postings.npz")
+            self.version = self.postings_version()
+            (self.index_dir / "vocabulary.json").unlink(missing_ok=True)
+            return True
+        except Exception:
+            return False
+
+    def add_document(self, text, source='news', timestamp=None):
+        """Queue one headline or post for the next commit; False if it has no text or an unknown source"""
+        # JSON dumps can carry numbers, lists or objects in the text field
+        if not isinstance(text, str) or not text or source not in SOURCES:
+            return False
+        source_id = SOURCES.index(source)
+        day = int(to_timestamp(timestamp) // SECONDS_PER_DAY)
+        polarity = TextBlob(text).sentiment.polarity
+
+        with self._lock:
+            for term in tokenize(text):
+                entry = self.pending.setdefault((term, source_id, day), [0, 0.0])
+                entry[0] += 1
+                entry[1] += polarity
+        return True
+
+    def ingest_file(self, path, source='news', text_field='text', time_field='timestamp'):
+        """Ingest a dump: JSON lines, CSV with a text column, or plain text with one document per line
+
+        Records whose own 'source' is not one of SOURCES are skipped; returns the documents indexed.
+        """
+        path = Path(path)
+        documents = 0
+
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            if path.suffix in ('.jsonl', '.ndjson'):
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    documents += self.add_document(record.get(text_field, ''), record.get('source', source), record.get(time_field))
+            elif path.suffix == '.csv':
+                for record in csv.DictReader(f):
+                    documents += self.add_document(record.get(text_field, ''), record.get('source') or source, record.get(time_field))
+            else:
+                for line in f:
+                    documents += self.add_document(line.strip(), source)
+
+        self.commit()
+        return documents
+
+    def commit(self):
+        """Merge queued documents into the postings arrays"""
+        with self._lock:
+            if not self.pending:
+                return 0
+
+            for term, _, _ in self.pending:
+                if term not in self.vocabulary:
+                    self.vocabulary[term] = len(self.vocabulary)
+
+            added = np.empty(len(self.pending), dtype=POSTING_DTYPE)
+            for row, ((term, source_id, day), (count, sentiment)) in enumerate(self.pending.items()):
+                added[row] = (self.vocabulary[term], source_id, day, count, sentiment)
+            self.pending = {}
+
+            # Merge rows sharing (term, source, day), keeping the sort order
+            merged = np.concatenate((self.postings, added))
+            order = np.lexsort((merged['day'], merged['source'], merged['term']))
+            merged = merged[order]
+            keys = np.stack((merged['term'], merged['source'].astype(np.int32), merged['day']), axis=1)
+            starts = np.concatenate(([0], np.flatnonzero(np.any(np.diff(keys, axis=0) != 0, axis=1)) + 1))
+
+            postings = merged[starts]
+            postings['count'] = np.add.reduceat(merged['count'], starts)
+            postings['sentiment'] = np.add.reduceat(merged['sentiment'], starts)
+
+            term_count = len(self.vocabulary)
+            self.postings = postings
+            self.offsets = np.searchsorted(postings['term'], np.arange(term_count + 1)).astype(np.int64)
+
+            totals = np.zeros(term_count * len(SOURCES), dtype=np.int64)
+            np.add.at(totals, postings['term'].astype(np.int64) * len(SOURCES) + postings['source'], postings['count'])
+            self.term_totals = totals.reshape(term_count, len(SOURCES))
+            self.update_reference_counts()
+
+            return len(added)
+
+    def update_reference_counts(self):
+        """Precompute the log-scale reference for mention scores and the newest day"""
+        self.last_day = int(self.postings['day'].max()) if len(self.postings) else None
+        if not len(self.term_totals):
+            self.reference_counts = {}
+            return
+        self.reference_counts = {source: int(self.term_totals[:, i].max()) for i, source in enumerate(SOURCES)}
+        self.reference_counts[None] = int(self.term_totals.sum(axis=1).max())
+
+    def term_postings(self, term):
+        """Postings rows of one term (a view, no copy)"""
+        term_id = self.vocabulary.get(term)
+        if term_id is None:
+            return self.postings[:0]
+        return self.postings[self.offsets[term_id]:self.offsets[term_id + 1]]
+
+    def segment(self, keyword):
+        """Split a compound keyword into indexed terms, e.g. 'aitech' -> ['ai', 'tech'], or None"""
+        keyword = keyword.lower()
+        if keyword in self.vocabulary:
+            return [keyword]
+
+        # Fewest segments that are all indexed terms
+        best = [None] * (len(keyword) + 1)
+        best[0] = []
+        for end in range(1, len(keyword) + 1):
+            for start in range(max(0, end - self.max_segment_length), end):
+                if best[start] is not None and keyword[start:end] in self.vocabulary:
+                    candidate = best[start] + [keyword[start:end]]
+                    if best[end] is None or len(candidate) < len(best[end]):
+                        best[end] = candidate
+        return best[-1]
+
+    def get_mentions(self, keyword, source=None, days=30, now=None):
+        """Mentions and mean sentiment in the last `days` days; compound keywords use their rarest part"""
+        terms = self.segment(keyword)
+        if not terms or (source is not None and source not in SOURCES):
+            return {'count': 0, 'sentiment': 0.0, 'terms': terms or []}
+
+        last_day = int(to_timestamp(now) // SECONDS_PER_DAY) if now is not None else self.latest_day()
+        first_day = last_day - days + 1
+
+        best = None
+        for term in terms:
+            rows = self.term_postings(term)
+            mask = (rows['day'] >= first_day) & (rows['day'] <= last_day)
+            if source is not None:
+                mask &= rows['source'] == SOURCES.index(source)
+
+            count = int(rows['count'][mask].sum())
+            sentiment = float(rows['sentiment'][mask].sum())
+            if best is None or count < best[0]:
+                best = (count, sentiment)
+
+        count, sentiment = best
+        return {
+            'count': count,
+            'sentiment': round(sentiment / count, 3) if count else 0.0,
+            'terms': terms
+        }
+
+    def latest_day(self):
+        """Newest day in the index, so old dumps still score"""
+        if self.last_day is None:
+            return int(time.time() // SECONDS_PER_DAY)
+        return self.last_day
+
+    def mention_score(self, keyword, source=None, days=30, now=None):
+        """Mentions on a 0-100 log scale relative to the most mentioned term"""
+        return self.count_score(self.get_mentions(keyword, source, days, now)['count'], source)
+
+    def count_score(self, count, source=None):
+        """Place a mention count on the 0-100 log scale"""
+        reference = max(1, self.reference_counts.get(source, 0))
+        return min(100, int(100 * math.log1p(count) / math.log1p(max(reference, count))))
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the local mention index from news and social dumps")
+    parser.add_argument('paths', nargs='+', help="JSON lines, CSV or plain text dumps")
+    parser.add_argument('--source', choices=SOURCES, default='news')
+    parser.add_argument('--index-dir', default="data/mention_index")
+    args = parser.parse_args()
+
+    index = MentionIndex(args.index_dir)
+    for path in args.paths:
+        documents = index.ingest_file(path, args.source)
+        print(f"{path}: {documents} documents")
+
+    index.save()
+    print(f"{index.term_count} terms, {len(index.postings)} postings")
+
+if __name__ == "__main__":
+    main()
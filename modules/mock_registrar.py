@@ -0,0 +1,153 @@
+import asyncio
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+from aiohttp import web
+from modules.premium_checker import estimate_premium
+
+DEFAULT_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+
+class MockRegistrarServer:
+    """Local HTTP server replaying recorded registrar search pages"""
+
+    def __init__(self, fixtures_dir=DEFAULT_FIXTURES_DIR, host='127.0.0.1', port=0, latency=0.0):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.host = host
+        self.port = port
+        self.latency = latency  # Seconds added to every response
+
+        self.pages = {}
+        self.request_counts = {}
+        self.runner = None
+        self._thread = None
+        self._loop = None
+
+        self.load_pages()
+
+    def load_pages(self):
+        """Load recorded pages, one per registrar"""
+        for path in self.fixtures_dir.glob('*.html'):
+            body = path.read_bytes()
+            self.pages[path.stem] = {
+                'body': body,
+                'etag': '"' + hashlib.md5(body).hexdigest() + '"'
+            }
+            self.request_counts[path.stem] = 0
+
+    def base_urls(self):
+        """Base URL for each registrar, for EnhancedPriceScraper(registrar_urls=...)"""
+        return {registrar: f"http://{self.host}:{self.port}/{registrar}" for registrar in self.pages}
+
+    async def handle(self, request):
+        """Serve the recorded page for the registrar in the first path segment"""
+        registrar = request.match_info['registrar']
+        page = self.pages.get(registrar)
+        if page is None:
+            raise web.HTTPNotFound()
+
+        self.request_counts[registrar] += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if request.headers.get('If-None-Match') == page['etag']:
+            return web.Response(status=304, headers={'ETag': page['etag']})
+
+        return web.Response(
+            body=page['body'],
+            content_type='text/html',
+            charset='utf-8',
+            headers={'ETag': page['etag'], 'Cache-Control': 'no-cache'}
+        )
+
+    async def handle_domains_check(self, request):
+        """Stand-in for Namecheap's namecheap.domains.check multi-domain endpoint"""
+        self.request_counts['namecheap.domains.check'] = self.request_counts.get('namecheap.domains.check', 0) + 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        results = []
+        for domain in request.query.get('DomainList', '').split(','):
+            if not domain:
+                continue
+            premium_price = estimate_premium(domain)
+            results.append(
+                f'<DomainCheckResult Domain="{domain}" Available="true" '
+                f'IsPremiumName="{"true" if premium_price else "false"}" '
+                f'PremiumRegistrationPrice="{premium_price or 0}" />'
+            )
+
+        body = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<ApiResponse Status="OK" xmlns="http://api.namecheap.com/xml.response">'
+            f'<CommandResponse Type="namecheap.domains.check">{"".join(results)}</CommandResponse>'
+            '</ApiResponse>'
+        )
+        return web.Response(text=body, content_type='text/xml')
+
+    async def start(self):
+        """Start serving on the current event loop"""
+        app = web.Application()
+        app.router.add_get('/namecheap/xml.response', self.handle_domains_check)
+        app.router.add_get('/{registrar}/{tail:.*}', self.handle)
+
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+
+        # Pick up the assigned port when started on port 0
+        self.port = self.runner.addresses[0][1]
+        return self.base_urls()
+
+    async def stop(self):
+        """Stop serving"""
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    def start_in_thread(self):
+        """Serve from a background event loop, for use with sync scrapers"""
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self.base_urls()
+
+    def stop_thread(self):
+        """Stop a server started with start_in_thread"""
+        if self._loop:
+            asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve recorded registrar pages for offline load testing")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--fixtures', default=str(DEFAULT_FIXTURES_DIR))
+    args = parser.parse_args()
+
+    server = MockRegistrarServer(args.fixtures, port=args.port, latency=args.latency)
+
+    async def serve():
+        urls = await server.start()
+        for registrar, url in urls.items():
+            print(f"{registrar}: {url}")
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+if __name__ == "__main__":
+    main()
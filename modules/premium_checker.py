@@ -0,0 +1,83 @@
+import asyncio
+
+# Local stand-in pricing for names registries typically reserve as premium
+PREMIUM_LENGTH_PRICES = {1: 9999.0, 2: 4999.0, 3: 1299.0}
+PREMIUM_KEYWORD_PRICE = 899.0
+
+def estimate_premium(domain, premium_keywords=()):
+    """Local stand-in: premium price for very short or exact-keyword names, else None"""
+    label = domain.split('.')[0].lower()
+
+    if len(label) in PREMIUM_LENGTH_PRICES:
+        return PREMIUM_LENGTH_PRICES[len(label)]
+    if label in premium_keywords:
+        return PREMIUM_KEYWORD_PRICE
+
+    return None
+
+class PremiumChecker:
+    """Bulk premium detection through registrars' multi-domain endpoints"""
+
+    def __init__(self, registrars, premium_keywords=()):
+        self.registrars = registrars
+        self.premium_keywords = list(premium_keywords)
+
+    def batch_registrars(self):
+        """Registrars with a remote multi-domain endpoint"""
+        return [
+            plugin for plugin in self.registrars.values()
+            if plugin.supports_batch and not plugin.is_local
+        ]
+
+    async def check_registrar_async(self, session, plugin, domains):
+        """Query one registrar in batches of its declared size"""
+        batches = [domains[i:i + plugin.batch_size] for i in range(0, len(domains), plugin.batch_size)]
+        semaphore = asyncio.Semaphore(plugin.max_concurrency)
+
+        async def limited(batch):
+            async with semaphore:
+                return await plugin.check_premiums_batch_async(session, batch)
+
+        results = await asyncio.gather(*[limited(batch) for batch in batches], return_exceptions=True)
+
+        premiums = {}
+        for result in results:
+            if not isinstance(result, Exception):
+                premiums.update(result)
+        return premiums
+
+    async def check_async(self, session, domains):
+        """Mark premium domains: {domain: {'premium', 'premium_price', 'registrar', 'source'}}"""
+        domains = list(dict.fromkeys(domains))
+        plugins = self.batch_registrars()
+
+        results = await asyncio.gather(
+            *[self.check_registrar_async(session, plugin, domains) for plugin in plugins]
+        )
+
+        checked = {}
+        for plugin, premiums in zip(plugins, results):
+            for domain, premium_price in premiums.items():
+                current = checked.get(domain)
+                if current is None or (premium_price and (
+                    not current['premium_price'] or premium_price < current['premium_price']
+                )):
+                    checked[domain] = {
+                        'premium': bool(premium_price),
+                        'premium_price': premium_price,
+                        'registrar': plugin.name,
+                        'source': 'registrar'
+                    }
+
+        # Domains no registrar answered for fall back to the local stand-in
+        for domain in domains:
+            if domain not in checked:
+                premium_price = estimate_premium(domain, self.premium_keywords)
+                checked[domain] = {
+                    'premium': premium_price is not None,
+                    'premium_price': premium_price,
+                    'registrar': None,
+                    'source': 'estimate'
+                }
+
+        return checked
@@ -0,0 +1,141 @@
+import json
+import os
+import time
+import threading
+from pathlib import Path
+from datetime import datetime
+
+# Background refreshes by catalog file, shared by every catalog instance in the process
+_refresh_threads = {}
+_refresh_lock = threading.Lock()
+
+class TLDPriceCatalog:
+    """Standard registration prices keyed by (registrar, TLD)"""
+
+    # Long, meaningless label so registrars quote their standard (non-premium) price
+    PROBE_LABEL = 'qzxvkjwtbn'
+
+    def __init__(self, catalog_file="data/price_catalog.json", refresh_interval=86400, history=None):
+        self.catalog_file = Path(catalog_file)
+        self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
+        self.refresh_interval = refresh_interval  # 24 hours
+        self.history = history  # Optional PriceHistoryStore for observed prices
+
+        self.prices = {}  # {(registrar, tld): price}
+        self.refreshed_at = 0
+
+        self._lock = threading.Lock()
+
+        self.load()
+
+    def load(self):
+        """Load catalog from disk"""
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        with self._lock:
+            self.prices = {
+                (registrar, tld): price
+                for registrar, tld_prices in data.get('prices', {}).items()
+                for tld, price in tld_prices.items()
+            }
+            self.refreshed_at = data.get('refreshed_at', 0)
+
+        return True
+
+    def save(self):
+        """Persist catalog to disk"""
+        with self._lock:
+            nested = {}
+            for (registrar, tld), price in self.prices.items():
+                nested.setdefault(registrar, {})[tld] = price
+            data = {
+                'prices': nested,
+                'refreshed_at': self.refreshed_at,
+                'last_updated': datetime.now().isoformat()
+            }
+
+        try:
+            # Write to a temp file first so readers never see a partial catalog
+            temp_path = self.catalog_file.with_suffix('.json.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.catalog_file)
+            return True
+        except Exception:
+            return False
+
+    def get_price(self, registrar, tld):
+        """Get standard price for a registrar/TLD pair"""
+        return self.prices.get((registrar, tld.lstrip('.')))
+
+    def get_tld_prices(self, tld):
+        """Get standard prices for a TLD across all registrars"""
+        tld = tld.lstrip('.')
+        with self._lock:
+            return {registrar: price for (registrar, t), price in self.prices.items() if t == tld}
+
+    def set_price(self, registrar, tld, price):
+        """Set standard price for a registrar/TLD pair"""
+        with self._lock:
+            self.prices[(registrar, tld.lstrip('.'))] = price
+
+    def is_stale(self):
+        """Check if catalog needs refreshing"""
+        return time.time() - self.refreshed_at > self.refresh_interval
+
+    def refresh(self, scraper, tlds=None):
+        """Re-scrape standard prices for every registrar and TLD"""
+        tlds = tlds or list(scraper.price_ranges.keys())
+        samples = []
+
+        for registrar in scraper.registrars:
+            for tld in tlds:
+                try:
+                    price = scraper.scrape_registrar(registrar, f"{self.PROBE_LABEL}.{tld}")
+                    if price and price > 0:
+                        self.set_price(registrar, tld, price)
+                        samples.append((f".{tld}", registrar, price, None))
+                except Exception:
+                    # Keep previous price for this pair
+                    continue
+
+        self.refreshed_at = time.time()
+        self.save()
+
+        if self.history and samples:
+            self.history.record_many(samples)
+        return len(self.prices)
+
+    def refresh_in_background(self, scraper, tlds=None):
+        """Start a background refresh unless one is already running for this catalog file"""
+        key = str(self.catalog_file.resolve())
+        with _refresh_lock:
+            thread = _refresh_threads.get(key)
+            if thread and thread.is_alive():
+                return False
+
+            # Another instance may have refreshed the file since this one loaded it
+            self.load()
+            if not self.is_stale():
+                return False
+
+            thread = threading.Thread(target=self.refresh, args=(scraper, tlds), daemon=True)
+            _refresh_threads[key] = thread
+            thread.start()
+            return True
+
+    def start_schedule(self, scraper, tlds=None):
+        """Refresh the catalog every refresh_interval seconds in a daemon thread"""
+        def run():
+            while True:
+                if self.is_stale():
+                    self.refresh_in_background(scraper, tlds)
+                time.sleep(min(self.refresh_interval, 300))
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
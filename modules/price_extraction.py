@@ -0,0 +1,124 @@
+import re
+from bs4 import BeautifulSoup
+
+# Compiled once at import instead of on every extract_price_from_text call
+PRICE_PATTERNS = [
+    re.compile(r'(\d+\.\d{2})'),  # 12.99
+    re.compile(r'(\d+\.\d{1})'),  # 12.9
+    re.compile(r'(\d+)'),         # 12
+]
+CURRENCY_CHARS = str.maketrans('', '', ',$€£')
+TAG_PATTERN = re.compile(r'<[^>]*>')
+
+CLASS_SELECTOR = re.compile(r'^\.([\w-]+)$')
+ATTRIBUTE_SELECTOR = re.compile(r'^\[([\w-]+)=["\']?([^"\'\]]+)["\']?\]$')
+
+def extract_price_from_text(text):
+    """Extract numeric price from text"""
+    # Remove common currency symbols and clean text
+    cleaned_text = text.translate(CURRENCY_CHARS)
+
+    for pattern in PRICE_PATTERNS:
+        match = pattern.search(cleaned_text)
+        if match:
+            try:
+                price = float(match.group(1))
+                # Sanity check - domain prices are usually between $1 and $500
+                if 1 <= price <= 500:
+                    return price
+            except ValueError:
+                continue
+
+    return None
+
+def decode_content(content):
+    """Decode a response body to text"""
+    if isinstance(content, bytes):
+        return content.decode('utf-8', errors='replace')
+    return content
+
+class RegexPriceExtractor:
+    """Fast tier: targeted precompiled regexes over the raw HTML"""
+
+    name = 'regex'
+
+    def __init__(self, selectors):
+        self.patterns = [self.compile_selector(selector) for selector in selectors]
+
+    def compile_selector(self, selector):
+        """Compile a simple CSS selector into an element-matching regex"""
+        class_match = CLASS_SELECTOR.match(selector)
+        if class_match:
+            attribute, value = 'class', class_match.group(1)
+            # Class attribute may hold several space-separated names
+            value_pattern = rf'(?:[^"\']*\s)?{re.escape(value)}(?:\s[^"\']*)?'
+        else:
+            attribute_match = ATTRIBUTE_SELECTOR.match(selector)
+            if not attribute_match:
+                return None
+            attribute, value = attribute_match.groups()
+            value_pattern = re.escape(value)
+
+        return re.compile(
+            rf'<(\w+)\b[^>]*?\s{re.escape(attribute)}\s*=\s*["\']{value_pattern}["\'][^>]*>(.*?)</\1\s*>',
+            re.IGNORECASE | re.DOTALL
+        )
+
+    def extract(self, content):
+        """Extract price, or None if no selector yields one"""
+        html = decode_content(content)
+
+        for pattern in self.patterns:
+            if pattern is None:
+                continue
+            match = pattern.search(html)
+            if match:
+                # A nested tag of the same name ends the lazy match early; leave it to the full parse
+                if re.search(rf'<{re.escape(match.group(1))}\b', match.group(2), re.IGNORECASE):
+                    return None
+                price = extract_price_from_text(TAG_PATTERN.sub('', match.group(2)))
+                if price:
+                    return price
+
+        return None
+
+class SoupPriceExtractor:
+    """Full tier: complete BeautifulSoup parse with CSS selectors"""
+
+    name = 'soup'
+
+    def __init__(self, selectors):
+        self.selectors = selectors
+
+    def extract(self, content):
+        """Extract price, or None if no selector yields one"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # Look for price elements (multiple selectors)
+        for selector in self.selectors:
+            price_element = soup.select_one(selector)
+            if price_element:
+                price = extract_price_from_text(price_element.get_text(strip=True))
+                if price:
+                    return price
+
+        return None
+
+class PriceExtractor:
+    """Tiered price extraction: fast tier first, full parse as fallback"""
+
+    def __init__(self, selectors, tiers=(RegexPriceExtractor, SoupPriceExtractor)):
+        self.tiers = [tier(selectors) for tier in tiers]
+        self.stats = {tier.name: 0 for tier in self.tiers}
+        self.stats['miss'] = 0
+
+    def extract(self, content):
+        """Extract price using the cheapest tier that succeeds"""
+        for tier in self.tiers:
+            price = tier.extract(content)
+            if price:
+                self.stats[tier.name] += 1
+                return price
+
+        self.stats['miss'] += 1
+        return None
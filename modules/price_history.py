@@ -0,0 +1,323 @@
+import io
+import json
+import os
+import time
+import threading
+from functools import lru_cache
+from pathlib import Path
+from datetime import datetime, timezone
+import numpy as np
+from modules.file_lock import FileLock, atomic_write
+
+SECONDS_PER_DAY = 86400
+
+# One binary file per column, appended in place
+COLUMNS = {
+    'timestamp': np.float64,
+    'series': np.int32,
+    'price': np.float64
+}
+
+ROLLUP_DTYPE = np.dtype([
+    ('series', np.int32),
+    ('day', np.int32),
+    ('min', np.float64),
+    ('max', np.float64),
+    ('sum', np.float64),
+    ('count', np.int64)
+])
+
+def to_timestamp(value):
+    """Convert datetime, ISO string or epoch seconds to epoch seconds"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+@lru_cache(maxsize=4096)
+def day_partition(day):
+    """Monthly partition name for a day number (days since epoch)"""
+    return datetime.fromtimestamp(day * SECONDS_PER_DAY, tz=timezone.utc).strftime('%Y-%m')
+
+class PriceHistoryStore:
+    """Columnar, month-partitioned store of observed price samples"""
+
+    def __init__(self, history_dir="data/price_history"):
+        self.history_dir = Path(history_dir)
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+
+        # Maps "subject|registrar" to the integer id stored in the series column
+        self.series_file = self.history_dir / "series.json"
+        self.series = {}
+        self._next_series = 0
+        self._series_version = None  # (mtime_ns, inode) of series.json as last loaded
+        self._lock = threading.Lock()
+        self._rollup_cache = {}  # {partition: (row_count, rollup array)}
+
+        # Every process recording prices assigns series ids and appends columns under this lock
+        self.file_lock = FileLock(self.history_dir / ".lock")
+
+        self.load_series()
+
+    def load_series(self):
+        """Load series dictionary from disk, unless it is unchanged since the last load"""
+        try:
+            stat = self.series_file.stat()
+            version = (stat.st_mtime_ns, stat.st_ino)
+            if version == self._series_version:
+                return
+            with open(self.series_file, 'r', encoding='utf-8') as f:
+                self.series = json.load(f)
+            self._series_version = version
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.series = {}
+            self._series_version = None
+        self._next_series = max(self.series.values(), default=-1) + 1
+
+    def save_series(self):
+        """Persist series dictionary"""
+        atomic_write(self.series_file, json.dumps(self.series).encode('utf-8'), durable=False)
+        stat = self.series_file.stat()
+        self._series_version = (stat.st_mtime_ns, stat.st_ino)
+
+    def series_id(self, subject, registrar):
+        """Get or assign the id for a (subject, registrar) series; call under the file lock"""
+        key = f"{subject}|{registrar}"
+        if key not in self.series:
+            self.series[key] = self._next_series
+            self._next_series += 1
+        return self.series[key]
+
+    def series_ids(self, subject, registrar=None):
+        """Get ids of all series for a subject, optionally one registrar"""
+        self.load_series()  # Pick up series other processes added
+        if registrar:
+            key = f"{subject}|{registrar}"
+            return [self.series[key]] if key in self.series else []
+
+        prefix = f"{subject}|"
+        return [series_id for key, series_id in self.series.items() if key.startswith(prefix)]
+
+    def partition_name(self, timestamp):
+        """Monthly partition name for a timestamp"""
+        return day_partition(int(timestamp // SECONDS_PER_DAY))
+
+    def partitions(self, start=None, end=None):
+        """List partition directories overlapping [start, end]"""
+        first = self.partition_name(start) if start is not None else None
+        last = self.partition_name(end) if end is not None else None
+
+        names = sorted(
+            path.name for path in self.history_dir.iterdir()
+            if path.is_dir() and len(path.name) == 7
+        )
+        return [
+            name for name in names
+            if (first is None or name >= first) and (last is None or name <= last)
+        ]
+
+    def record(self, subject, registrar, price, timestamp=None):
+        """Record one observed price"""
+        return self.record_many([(subject, registrar, price, timestamp)])
+
+    def record_many(self, samples):
+        """Record (subject, registrar, price, timestamp) samples"""
+        now = time.time()
+        by_partition = {}
+
+        with self._lock, self.file_lock:
+            # Ids other processes assigned since our last load must not be handed out again
+            self.load_series()
+            series_count = len(self.series)
+
+            for subject, registrar, price, timestamp in samples:
+                if price is None:
+                    continue
+                timestamp = to_timestamp(timestamp) or now
+                rows = by_partition.setdefault(self.partition_name(timestamp), [])
+                rows.append((timestamp, self.series_id(subject, registrar), price))
+
+            if len(self.series) != series_count:
+                self.save_series()
+
+            for partition, rows in by_partition.items():
+                partition_dir = self.history_dir / partition
+                partition_dir.mkdir(exist_ok=True)
+
+                self.align_columns(partition_dir)
+
+                timestamps, series, prices = zip(*rows)
+                for column, values in zip(COLUMNS, (timestamps, series, prices)):
+                    with open(partition_dir / f"{column}.bin", 'ab') as f:
+                        np.asarray(values, dtype=COLUMNS[column]).tofile(f)
+
+        return sum(len(rows) for rows in by_partition.values())
+
+    def column_rows(self, partition_dir):
+        """Rows every column of a partition holds; complete samples are the minimum"""
+        return {
+            column: (partition_dir / f"{column}.bin").stat().st_size // np.dtype(dtype).itemsize
+            if (partition_dir / f"{column}.bin").exists() else 0
+            for column, dtype in COLUMNS.items()
+        }
+
+    def align_columns(self, partition_dir):
+        """Cut columns back to a common row count after an interrupted append; call under the file lock"""
+        paths = {column: partition_dir / f"{column}.bin" for column in COLUMNS}
+        length = min(self.column_rows(partition_dir).values())
+        for column, path in paths.items():
+            if path.exists() and path.stat().st_size != length * np.dtype(COLUMNS[column]).itemsize:
+                os.truncate(path, length * np.dtype(COLUMNS[column]).itemsize)
+
+    def load_partition(self, partition):
+        """Load raw columns of a partition"""
+        partition_dir = self.history_dir / partition
+        columns = {}
+        for column, dtype in COLUMNS.items():
+            path = partition_dir / f"{column}.bin"
+            columns[column] = np.fromfile(path, dtype=dtype) if path.exists() else np.empty(0, dtype=dtype)
+
+        # Columns can differ in length after an interrupted append
+        length = min(len(values) for values in columns.values())
+        return {column: values[:length] for column, values in columns.items()}
+
+    def build_rollup(self, columns):
+        """Downsample raw samples to daily min/max/sum/count per series"""
+        if not len(columns['timestamp']):
+            return np.empty(0, dtype=ROLLUP_DTYPE)
+
+        days = (columns['timestamp'] // SECONDS_PER_DAY).astype(np.int32)
+        order = np.lexsort((days, columns['series']))
+        series, days, prices = columns['series'][order], days[order], columns['price'][order]
+
+        # Start index of every (series, day) group
+        boundaries = np.flatnonzero((np.diff(series) != 0) | (np.diff(days) != 0)) + 1
+        starts = np.concatenate(([0], boundaries))
+
+        rollup = np.empty(len(starts), dtype=ROLLUP_DTYPE)
+        rollup['series'] = series[starts]
+        rollup['day'] = days[starts]
+        rollup['min'] = np.minimum.reduceat(prices, starts)
+        rollup['max'] = np.maximum.reduceat(prices, starts)
+        rollup['sum'] = np.add.reduceat(prices, starts)
+        rollup['count'] = np.diff(np.concatenate((starts, [len(prices)])))
+        return rollup
+
+    def get_rollup(self, partition):
+        """Get daily rollup of a partition, rebuilding it only when new samples arrived"""
+        partition_dir = self.history_dir / partition
+
+        # Writers append under the exclusive lock, so row count and columns agree while shared
+        with self.file_lock.shared():
+            row_count = min(self.column_rows(partition_dir).values())
+
+            cached = self._rollup_cache.get(partition)
+            if cached and cached[0] == row_count:
+                return cached[1]
+
+            rollup_path = partition_dir / "rollup.npy"
+            meta_path = partition_dir / "rollup.json"
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    if json.load(f).get('row_count') == row_count:
+                        rollup = np.load(rollup_path)
+                        self._rollup_cache[partition] = (row_count, rollup)
+                        return rollup
+            except (FileNotFoundError, json.JSONDecodeError, OSError, ValueError):
+                pass
+
+            columns = self.load_partition(partition)
+            row_count = len(columns['timestamp'])
+            rollup = self.build_rollup(columns)
+            try:
+                # Rollup before its row count, so the meta never vouches for an older rollup
+                buffer = io.BytesIO()
+                np.save(buffer, rollup)
+                atomic_write(rollup_path, buffer.getvalue(), durable=False)
+                atomic_write(meta_path, json.dumps({'row_count': row_count, 'built_at': time.time()}).encode('utf-8'), durable=False)
+            except OSError:
+                pass
+
+        self._rollup_cache[partition] = (row_count, rollup)
+        return rollup
+
+    def get_daily(self, subject, registrar=None, start=None, end=None):
+        """Daily min/max/mean for a domain or TLD, across registrars unless one is given"""
+        start, end = to_timestamp(start), to_timestamp(end)
+        ids = self.series_ids(subject, registrar)
+        if not ids:
+            return []
+
+        first_day = int(start // SECONDS_PER_DAY) if start is not None else None
+        last_day = int(end // SECONDS_PER_DAY) if end is not None else None
+
+        selected = []
+        for partition in self.partitions(start, end):
+            rollup = self.get_rollup(partition)
+            mask = np.isin(rollup['series'], ids)
+            if first_day is not None:
+                mask &= rollup['day'] >= first_day
+            if last_day is not None:
+                mask &= rollup['day'] <= last_day
+            selected.append(rollup[mask])
+
+        if not selected:
+            return []
+        rows = np.concatenate(selected)
+        if not len(rows):
+            return []
+
+        # Merge registrars into one row per day
+        days, inverse = np.unique(rows['day'], return_inverse=True)
+        mins = np.full(len(days), np.inf)
+        maxs = np.full(len(days), -np.inf)
+        np.minimum.at(mins, inverse, rows['min'])
+        np.maximum.at(maxs, inverse, rows['max'])
+        sums = np.bincount(inverse, weights=rows['sum'], minlength=len(days))
+        counts = np.bincount(inverse, weights=rows['count'], minlength=len(days))
+
+        return [
+            {
+                'date': datetime.fromtimestamp(int(day) * SECONDS_PER_DAY, tz=timezone.utc).strftime('%Y-%m-%d'),
+                'min': round(float(low), 2),
+                'max': round(float(high), 2),
+                'mean': round(float(total / count), 2),
+                'count': int(count)
+            }
+            for day, low, high, total, count in zip(days, mins, maxs, sums, counts)
+        ]
+
+    def get_samples(self, subject, registrar=None, start=None, end=None):
+        """Raw samples for a domain or TLD"""
+        start, end = to_timestamp(start), to_timestamp(end)
+        ids = self.series_ids(subject, registrar)
+        if not ids:
+            return []
+
+        registrar_names = {
+            series_id: key.split('|', 1)[1]
+            for key, series_id in self.series.items() if series_id in ids
+        }
+
+        samples = []
+        for partition in self.partitions(start, end):
+            columns = self.load_partition(partition)
+            mask = np.isin(columns['series'], ids)
+            if start is not None:
+                mask &= columns['timestamp'] >= start
+            if end is not None:
+                mask &= columns['timestamp'] <= end
+
+            for timestamp, series_id, price in zip(
+                columns['timestamp'][mask], columns['series'][mask], columns['price'][mask]
+            ):
+                samples.append({
+                    'timestamp': datetime.fromtimestamp(float(timestamp)).isoformat(),
+                    'registrar': registrar_names[int(series_id)],
+                    'price': float(price)
+                })
+
+        return samples
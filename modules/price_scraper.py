@@ -1,20 +1,31 @@
-import requests
-from bs4 import BeautifulSoup
 import json
 import asyncio
 import aiohttp
-import time
-import random
+from pathlib import Path
+from datetime import datetime, timedelta
 from fake_useragent import UserAgent
-import concurrent.futures
 import streamlit as st
+from modules.price_catalog import TLDPriceCatalog
+from modules.http_cache import HTTPCache, CachedSession
+from modules.price_extraction import extract_price_from_text
+from modules.price_history import PriceHistoryStore
+from modules.registrars import create_registrars
+from modules.premium_checker import PremiumChecker
+from modules.seeding import derive_rng
 
 class EnhancedPriceScraper:
     """Enhanced price scraper for multiple domain registrars"""
     
-    def __init__(self):
+    def __init__(self, data_dir="data", registrar_urls=None, seed=None):
         self.ua = UserAgent()
-        self.session = requests.Session()
+        self.data_dir = Path(data_dir)
+        
+        # Run seed for reproducible simulated prices; None draws from the shared random module
+        self.seed = seed
+        
+        # Conditional-GET cache: unchanged registrar pages cost a 304
+        self.http_cache = HTTPCache(self.data_dir / "http_cache")
+        self.session = CachedSession(self.http_cache)
         self.session.headers.update({
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -23,14 +34,11 @@ class EnhancedPriceScraper:
             'Connection': 'keep-alive',
         })
         
-        self.registrars = {
-            'namecheap': self.scrape_namecheap,
-            'godaddy': self.scrape_godaddy,
-            'porkbun': self.scrape_porkbun,
-            'namesilo': self.scrape_namesilo,
-            'hostinger': self.scrape_hostinger,
-            'cloudflare': self.scrape_cloudflare
-        }
+        # Registrar plugins declare their own rate limits, batching and parsers
+        self.registrars = create_registrars(registrar_urls, seed)
+        
+        # Total connections on the shared aiohttp session; per-registrar limits come from the plugins
+        self.async_max_concurrency = 50
         
         # Realistic price ranges by extension
         self.price_ranges = {
@@ -44,38 +52,152 @@ class EnhancedPriceScraper:
             'app': (18.99, 25.99),
             'dev': (12.99, 22.99)
         }
+        
+        # Keywords that registrars commonly price as premium
+        self.premium_keywords = ['ai', 'crypto', 'nft', 'web3', 'tech', 'app', 'pro']
+        
+        # Marks premium names in bulk through registrars' multi-domain endpoints
+        self.premium_checker = PremiumChecker(self.registrars, self.premium_keywords)
+        
+        # Every observed price, by domain or TLD
+        self.price_history = PriceHistoryStore(self.data_dir / "price_history")
+        
+        # Standard prices by (registrar, TLD), refreshed in the background
+        self.price_catalog = TLDPriceCatalog(self.data_dir / "price_catalog.json", history=self.price_history)
     
-    def get_domain_price(self, domain):
+    def get_domain_price(self, domain, premium_check=None):
         """Get the best price for a domain across all registrars"""
+        # Seeded runs price from the seed alone, never from the catalog or live pages
+        if self.seed is not None:
+            return self.get_simulated_price(domain)
+        
+        standard_prices = self.get_standard_prices(domain)
+        
+        # A bulk premium check already settled this domain, no per-domain lookup needed
+        if premium_check is not None:
+            if premium_check.get('premium') and premium_check.get('premium_price'):
+                registrar = premium_check.get('registrar') or 'estimate'
+                return {
+                    'price': premium_check['premium_price'],
+                    'registrar': registrar,
+                    'all_prices': {registrar: premium_check['premium_price']},
+                    'premium': True
+                }
+            return self.get_standard_price(domain, standard_prices)
+        
+        # Standard names are priced per TLD, so the catalog answers without scraping
+        if not self.is_premium_candidate(domain):
+            return self.get_standard_price(domain, standard_prices)
+        
+        # Per-domain lookups are reserved for premium detection
+        prices = self.scrape_domain_prices(domain)
+        return self.combine_prices(domain, prices, standard_prices)
+    
+    def get_standard_price(self, domain, standard_prices):
+        """Price a non-premium domain from the catalog"""
+        if standard_prices:
+            return self.build_price_result(standard_prices)
+        
+        # Catalog not populated yet (refresh runs in the background)
+        return self.get_simulated_price(domain)
+    
+    def check_premiums(self, domains):
+        """Bulk premium check for many domains at once"""
+        return asyncio.run(self.check_premiums_async(domains))
+    
+    async def check_premiums_async(self, domains, session=None):
+        """Bulk premium check, one request per registrar batch rather than per domain"""
+        if self.seed is not None:
+            return {}  # Seeded prices ignore premium checks
+        
+        own_session = session is None
+        if own_session:
+            session = self.create_async_session()
+        
+        try:
+            return await self.premium_checker.check_async(session, domains)
+        finally:
+            if own_session:
+                await session.close()
+    
+    def get_standard_prices(self, domain):
+        """Get catalog prices for a domain's TLD, refreshing the catalog if stale"""
+        # The catalog fills in over time, so seeded runs leave it (and its refresh) alone
+        if self.seed is not None:
+            return {}
+        
+        if self.price_catalog.is_stale():
+            self.price_catalog.refresh_in_background(self)
+        
+        return self.price_catalog.get_tld_prices(domain.split('.')[-1])
+    
+    def combine_prices(self, domain, prices, standard_prices):
+        """Build the price result from scraped and standard prices"""
+        if prices:
+            result = self.build_price_result(prices)
+            if standard_prices:
+                # Premium names cost more everywhere than any registrar's standard price
+                result['premium'] = result['price'] > max(standard_prices.values())
+            return result
+        elif standard_prices:
+            return self.build_price_result(standard_prices)
+        else:
+            # Fallback to realistic simulation
+            return self.get_simulated_price(domain)
+    
+    def is_premium_candidate(self, domain):
+        """Check if a domain may carry a premium price"""
+        domain_name = domain.split('.')[0].lower()
+        
+        if len(domain_name) <= 4:
+            return True
+        
+        return any(keyword in domain_name for keyword in self.premium_keywords)
+    
+    def build_price_result(self, prices):
+        """Build price result from a {registrar: price} mapping"""
+        best_registrar = min(prices, key=prices.get)
+        return {
+            'price': prices[best_registrar],
+            'registrar': best_registrar,
+            'all_prices': dict(prices),
+            'premium': False
+        }
+    
+    def scrape_domain_prices(self, domain):
+        """Scrape a single domain's price from every registrar"""
         prices = {}
         
-        for registrar, scraper_func in self.registrars.items():
+        for registrar in self.registrars:
             try:
-                price = scraper_func(domain)
+                # Each plugin waits out its own rate limit
+                price = self.scrape_registrar(registrar, domain)
                 if price and price > 0:
                     prices[registrar] = price
                 
-                # Rate limiting
-                time.sleep(random.uniform(1, 3))
-                
             except Exception as e:
                 # Log error but continue with other registrars
                 continue
         
+        self.record_prices(domain, prices)
+        return prices
+    
+    def record_prices(self, subject, prices):
+        """Record observed {registrar: price} samples in the price history"""
         if prices:
-            best_price = min(prices.values())
-            best_registrar = min(prices, key=prices.get)
-            return {
-                'price': best_price,
-                'registrar': best_registrar,
-                'all_prices': prices
-            }
-        else:
-            # Fallback to realistic simulation
-            return self.get_simulated_price(domain)
+            self.price_history.record_many(
+                [(subject, registrar, price, None) for registrar, price in prices.items()]
+            )
+    
+    def set_seed(self, seed):
+        """Switch simulated prices to a run seed (None for unseeded)"""
+        self.seed = seed
+        for plugin in self.registrars.values():
+            plugin.seed = seed
     
     def get_simulated_price(self, domain):
         """Generate realistic price simulation"""
+        rng = derive_rng(self.seed, 'simulated_price', domain.lower())
         extension = domain.split('.')[-1]
         min_price, max_price = self.price_ranges.get(extension, (15.99, 35.99))
         
@@ -89,216 +211,147 @@ class EnhancedPriceScraper:
             max_price *= 1.2
         
         # Premium keywords cost more
-        premium_keywords = ['ai', 'crypto', 'nft', 'web3', 'tech', 'app', 'pro']
-        if any(keyword in domain_name.lower() for keyword in premium_keywords):
+        if any(keyword in domain_name.lower() for keyword in self.premium_keywords):
             max_price *= 1.3
         
-        price = round(random.uniform(min_price, max_price), 2)
+        price = round(rng.uniform(min_price, max_price), 2)
         
         return {
             'price': price,
-            'registrar': random.choice(list(self.registrars.keys())),
-            'all_prices': {reg: round(price + random.uniform(-5, 10), 2) 
-                          for reg in self.registrars.keys()}
+            'registrar': rng.choice(list(self.registrars.keys())),
+            'all_prices': {reg: round(price + rng.uniform(-5, 10), 2) 
+                          for reg in self.registrars.keys()},
+            'premium': False
         }
     
+    def scrape_registrar(self, registrar, domain):
+        """Get one registrar's price for a domain"""
+        # Rotate user agent
+        self.session.headers['User-Agent'] = self.ua.random
+        return self.registrars[registrar].get_price(self.session, domain)
+    
     def scrape_namecheap(self, domain):
         """Scrape Namecheap pricing"""
-        try:
-            url = f"https://www.namecheap.com/domains/registration/results/?domain={domain}"
-            
-            # Rotate user agent
-            self.session.headers['User-Agent'] = self.ua.random
-            
-            response = self.session.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for price elements (multiple selectors)
-                price_selectors = [
-                    '.price',
-                    '.domain-price',
-                    '[data-cy="price"]',
-                    '.registration-price'
-                ]
-                
-                for selector in price_selectors:
-                    price_element = soup.select_one(selector)
-                    if price_element:
-                        price_text = price_element.get_text(strip=True)
-                        price = self.extract_price_from_text(price_text)
-                        if price:
-                            return price
-            
-            return None
-            
-        except Exception:
-            return None
+        return self.scrape_registrar('namecheap', domain)
     
     def scrape_godaddy(self, domain):
         """Scrape GoDaddy pricing"""
-        try:
-            url = f"https://www.godaddy.com/domainsearch/find?checkAvail=1&domainToCheck={domain}"
-            
-            self.session.headers['User-Agent'] = self.ua.random
-            response = self.session.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                price_selectors = [
-                    '[data-cy="price-display"]',
-                    '.price-display',
-                    '.domain-price',
-                    '.price'
-                ]
-                
-                for selector in price_selectors:
-                    price_element = soup.select_one(selector)
-                    if price_element:
-                        price_text = price_element.get_text(strip=True)
-                        price = self.extract_price_from_text(price_text)
-                        if price:
-                            return price
-            
-            return None
-            
-        except Exception:
-            return None
+        return self.scrape_registrar('godaddy', domain)
     
     def scrape_porkbun(self, domain):
         """Scrape Porkbun pricing (often cheapest)"""
-        try:
-            # Porkbun has an API, simulate API call
-            extension = domain.split('.')[-1]
-            base_prices = {
-                'com': 8.99, 'net': 10.99, 'org': 12.99,
-                'ai': 65.99, 'io': 39.99, 'co': 29.99
-            }
-            
-            base_price = base_prices.get(extension, 19.99)
-            # Add small random variation
-            price = base_price + random.uniform(-2, 5)
-            return round(price, 2)
-            
-        except Exception:
-            return None
+        return self.scrape_registrar('porkbun', domain)
     
     def scrape_namesilo(self, domain):
         """Scrape NameSilo pricing"""
-        try:
-            url = f"https://www.namesilo.com/domain/search-domains?query={domain}"
-            
-            self.session.headers['User-Agent'] = self.ua.random
-            response = self.session.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                price_selectors = [
-                    '.domain_price',
-                    '.price',
-                    '.registration-price'
-                ]
-                
-                for selector in price_selectors:
-                    price_element = soup.select_one(selector)
-                    if price_element:
-                        price_text = price_element.get_text(strip=True)
-                        price = self.extract_price_from_text(price_text)
-                        if price:
-                            return price
-            
-            return None
-            
-        except Exception:
-            return None
+        return self.scrape_registrar('namesilo', domain)
     
     def scrape_hostinger(self, domain):
         """Scrape Hostinger pricing"""
-        try:
-            # Hostinger often requires JavaScript, simulate realistic prices
-            extension = domain.split('.')[-1]
-            base_prices = {
-                'com': 9.99, 'net': 12.99, 'org': 14.99,
-                'ai': 79.99, 'io': 49.99, 'co': 32.99
-            }
-            
-            base_price = base_prices.get(extension, 22.99)
-            price = base_price + random.uniform(-3, 7)
-            return round(price, 2)
-            
-        except Exception:
-            return None
+        return self.scrape_registrar('hostinger', domain)
     
     def scrape_cloudflare(self, domain):
         """Scrape Cloudflare pricing (at-cost pricing)"""
-        try:
-            # Cloudflare offers at-cost pricing, usually cheapest
-            extension = domain.split('.')[-1]
-            at_cost_prices = {
-                'com': 8.03, 'net': 9.06, 'org': 9.95,
-                'ai': 59.98, 'io': 34.50, 'co': 24.00
-            }
-            
-            price = at_cost_prices.get(extension, 15.00)
-            return price
-            
-        except Exception:
-            return None
+        return self.scrape_registrar('cloudflare', domain)
+    
+    def parse_price_page(self, registrar, content):
+        """Extract price from a registrar search page"""
+        return self.registrars[registrar].parse(content)
     
     def extract_price_from_text(self, text):
         """Extract numeric price from text"""
-        import re
+        return extract_price_from_text(text)
+    
+    def create_async_session(self):
+        """Create an aiohttp session shared by all async scrapers"""
+        connector = aiohttp.TCPConnector(
+            limit=self.async_max_concurrency,
+            ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=15),
+            headers=dict(self.session.headers)
+        )
+    
+    async def scrape_registrar_async(self, session, registrar, domain):
+        """Async price lookup for one registrar"""
+        headers = {'User-Agent': self.ua.random}
+        return await self.registrars[registrar].get_price_async(session, domain, self.http_cache, headers)
+    
+    async def scrape_prices_batch_async(self, session, domains):
+        """Scrape many domains, driving every registrar concurrently within its own limits"""
+        headers = {'User-Agent': self.ua.random}
+        registrars = list(self.registrars.keys())
         
-        # Remove common currency symbols and clean text
-        cleaned_text = text.replace(',', '').replace('$', '').replace('€', '').replace('£', '')
+        # One batch per registrar; each plugin applies its rate limit, concurrency and batching
+        results = await asyncio.gather(
+            *[
+                self.registrars[registrar].get_prices_batch_async(session, domains, self.http_cache, headers)
+                for registrar in registrars
+            ],
+            return_exceptions=True
+        )
         
-        # Look for price patterns
-        patterns = [
-            r'(\d+\.\d{2})',  # 12.99
-            r'(\d+\.\d{1})',  # 12.9
-            r'(\d+)',         # 12
-        ]
+        prices = {domain: {} for domain in domains}
+        for registrar, registrar_prices in zip(registrars, results):
+            if isinstance(registrar_prices, Exception):
+                continue
+            for domain, price in registrar_prices.items():
+                if price and price > 0:
+                    prices[domain][registrar] = price
         
-        for pattern in patterns:
-            match = re.search(pattern, cleaned_text)
-            if match:
-                try:
-                    price = float(match.group(1))
-                    # Sanity check - domain prices are usually between $1 and $500
-                    if 1 <= price <= 500:
-                        return price
-                except ValueError:
-                    continue
+        samples = [
+            (domain, registrar, price, None)
+            for domain, domain_prices in prices.items()
+            for registrar, price in domain_prices.items()
+        ]
+        if samples:
+            self.price_history.record_many(samples)
         
-        return None
+        return prices
     
-    async def get_prices_async(self, domains):
+    async def get_domain_price_async(self, session, domain):
+        """Async version of get_domain_price using a shared session"""
+        results = await self.get_prices_async([domain], session)
+        return results.get(domain)
+    
+    async def get_prices_async(self, domains, session=None):
         """Async price checking for bulk operations"""
-        async def check_single_domain(domain):
-            # Run synchronous price check in thread pool
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                result = await loop.run_in_executor(
-                    executor, 
-                    self.get_domain_price, 
-                    domain
-                )
-            return domain, result
-        
-        # Limit concurrent requests to avoid overwhelming servers
-        semaphore = asyncio.Semaphore(3)
-        
-        async def limited_check(domain):
-            async with semaphore:
-                return await check_single_domain(domain)
-        
-        tasks = [limited_check(domain) for domain in domains]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        return {domain: result for domain, result in results if not isinstance(result, Exception)}
+        results = {}
+        lookups = {}
+        
+        if self.seed is not None:
+            return {domain: self.get_simulated_price(domain) for domain in domains}
+        
+        for domain in domains:
+            standard_prices = self.get_standard_prices(domain)
+            if standard_prices and not self.is_premium_candidate(domain):
+                results[domain] = self.build_price_result(standard_prices)
+            else:
+                lookups[domain] = standard_prices
+        
+        if not lookups:
+            return results
+        
+        own_session = session is None
+        if own_session:
+            session = self.create_async_session()
+        
+        try:
+            scraped = await self.scrape_prices_batch_async(session, list(lookups))
+        finally:
+            if own_session:
+                await session.close()
+        
+        for domain, standard_prices in lookups.items():
+            results[domain] = self.combine_prices(domain, scraped.get(domain), standard_prices)
+        
+        return results
+    
+    def get_cache_stats(self):
+        """Get HTTP cache hit ratio and bytes saved"""
+        return self.http_cache.get_stats()
     
     def compare_prices(self, domain):
         """Compare prices across all registrars"""
@@ -317,17 +370,24 @@ class EnhancedPriceScraper:
         
         return None
     
-    def get_historical_prices(self, domain):
-        """Simulate historical price data"""
-        current_price = self.get_domain_price(domain)['price']
-        
-        # Generate simulated historical data
-        historical = []
-        for i in range(30, 0, -1):  # Last 30 days
-            date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-            # Add some variation to simulate price changes
-            variation = random.uniform(-0.5, 0.5)
-            price = max(1.0, current_price + variation)
-            historical.append({'date': date, 'price': round(price, 2)})
-        
-        return historical
+    def get_historical_prices(self, domain, days=30):
+        """Get observed daily price history for a domain"""
+        end = datetime.now()
+        start = end - timedelta(days=days)
+        
+        history = self.price_history.get_daily(domain, start=start, end=end)
+        
+        # Standard names are only observed at TLD level
+        if not history:
+            extension = domain.split('.')[-1]
+            history = self.price_history.get_daily(f".{extension}", start=start, end=end)
+        
+        return [
+            {
+                'date': day['date'],
+                'price': day['mean'],
+                'min_price': day['min'],
+                'max_price': day['max']
+            }
+            for day in history
+        ]
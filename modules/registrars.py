@@ -0,0 +1,328 @@
+import os
+import time
+import xml.etree.ElementTree as ET
+from urllib.parse import urlencode
+import asyncio
+import threading
+from modules.price_extraction import PriceExtractor
+from modules.seeding import derive_rng
+
+class RateLimiter:
+    """Spaces requests to a registrar at most `rate` per second"""
+
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0
+        self.next_slot = 0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Reserve the next request slot and return the delay until it"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+            return slot - now
+
+    def wait(self):
+        """Block until the next slot"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """Sleep until the next slot without blocking the event loop"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class RegistrarPlugin:
+    """Base class for a registrar price source and its declared capabilities"""
+
+    name = None
+
+    # Search page scraped for a single domain; base_url can point at a mock server
+    base_url = None
+    search_path = None
+    selectors = []
+
+    # Capabilities the scheduler uses to drive this registrar
+    rate_limit = 1.0          # Requests per second, None for unlimited
+    max_concurrency = 2       # Simultaneous requests
+    supports_batch = False    # Multi-domain lookups in one request
+    batch_size = 1
+
+    def __init__(self, base_url=None, seed=None):
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+        self.seed = seed  # Run seed for reproducible local prices
+        self.limiter = RateLimiter(self.rate_limit)
+        self.extractor = PriceExtractor(self.selectors) if self.selectors else None
+
+    @property
+    def is_local(self):
+        """True if prices are computed without network requests"""
+        return self.search_path is None
+
+    def set_rate_limit(self, rate):
+        """Override the declared rate limit"""
+        self.rate_limit = rate
+        self.limiter = RateLimiter(rate)
+
+    def search_url(self, domain):
+        """Search page URL for a domain"""
+        return self.base_url + self.search_path.format(domain=domain)
+
+    def parse(self, content):
+        """Extract price from a search page"""
+        return self.extractor.extract(content)
+
+    def local_price(self, domain):
+        """Price computed without network requests (local registrars only)"""
+        return None
+
+    def get_price(self, session, domain):
+        """Sync price lookup through a requests session"""
+        if self.is_local:
+            return self.local_price(domain)
+
+        try:
+            self.limiter.wait()
+            response = session.get(self.search_url(domain), timeout=15)
+
+            if response.status_code == 200:
+                return self.parse(response.content)
+
+            return None
+
+        except Exception:
+            return None
+
+    async def fetch_async(self, session, domain, cache=None, headers=None):
+        """Async fetch of a search page, revalidating through an HTTPCache if given"""
+        url = self.search_url(domain)
+
+        # Session defaults plus per-request headers pick the variant of a Vary response
+        request_headers = dict(getattr(session, 'headers', None) or {}, **(headers or {}))
+
+        if cache:
+            cached = cache.get_fresh(url, request_headers)
+            if cached:
+                return cached[1]
+
+        conditional = cache.conditional_headers(url, request_headers) if cache else {}
+
+        await self.limiter.wait_async()
+
+        async with session.get(url, headers=dict(headers or {}, **conditional)) as response:
+            if response.status == 304 and cache:
+                body = cache.revalidated(url, response.headers, request_headers)
+                if body is not None or not conditional:
+                    return body
+                # The cached body was gone and the entry is dropped; the retry is unconditional
+            elif response.status == 200:
+                content = await response.read()
+                if cache:
+                    cache.store(url, response.headers, content, request_headers)
+                return content
+            else:
+                return None
+
+        return await self.fetch_async(session, domain, cache, headers)
+
+    async def get_price_async(self, session, domain, cache=None, headers=None):
+        """Async price lookup through a shared aiohttp session"""
+        if self.is_local:
+            return self.local_price(domain)
+
+        try:
+            content = await self.fetch_async(session, domain, cache, headers)
+            return self.parse(content) if content else None
+        except Exception:
+            return None
+
+    async def get_prices_batch_async(self, session, domains, cache=None, headers=None):
+        """Prices for many domains; concurrent single lookups unless overridden"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def limited(domain):
+            async with semaphore:
+                return await self.get_price_async(session, domain, cache, headers)
+
+        prices = await asyncio.gather(*[limited(domain) for domain in domains])
+        return dict(zip(domains, prices))
+
+    async def check_premium_async(self, session, domain):
+        """Premium price of one domain, or None if it is not premium"""
+        raise NotImplementedError(f"{self.name} has no premium check")
+
+    async def check_premiums_batch_async(self, session, domains):
+        """Premium check for up to batch_size domains: {domain: premium price or None}
+
+        Plugins with a multi-domain endpoint override this; the default checks domains one by one.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def limited(domain):
+            async with semaphore:
+                await self.limiter.wait_async()
+                return await self.check_premium_async(session, domain)
+
+        results = await asyncio.gather(*[limited(domain) for domain in domains], return_exceptions=True)
+        return {
+            domain: result for domain, result in zip(domains, results)
+            if not isinstance(result, Exception)
+        }
+
+class NamecheapRegistrar(RegistrarPlugin):
+    """Namecheap search page and domains.check API"""
+
+    name = 'namecheap'
+    base_url = "https://www.namecheap.com"
+    search_path = "/domains/registration/results/?domain={domain}"
+    selectors = ['.price', '.domain-price', '[data-cy="price"]', '.registration-price']
+    rate_limit = 0.5
+    max_concurrency = 2
+
+    # namecheap.domains.check takes up to 50 names per call
+    api_url = "https://api.namecheap.com/xml.response"
+    batch_size = 50
+
+    def __init__(self, base_url=None, seed=None):
+        super().__init__(base_url, seed)
+
+        self.api_params = {
+            'ApiUser': os.environ.get('NAMECHEAP_API_USER', ''),
+            'ApiKey': os.environ.get('NAMECHEAP_API_KEY', ''),
+            'UserName': os.environ.get('NAMECHEAP_API_USER', ''),
+            'ClientIp': os.environ.get('NAMECHEAP_CLIENT_IP', '127.0.0.1')
+        }
+
+        # A mock server serves the API next to the search pages
+        if base_url:
+            self.api_url = self.base_url + "/xml.response"
+
+        self.supports_batch = bool(base_url or self.api_params['ApiKey'])
+
+    async def check_premiums_batch_async(self, session, domains):
+        """Premium check through namecheap.domains.check"""
+        params = dict(self.api_params, Command='namecheap.domains.check', DomainList=','.join(domains))
+
+        await self.limiter.wait_async()
+
+        async with session.get(f"{self.api_url}?{urlencode(params)}") as response:
+            if response.status != 200:
+                return {}
+            return self.parse_check_response(await response.read())
+
+    def parse_check_response(self, content):
+        """Parse DomainCheckResult elements into {domain: premium price or None}"""
+        premiums = {}
+
+        for element in ET.fromstring(content).iter():
+            if not element.tag.endswith('DomainCheckResult'):
+                continue
+
+            domain = element.get('Domain', '').lower()
+            if element.get('IsPremiumName', 'false').lower() == 'true':
+                try:
+                    premiums[domain] = float(element.get('PremiumRegistrationPrice') or 0) or None
+                except ValueError:
+                    premiums[domain] = None
+            else:
+                premiums[domain] = None
+
+        return premiums
+
+class GoDaddyRegistrar(RegistrarPlugin):
+    """GoDaddy search page"""
+
+    name = 'godaddy'
+    base_url = "https://www.godaddy.com"
+    search_path = "/domainsearch/find?checkAvail=1&domainToCheck={domain}"
+    selectors = ['[data-cy="price-display"]', '.price-display', '.domain-price', '.price']
+    rate_limit = 0.5
+    max_concurrency = 2
+
+class NameSiloRegistrar(RegistrarPlugin):
+    """NameSilo search page"""
+
+    name = 'namesilo'
+    base_url = "https://www.namesilo.com"
+    search_path = "/domain/search-domains?query={domain}"
+    selectors = ['.domain_price', '.price', '.registration-price']
+    rate_limit = 1.0
+    max_concurrency = 3
+
+class PorkbunRegistrar(RegistrarPlugin):
+    """Porkbun pricing (often cheapest)"""
+
+    name = 'porkbun'
+    rate_limit = None
+    max_concurrency = 100
+
+    def local_price(self, domain):
+        # Porkbun has an API, simulate API call
+        extension = domain.split('.')[-1]
+        base_prices = {
+            'com': 8.99, 'net': 10.99, 'org': 12.99,
+            'ai': 65.99, 'io': 39.99, 'co': 29.99
+        }
+
+        base_price = base_prices.get(extension, 19.99)
+        # Add small random variation
+        price = base_price + derive_rng(self.seed, self.name, domain.lower()).uniform(-2, 5)
+        return round(price, 2)
+
+class HostingerRegistrar(RegistrarPlugin):
+    """Hostinger pricing"""
+
+    name = 'hostinger'
+    rate_limit = None
+    max_concurrency = 100
+
+    def local_price(self, domain):
+        # Hostinger often requires JavaScript, simulate realistic prices
+        extension = domain.split('.')[-1]
+        base_prices = {
+            'com': 9.99, 'net': 12.99, 'org': 14.99,
+            'ai': 79.99, 'io': 49.99, 'co': 32.99
+        }
+
+        base_price = base_prices.get(extension, 22.99)
+        price = base_price + derive_rng(self.seed, self.name, domain.lower()).uniform(-3, 7)
+        return round(price, 2)
+
+class CloudflareRegistrar(RegistrarPlugin):
+    """Cloudflare pricing (at-cost pricing)"""
+
+    name = 'cloudflare'
+    rate_limit = None
+    max_concurrency = 100
+
+    def local_price(self, domain):
+        # Cloudflare offers at-cost pricing, usually cheapest
+        extension = domain.split('.')[-1]
+        at_cost_prices = {
+            'com': 8.03, 'net': 9.06, 'org': 9.95,
+            'ai': 59.98, 'io': 34.50, 'co': 24.00
+        }
+
+        return at_cost_prices.get(extension, 15.00)
+
+# Registered plugins, in lookup order
+REGISTRAR_PLUGINS = [
+    NamecheapRegistrar,
+    GoDaddyRegistrar,
+    PorkbunRegistrar,
+    NameSiloRegistrar,
+    HostingerRegistrar,
+    CloudflareRegistrar
+]
+
+def create_registrars(base_urls=None, seed=None):
+    """Instantiate all registered plugins, optionally overriding base URLs"""
+    base_urls = base_urls or {}
+    return {
+        plugin.name: plugin(base_url=base_urls.get(plugin.name), seed=seed)
+        for plugin in REGISTRAR_PLUGINS
+    }
@@ -0,0 +1,120 @@
+import json
+import os
+import time
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+MISSING = object()
+
+class ScoreCache:
+    """Bounded cache with per-entry TTL and LRU eviction, optionally persisted"""
+
+    def __init__(self, max_size=10000, ttl=3600, cache_file=None, save_interval=60):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.save_interval = save_interval  # Seconds between automatic saves
+
+        self.entries = OrderedDict()  # {key: (value, stored_at)}, least recently used first
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expired': 0}
+
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._saved_at = time.time()
+
+        if self.cache_file:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.load()
+
+    def get(self, key, default=None):
+        """Get a live entry, counting the hit or miss"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.time() - entry[1] < self.ttl:
+                self.entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry[0]
+
+            if entry is not None:
+                del self.entries[key]
+                self.stats['expired'] += 1
+            self.stats['misses'] += 1
+            return default
+
+    def set(self, key, value):
+        """Store an entry, evicting the least recently used beyond max_size"""
+        with self._lock:
+            self.entries[key] = (value, time.time())
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats['evictions'] += 1
+            self._dirty = True
+
+        if self.cache_file and time.time() - self._saved_at >= self.save_interval:
+            self.save()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value, or compute and store it"""
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self.entries.clear()
+            self._dirty = True
+
+    def get_stats(self):
+        """Hit/miss counts and hit ratio"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return dict(
+                self.stats,
+                size=len(self.entries),
+                hit_ratio=round(self.stats['hits'] / lookups, 3) if lookups else 0.0
+            )
+
+    def load(self):
+        """Load unexpired entries from disk"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+        now = time.time()
+        with self._lock:
+            for key, value, stored_at in data.get('entries', []):
+                if now - stored_at < self.ttl:
+                    self.entries[key] = (value, stored_at)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+        return True
+
+    def save(self):
+        """Persist entries to disk if anything changed"""
+        if not self.cache_file:
+            return False
+
+        with self._lock:
+            if not self._dirty:
+                return True
+            data = {'entries': [[key, value, stored_at] for key, (value, stored_at) in self.entries.items()]}
+            self._dirty = False
+            self._saved_at = time.time()
+
+        try:
+            # Write to a temp file first so a crash never leaves a partial cache
+            temp_path = self.cache_file.with_suffix('.json.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_file)
+            return True
+        except Exception:
+            return False
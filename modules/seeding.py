@@ -0,0 +1,13 @@
+import random
+import hashlib
+
+def derive_seed(run_seed, *keys):
+    """Stable 64-bit seed for a run seed and keys such as component and domain"""
+    material = '|'.join(str(part) for part in (run_seed,) + keys)
+    return int.from_bytes(hashlib.sha256(material.encode('utf-8')).digest()[:8], 'big')
+
+def derive_rng(run_seed, *keys):
+    """Independent Random for (run seed, keys); the shared random module when unseeded"""
+    if run_seed is None:
+        return random
+    return random.Random(derive_seed(run_seed, *keys))
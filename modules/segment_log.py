@@ -0,0 +1,703 @@
+import io
+import os
+import json
+import shutil
+import itertools
+from pathlib import Path
+from datetime import datetime, timedelta
+import numpy as np
+from modules.file_lock import FileLock, atomic_write
+
+PARTITION_FORMATS = {'day': '%Y-%m-%d', 'month': '%Y-%m'}
+UNDATED = 'undated'  # Partition for records without a parseable timestamp
+CHECKPOINT_BYTES = 4 * 1024 * 1024  # Newest-segment bytes left unindexed on disk before checkpointing
+
+def read_snapshot(snapshot, reverse=False):
+    """Yield the records of a snapshot segment by segment, closing every segment handle"""
+    try:
+        for handle, wanted in snapshot:
+            with handle as f:
+                if reverse:
+                    # Newest first needs the segment's records in memory
+                    records = []
+                    offset = 0
+                    for line in f:
+                        if offset in wanted:
+                            records.append(json.loads(line))
+                        offset += len(line)
+                    yield from reversed(records)
+                else:
+                    offset = 0
+                    for line in f:
+                        if offset in wanted:
+                            yield json.loads(line)
+                        offset += len(line)
+    finally:
+        for handle, _ in snapshot:
+            handle.close()
+
+class SegmentLog:
+    """Append-only JSON Lines record log split into segments, with an in-memory offset index"""
+
+    def __init__(self, log_dir, max_segment_bytes=64 * 1024 * 1024):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+
+        # Writers in any process append and reserve ids under this lock
+        self.file_lock = FileLock(self.log_dir / ".lock")
+        self.ids_file = self.log_dir / "ids"  # Highest id reserved by any writer
+
+        # {record id: (segment number, byte offset)} of the live version of each record
+        self.offsets = {}
+        self.dead = 0  # Superseded records and tombstones awaiting compaction
+        self.max_id = 0
+
+        self._handle = None
+        self._active = None
+        self._known = ()  # Segment numbers as of the last scan
+        self._scanned = 0  # Bytes of the newest segment already indexed
+        self._inode = None  # Identity of the newest segment, to notice it being replaced
+        self._entries = []  # (id, offset, deleted) of the newest segment up to _scanned
+        self._checkpointed = 0  # Bytes of the newest segment covered by its checkpoint file
+
+        # Records other writers appended since take_changes(); None once the index was rebuilt
+        self._changes = []
+
+        self.load_index()
+        self.maybe_compact()
+
+    def segment_path(self, number):
+        return self.log_dir / f"segment-{number:06d}.jsonl"
+
+    def index_path(self, number):
+        return self.log_dir / f"segment-{number:06d}.idx.npy"
+
+    def checkpoint_path(self, number):
+        return self.log_dir / f"segment-{number:06d}.ckpt.npz"
+
+    def segments(self):
+        """Segment numbers in append order"""
+        return sorted(int(path.stem.split('-')[1]) for path in self.log_dir.glob("segment-*.jsonl"))
+
+    def load_index(self):
+        """Build the offset index: sealed segments from their sidecar, the newest from its checkpoint and a scan"""
+        with self.file_lock.shared():
+            max_id = self.max_id
+            self.offsets = {}
+            self.dead = 0
+            self.max_id = 0
+            self.close_handle()
+
+            numbers = self.segments()
+            for number in numbers[:-1]:
+                self.apply_entries(number, self.read_segment_index(number))
+            if numbers:
+                self.scan_newest(numbers[-1], self.load_checkpoint(numbers[-1]))
+            else:
+                self._scanned, self._inode = 0, None
+                self._entries, self._checkpointed = [], 0
+
+            self._known = tuple(numbers)
+            self._active = numbers[-1] if numbers else 1
+            self.max_id = max(self.max_id, max_id)  # Never hand out an id twice
+            self._changes = None
+
+    def apply_entries(self, number, entries):
+        """Add (id, offset, deleted) entries of a segment to the index"""
+        for record_id, offset, deleted in entries:
+            if record_id in self.offsets:
+                self.dead += 1
+            if deleted:
+                self.offsets.pop(record_id, None)
+                self.dead += 1
+            else:
+                self.offsets[record_id] = (number, offset)
+            self.max_id = max(self.max_id, record_id)
+
+    def scan_segment(self, number, start=0):
+        """([(offset, record), ...], end) for the complete lines from `start`"""
+        records = []
+        with open(self.segment_path(number), 'rb') as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Still being written, or torn by a crash
+                try:
+                    record = json.loads(line)
+                    int(record['id'])
+                    records.append((offset, record))
+                except (ValueError, KeyError, TypeError):
+                    pass
+                offset += len(line)
+        return records, offset
+
+    def scan_newest(self, number, start):
+        """Index the newest segment from `start`, returning the records found"""
+        if not start:
+            self._entries, self._checkpointed = [], 0
+        records, end = self.scan_segment(number, start)
+        entries = [(int(record['id']), offset, bool(record.get('_deleted'))) for offset, record in records]
+        self.apply_entries(number, entries)
+        self._entries.extend(entries)
+        self._scanned = end
+        self._inode = self.segment_path(number).stat().st_ino
+        self.maybe_checkpoint(number)
+        return [record for _, record in records]
+
+    def load_checkpoint(self, number):
+        """Index the newest segment up to its checkpoint, returning the offset to scan on from"""
+        self._entries, self._checkpointed = [], 0
+        try:
+            with np.load(self.checkpoint_path(number)) as checkpoint:
+                entries, end, inode = checkpoint['entries'], int(checkpoint['end']), int(checkpoint['inode'])
+            stat = self.segment_path(number).stat()
+        except (OSError, ValueError, KeyError):
+            return 0
+
+        # A segment replaced or cut short since invalidates its checkpoint
+        if stat.st_ino != inode or stat.st_size < end:
+            return 0
+
+        self._entries = entries.tolist()
+        self.apply_entries(number, self._entries)
+        self._checkpointed = end
+        return end
+
+    def write_checkpoint(self, number, entries, end):
+        """Persist the newest segment's index up to `end`, so reopening scans only what follows"""
+        try:
+            buffer = io.BytesIO()
+            np.savez(buffer, entries=np.asarray(entries, dtype=np.int64).reshape(-1, 3), end=end,
+                     inode=self.segment_path(number).stat().st_ino)
+            atomic_write(self.checkpoint_path(number), buffer.getvalue(), durable=False)
+        except OSError:
+            pass
+
+    def maybe_checkpoint(self, number):
+        """Checkpoint the newest segment once enough of it is indexed only in memory"""
+        if self._scanned - self._checkpointed >= CHECKPOINT_BYTES:
+            self.write_checkpoint(number, self._entries, self._scanned)
+            self._checkpointed = self._scanned
+
+    def read_segment_index(self, number):
+        """(id, offset, deleted) for every line of a sealed segment, from its sidecar when present"""
+        index_path = self.index_path(number)
+        if index_path.exists():
+            try:
+                return [(int(i), int(o), bool(d)) for i, o, d in np.load(index_path)]
+            except (OSError, ValueError):
+                pass
+
+        records, _ = self.scan_segment(number)
+        entries = [(int(record['id']), offset, bool(record.get('_deleted'))) for offset, record in records]
+        self.write_segment_index(number, entries)
+        return entries
+
+    def write_segment_index(self, number, entries):
+        """Persist a sealed segment's index so reopening skips parsing it"""
+        try:
+            temp_path = self.log_dir / f"segment-{number:06d}.idx.tmp.npy"
+            np.save(temp_path, np.asarray(entries, dtype=np.int64).reshape(-1, 3))
+            os.replace(temp_path, self.index_path(number))
+        except OSError:
+            pass
+
+    def poll(self):
+        """Catch up with appends, rollovers and rewrites by other writers"""
+        with self.file_lock.shared():
+            numbers = tuple(self.segments())
+            if numbers == self._known:
+                stat = self.segment_path(numbers[-1]).stat() if numbers else None
+                if not numbers or (stat.st_size == self._scanned and stat.st_ino == self._inode):
+                    return
+
+            # Only appends since the last scan: index just the new bytes
+            known = self._known
+            if known and numbers[:len(known)] == known and self.segment_path(known[-1]).stat().st_ino == self._inode:
+                appended = self.scan_newest(known[-1], self._scanned)
+                for number in numbers[len(known):]:
+                    appended += self.scan_newest(number, 0)
+
+                self._known = numbers
+                if self._active != numbers[-1]:
+                    self._active = numbers[-1]
+                    self.close_handle()
+                if self._changes is not None:
+                    self._changes.extend(appended)
+                return
+
+            self.load_index()
+
+    def take_changes(self):
+        """Records other writers appended since the last call, or None if the index was rebuilt"""
+        with self.file_lock.shared():
+            self.poll()
+            changes, self._changes = self._changes, []
+            return changes
+
+    def close_handle(self):
+        if self._handle is not None and not self._handle.closed:
+            self._handle.close()
+        self._handle = None
+
+    def open_active(self):
+        """Append handle on the active segment, rolling over when it is full; call under the lock"""
+        if self._handle is None:
+            self._handle = open(self.segment_path(self._active), 'a+b')
+            if self._known[-1:] != (self._active,):
+                # A segment this writer just created
+                self._known = self._known + (self._active,)
+                self._scanned = 0
+                self._inode = os.fstat(self._handle.fileno()).st_ino
+                self._entries, self._checkpointed = [], 0
+
+        end = self._handle.seek(0, os.SEEK_END)
+        if end >= self.max_segment_bytes:
+            self.close_handle()
+            # Seal it with a sidecar, from the in-memory entries when they cover the whole segment
+            if self._scanned == end:
+                self.write_segment_index(self._active, self._entries)
+            else:
+                self.read_segment_index(self._active)
+            self.checkpoint_path(self._active).unlink(missing_ok=True)
+            self._active += 1
+            return self.open_active()
+
+        return self._handle
+
+    def reserve_ids(self, count):
+        """Reserve `count` consecutive ids, unique across every writer of this log"""
+        with self.file_lock:
+            self.poll()
+            try:
+                reserved = int(self.ids_file.read_text() or 0)
+            except (FileNotFoundError, ValueError):
+                reserved = 0
+
+            first = max(reserved, self.max_id) + 1
+            self.max_id = first + count - 1
+            atomic_write(self.ids_file, str(self.max_id).encode(), durable=False)
+            return range(first, first + count)
+
+    def next_id(self):
+        """Reserve the next record id"""
+        return self.reserve_ids(1)[0]
+
+    def append(self, record):
+        """Append one record; it must carry an integer 'id'"""
+        return self.append_many([record])
+
+    def append_many(self, records):
+        """Append records with one write under the exclusive lock"""
+        with self.file_lock:
+            self.poll()
+            handle = self.open_active()
+
+            # Don't glue onto a line torn by a writer that crashed mid-append
+            offset = handle.seek(0, os.SEEK_END)
+            prefix = b''
+            if offset:
+                handle.seek(offset - 1)
+                if handle.read(1) != b'\n':
+                    prefix = b'\n'
+                    offset += 1
+
+            lines = []
+            for record in records:
+                line = (json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+                record_id = int(record['id'])
+                if record_id in self.offsets:
+                    self.dead += 1
+                self.offsets[record_id] = (self._active, offset)
+                self.max_id = max(self.max_id, record_id)
+                self._entries.append((record_id, offset, bool(record.get('_deleted'))))
+                offset += len(line)
+                lines.append(line)
+
+            handle.write(prefix + b''.join(lines))
+            handle.flush()
+            self._scanned = offset
+            self.maybe_checkpoint(self._active)
+            return len(lines)
+
+    def delete(self, record_ids):
+        """Tombstone records"""
+        with self.file_lock:
+            self.poll()
+            tombstones = [{'id': record_id, '_deleted': True} for record_id in record_ids if record_id in self.offsets]
+            if tombstones:
+                self.append_many(tombstones)
+                for tombstone in tombstones:
+                    self.offsets.pop(tombstone['id'], None)
+                self.dead += len(tombstones)  # The tombstone lines themselves
+
+            self.maybe_compact()
+            return len(tombstones)
+
+    def get(self, record_id):
+        """Read one record through the offset index"""
+        with self.file_lock.shared():
+            location = self.offsets.get(record_id)
+            if location is None:
+                return None
+
+            number, offset = location
+            with open(self.segment_path(number), 'rb') as f:
+                f.seek(offset)
+                return json.loads(f.readline())
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def snapshot(self, reverse=False):
+        """[(open segment, offsets of its live records)] in iteration order, taken under the shared lock
+
+        The open handles keep the segments readable after a rewrite unlinks them.
+        """
+        with self.file_lock.shared():
+            live = {}
+            for record_id, location in self.offsets.items():
+                live.setdefault(location[0], set()).add(location[1])
+            return [(open(self.segment_path(number), 'rb'), live[number]) for number in sorted(live, reverse=reverse)]
+
+    def iter_records(self, reverse=False):
+        """Live records in append order (or newest first), read from a snapshot without holding the lock"""
+        yield from read_snapshot(self.snapshot(reverse), reverse)
+
+    def tail(self, count):
+        """The last `count` live records, oldest first, read by offset"""
+        with self.file_lock.shared():
+            # The index is in append order, so the newest ids are at its end
+            ids = list(itertools.islice(reversed(self.offsets), count))[::-1] if count else []
+            return [record for record in (self.get(record_id) for record_id in ids) if record is not None]
+
+    def rewrite(self, keep=None):
+        """Rewrite the log keeping live records for which keep(record) is true; returns records dropped"""
+        with self.file_lock:
+            self.poll()
+            self.close_handle()
+
+            old_numbers = self.segments()
+            number = (old_numbers[-1] if old_numbers else 0) + 1
+            dropped = 0
+
+            temp_path = self.log_dir / f"segment-{number:06d}.jsonl.tmp"
+            out = open(temp_path, 'wb')
+            entries = []
+            offset = 0
+
+            def seal():
+                out.close()
+                os.replace(temp_path, self.segment_path(number))
+                self.write_segment_index(number, entries)
+
+            for record in self.iter_records():
+                if keep is not None and not keep(record):
+                    dropped += 1
+                    continue
+
+                line = (json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+                if offset and offset + len(line) > self.max_segment_bytes:
+                    seal()
+                    number += 1
+                    temp_path = self.log_dir / f"segment-{number:06d}.jsonl.tmp"
+                    out = open(temp_path, 'wb')
+                    entries, offset = [], 0
+
+                out.write(line)
+                entries.append((int(record['id']), offset, False))
+                offset += len(line)
+
+            seal()
+            self.write_checkpoint(number, entries, offset)
+
+            # New segments are complete on disk before the old ones go
+            for old in old_numbers:
+                self.segment_path(old).unlink(missing_ok=True)
+                self.index_path(old).unlink(missing_ok=True)
+                self.checkpoint_path(old).unlink(missing_ok=True)
+
+            self.load_index()
+            return dropped
+
+    def maybe_compact(self):
+        """Compact once dead entries outnumber live ones"""
+        if self.dead > max(1000, len(self.offsets)):
+            return self.compact()
+        return 0
+
+    def compact(self):
+        """Drop superseded records and tombstones"""
+        return self.rewrite()
+
+    def clear(self):
+        """Delete every segment"""
+        with self.file_lock:
+            self.close_handle()
+            for path in list(self.log_dir.glob("segment-*")):
+                path.unlink(missing_ok=True)
+            self.ids_file.unlink(missing_ok=True)
+            self.max_id = 0
+            self.load_index()
+
+    def size_bytes(self):
+        """Total size of all segments"""
+        return sum(path.stat().st_size for path in self.log_dir.glob("segment-*.jsonl"))
+
+    def close(self):
+        """Close the active segment"""
+        with self.file_lock:
+            self.close_handle()
+
+class PartitionedLog:
+    """Segment logs partitioned by day or month of a record timestamp, so whole periods can be dropped or skipped"""
+
+    def __init__(self, root_dir, time_field, granularity='month', max_segment_bytes=64 * 1024 * 1024):
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.time_field = time_field
+        self.granularity = granularity
+        self.max_segment_bytes = max_segment_bytes
+
+        # Shared while appending or reading, exclusive to reserve ids or drop partitions
+        self.file_lock = FileLock(self.root_dir / ".lock")
+        self.ids_file = self.root_dir / "ids"  # Ids are unique across partitions
+
+        self.partitions = {}  # {partition key: SegmentLog}
+        self.max_id = 0
+
+        # Records other writers added since take_changes(); None once the partitions were reloaded
+        self._changes = []
+
+        self.migrate_flat_log()
+        self.load_partitions()
+
+    def partition_key(self, record):
+        """Partition of a record, e.g. '2026-10' by month or '2026-10-19' by day"""
+        try:
+            return datetime.fromisoformat(str(record.get(self.time_field))).strftime(PARTITION_FORMATS[self.granularity])
+        except ValueError:
+            return UNDATED
+
+    def partition_bounds(self, key):
+        """(start, end) of the period a partition covers, end exclusive"""
+        if key == UNDATED:
+            return datetime.min, datetime.max
+
+        start = datetime.strptime(key, PARTITION_FORMATS[self.granularity])
+        if self.granularity == 'day':
+            return start, start + timedelta(days=1)
+        return start, (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+    def partition_keys(self):
+        """Partition directories on disk, oldest first"""
+        keys = []
+        for entry in os.scandir(self.root_dir):
+            if not entry.is_dir():
+                continue
+            try:
+                if entry.name != UNDATED:
+                    datetime.strptime(entry.name, PARTITION_FORMATS[self.granularity])
+                keys.append(entry.name)
+            except ValueError:
+                pass
+        return sorted(keys)
+
+    def open_partition(self, key):
+        """Open (or create) a partition; records already in it count as changes"""
+        log = SegmentLog(self.root_dir / key, self.max_segment_bytes)
+        log.take_changes()
+        if self._changes is not None and len(log):
+            self._changes.extend(log.iter_records())
+        self.partitions[key] = log
+        self.max_id = max(self.max_id, log.max_id)
+        return log
+
+    def load_partitions(self):
+        """Open every partition on disk"""
+        with self.file_lock.shared():
+            for log in self.partitions.values():
+                log.close_handle()
+            self.partitions = {}
+            for key in self.partition_keys():
+                self.open_partition(key)
+            self._changes = None
+
+    def migrate_flat_log(self):
+        """Move records of an unpartitioned log (segments directly in root_dir) into partitions, once"""
+        if not any(self.root_dir.glob("segment-*.jsonl")):
+            return
+
+        with FileLock(self.root_dir / ".migrate.lock"):
+            if not any(self.root_dir.glob("segment-*.jsonl")):
+                return  # Another process migrated it meanwhile
+
+            # Re-running after a crash is harmless: a record lands in the same partition under the same id
+            flat = SegmentLog(self.root_dir, self.max_segment_bytes)
+            records = flat.iter_records()
+            while True:
+                groups = {}
+                for record in itertools.islice(records, 10000):
+                    groups.setdefault(self.partition_key(record), []).append(record)
+                if not groups:
+                    break
+                for key, group in groups.items():
+                    (self.partitions.get(key) or self.open_partition(key)).append_many(group)
+
+            # The ids counter stays: it has the same name and meaning here
+            flat.close_handle()
+            for path in list(self.root_dir.glob("segment-*")):
+                path.unlink(missing_ok=True)
+
+    def poll(self):
+        """Catch up with partitions other writers created, appended to or dropped"""
+        with self.file_lock.shared():
+            keys = self.partition_keys()
+            for key in [key for key in self.partitions if key not in keys]:
+                log = self.partitions.pop(key)
+                log.close_handle()
+                log.file_lock.close()
+                self._changes = None
+
+            for key in keys:
+                if key not in self.partitions:
+                    self.open_partition(key)
+                    continue
+
+                log = self.partitions[key]
+                changes = log.take_changes()
+                if changes is None:
+                    self._changes = None
+                elif self._changes is not None:
+                    self._changes.extend(changes)
+                self.max_id = max(self.max_id, log.max_id)
+
+    def take_changes(self):
+        """Records other writers added since the last call, or None if partitions were reloaded or dropped"""
+        with self.file_lock.shared():
+            self.poll()
+            changes, self._changes = self._changes, []
+            return changes
+
+    def reserve_ids(self, count):
+        """Reserve `count` consecutive ids, unique across every partition and writer"""
+        with self.file_lock:
+            self.poll()
+            try:
+                reserved = int(self.ids_file.read_text() or 0)
+            except (FileNotFoundError, ValueError):
+                reserved = 0
+
+            first = max(reserved, self.max_id) + 1
+            self.max_id = first + count - 1
+            atomic_write(self.ids_file, str(self.max_id).encode(), durable=False)
+            return range(first, first + count)
+
+    def next_id(self):
+        """Reserve the next record id"""
+        return self.reserve_ids(1)[0]
+
+    def append(self, record):
+        """Append one record; it must carry an integer 'id'"""
+        return self.append_many([record])
+
+    def append_many(self, records):
+        """Append records to their partitions, one write per partition"""
+        groups = {}
+        for record in records:
+            groups.setdefault(self.partition_key(record), []).append(record)
+
+        with self.file_lock.shared():
+            self.poll()  # Forget partitions another writer dropped
+            for key, group in groups.items():
+                log = self.partitions.get(key) or self.open_partition(key)
+                log.append_many(group)
+                self.max_id = max(self.max_id, log.max_id)
+            return len(records)
+
+    def __len__(self):
+        return sum(len(log) for log in self.partitions.values())
+
+    def partition_counts(self):
+        """{partition key: live records} of non-empty partitions"""
+        return {key: len(log) for key, log in self.partitions.items() if len(log)}
+
+    def iter_records(self, reverse=False, since=None):
+        """Live records partition by partition (or newest first), skipping partitions that end before `since`
+
+        Every partition is snapshotted up front, so writers and drops don't wait for the reader.
+        """
+        with self.file_lock.shared():
+            snapshot = []
+            for key in sorted(self.partitions, reverse=reverse):
+                if since is None or self.partition_bounds(key)[1] > since:
+                    snapshot.extend(self.partitions[key].snapshot(reverse))
+        yield from read_snapshot(snapshot, reverse)
+
+    def tail(self, count):
+        """The last `count` live records, oldest first, from the newest partitions"""
+        with self.file_lock.shared():
+            records = []
+            for key in sorted(self.partitions, reverse=True):
+                if len(records) >= count:
+                    break
+                records = self.partitions[key].tail(count - len(records)) + records
+            return records
+
+    def drop_before(self, cutoff, keep=None):
+        """Delete partitions that end by `cutoff` whole, and rewrite the one spanning it with keep(record)
+
+        Returns {partition key: records removed} for every partition touched.
+        """
+        with self.file_lock:
+            self.poll()
+            removed = {}
+            for key in sorted(self.partitions):
+                start, end = self.partition_bounds(key)
+                if end <= cutoff:
+                    # Expired as a whole: no record is read
+                    log = self.partitions.pop(key)
+                    removed[key] = len(log)
+                    log.close_handle()
+                    log.file_lock.close()
+                    shutil.rmtree(log.log_dir, ignore_errors=True)
+                elif start <= cutoff and key != UNDATED and keep is not None:
+                    removed[key] = self.partitions[key].rewrite(keep)
+            return removed
+
+    def clear(self):
+        """Delete every partition"""
+        with self.file_lock:
+            self.poll()
+            for log in self.partitions.values():
+                log.close_handle()
+                log.file_lock.close()
+                shutil.rmtree(log.log_dir, ignore_errors=True)
+            self.partitions = {}
+            self.ids_file.unlink(missing_ok=True)
+            self.max_id = 0
+            self._changes = None
+
+    def segment_count(self):
+        """Segments across all partitions"""
+        return sum(len(log.segments()) for log in self.partitions.values())
+
+    def size_bytes(self):
+        """Total size of all partitions"""
+        return sum(log.size_bytes() for log in self.partitions.values())
+
+    def last_modified(self):
+        """Modification time of the newest segment, as a timestamp"""
+        for key in sorted(self.partitions, reverse=True):
+            numbers = self.partitions[key].segments()
+            if numbers:
+                return self.partitions[key].segment_path(numbers[-1]).stat().st_mtime
+        return self.root_dir.stat().st_mtime
+
+    def close(self):
+        """Close every partition's active segment"""
+        with self.file_lock.shared():
+            for log in self.partitions.values():
+                log.close()
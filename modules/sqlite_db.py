@@ -0,0 +1,402 @@
+import io
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+import streamlit as st
+from modules import data_transfer
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS domains (
+    id INTEGER PRIMARY KEY,
+    domain TEXT,
+    extension TEXT,
+    price REAL NOT NULL DEFAULT 0,
+    trend_score REAL NOT NULL DEFAULT 0,
+    saved_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_domains_price ON domains (price);
+CREATE INDEX IF NOT EXISTS idx_domains_extension ON domains (extension);
+-- Extension filters usually come with a price cap
+CREATE INDEX IF NOT EXISTS idx_domains_extension_price ON domains (extension, price);
+CREATE INDEX IF NOT EXISTS idx_domains_trend_score ON domains (trend_score);
+CREATE INDEX IF NOT EXISTS idx_domains_saved_at ON domains (saved_at);
+
+CREATE TABLE IF NOT EXISTS searches (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_searches_timestamp ON searches (timestamp);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Statements are fixed strings with placeholders so sqlite3's statement cache reuses them
+INSERT_DOMAIN = "INSERT INTO domains (domain, extension, price, trend_score, saved_at, data) VALUES (?, ?, ?, ?, ?, ?)"
+UPDATE_DOMAIN_DATA = "UPDATE domains SET data = ? WHERE id = ?"
+INSERT_SEARCH = "INSERT INTO searches (timestamp, data) VALUES (?, ?)"
+UPDATE_SEARCH_DATA = "UPDATE searches SET data = ? WHERE id = ?"
+INCREMENT_COUNTER = (
+    "INSERT INTO counters (name, value) VALUES (?, ?) "
+    "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value"
+)
+
+# Filter name -> SQL condition on an indexed column
+DOMAIN_FILTERS = {
+    'max_price': "price <= ?",
+    'extension': "extension = ?",
+    'min_trend_score': "trend_score >= ?",
+    'date_from': "saved_at >= ?"
+}
+
+class SQLiteDB:
+    """SQLite-backed database with the EnhancedFileDB interface"""
+
+    def __init__(self, data_dir="data", db_file=None):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(exist_ok=True)
+        self.db_file = Path(db_file) if db_file else self.data_dir / "domains.db"
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            self.db_file,
+            check_same_thread=False,  # Streamlit reruns on different threads; access goes through the lock
+            cached_statements=256
+        )
+        self.conn.row_factory = sqlite3.Row
+
+        self.init_db()
+
+    def init_db(self):
+        """Create tables and indexes, and enable WAL"""
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.commit()
+
+    def close(self):
+        """Close the connection"""
+        with self._lock:
+            self.conn.close()
+
+    def save_domain(self, domain_data):
+        """Save domain to database"""
+        return self.save_domains([domain_data])
+
+    def save_domains(self, domains, preserve_timestamps=False):
+        """Save a batch of domains in one transaction"""
+        try:
+            saved_at = datetime.now().isoformat()
+
+            with self._lock, self.conn:
+                for domain_data in domains:
+                    if not (preserve_timestamps and domain_data.get('saved_at')):
+                        domain_data['saved_at'] = saved_at
+                    cursor = self.conn.execute(INSERT_DOMAIN, (
+                        domain_data.get('domain'),
+                        domain_data.get('extension'),
+                        domain_data.get('price') or 0,
+                        domain_data.get('trend_score') or 0,
+                        domain_data['saved_at'],
+                        '{}'
+                    ))
+
+                    # The row id is the domain id; store the record with it
+                    domain_data['id'] = cursor.lastrowid
+                    self.conn.execute(UPDATE_DOMAIN_DATA, (json.dumps(domain_data, default=str), cursor.lastrowid))
+
+                self.conn.execute(INCREMENT_COUNTER, ('total_domains_found', len(domains)))
+
+            return True
+
+        except Exception as e:
+            st.error(f"Error saving domains: {e}")
+            return False
+
+    def get_domains(self, limit=None, filters=None):
+        """Get domains with optional filtering"""
+        try:
+            conditions = []
+            params = []
+            for name, value in (filters or {}).items():
+                if name not in DOMAIN_FILTERS:
+                    continue
+                if name == 'date_from':
+                    value = datetime.fromisoformat(value).isoformat()
+                conditions.append(DOMAIN_FILTERS[name])
+                params.append(value)
+
+            query = "SELECT data FROM domains"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+
+            if limit:
+                # Most recent, returned oldest first like the file database
+                query += " ORDER BY id DESC LIMIT ?"
+                params.append(limit)
+            else:
+                query += " ORDER BY id"
+
+            with self._lock:
+                rows = self.conn.execute(query, params).fetchall()
+
+            domains = [json.loads(row['data']) for row in rows]
+            if limit:
+                domains.reverse()
+            return domains
+
+        except Exception as e:
+            st.error(f"Error getting domains: {e}")
+            return []
+
+    def save_search(self, search_data):
+        """Save search history"""
+        return self.save_searches([search_data])
+
+    def save_searches(self, searches, preserve_timestamps=False):
+        """Save a batch of searches in one transaction"""
+        try:
+            timestamp = datetime.now().isoformat()
+
+            with self._lock, self.conn:
+                for search_data in searches:
+                    if not (preserve_timestamps and search_data.get('timestamp')):
+                        search_data['timestamp'] = timestamp
+                    cursor = self.conn.execute(INSERT_SEARCH, (search_data['timestamp'], '{}'))
+                    search_data['id'] = cursor.lastrowid
+                    self.conn.execute(UPDATE_SEARCH_DATA, (json.dumps(search_data, default=str), cursor.lastrowid))
+
+                self.conn.execute(INCREMENT_COUNTER, ('total_searches', len(searches)))
+                self.conn.execute(INCREMENT_COUNTER, (
+                    'total_domains_checked', sum(search.get('domains_checked', 0) for search in searches)
+                ))
+
+            return True
+
+        except Exception as e:
+            st.error(f"Error saving searches: {e}")
+            return False
+
+    def get_searches(self, limit=None):
+        """Get search history"""
+        try:
+            with self._lock:
+                if limit:
+                    rows = self.conn.execute("SELECT data FROM searches ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+                    rows.reverse()
+                else:
+                    rows = self.conn.execute("SELECT data FROM searches ORDER BY id").fetchall()
+
+            return [json.loads(row['data']) for row in rows]
+
+        except Exception as e:
+            st.error(f"Error getting searches: {e}")
+            return []
+
+    def get_counters(self):
+        """Get running totals"""
+        with self._lock:
+            return {row['name']: row['value'] for row in self.conn.execute("SELECT name, value FROM counters")}
+
+    def get_analytics(self):
+        """Get analytics data, aggregated in SQL"""
+        try:
+            counters = self.get_counters()
+
+            with self._lock:
+                summary = self.conn.execute(
+                    "SELECT COUNT(*) AS total, "
+                    "AVG(NULLIF(price, 0)) AS avg_price, MIN(NULLIF(price, 0)) AS min_price, MAX(NULLIF(price, 0)) AS max_price, "
+                    "AVG(NULLIF(trend_score, 0)) AS avg_trend_score "
+                    "FROM domains"
+                ).fetchone()
+                extensions = self.conn.execute(
+                    "SELECT COALESCE(extension, 'unknown') AS extension, COUNT(*) AS count FROM domains GROUP BY 1"
+                ).fetchall()
+                price_ranges = self.conn.execute(
+                    "SELECT "
+                    "SUM(price < 20) AS under_20, "
+                    "SUM(price >= 20 AND price < 50) AS '20_to_50', "
+                    "SUM(price >= 50 AND price < 100) AS '50_to_100', "
+                    "SUM(price >= 100) AS over_100 "
+                    "FROM domains"
+                ).fetchone()
+                trend_ranges = self.conn.execute(
+                    "SELECT "
+                    "SUM(trend_score < 40) AS low_0_40, "
+                    "SUM(trend_score >= 40 AND trend_score < 70) AS medium_40_70, "
+                    "SUM(trend_score >= 70 AND trend_score < 90) AS high_70_90, "
+                    "SUM(trend_score >= 90) AS excellent_90_100 "
+                    "FROM domains"
+                ).fetchone()
+
+            if not summary['total']:
+                return {
+                    'total_domains': 0,
+                    'total_searches': counters.get('total_searches', 0),
+                    'total_checked': counters.get('total_domains_checked', 0),
+                    'avg_price': 0,
+                    'avg_trend_score': 0,
+                    'min_price': 0,
+                    'max_price': 0,
+                    'extensions_distribution': {},
+                    'recent_domains': [],
+                    'price_ranges': {},
+                    'trend_score_ranges': {}
+                }
+
+            return {
+                'total_domains': summary['total'],
+                'total_searches': counters.get('total_searches', 0),
+                'total_checked': counters.get('total_domains_checked', 0),
+                'avg_price': summary['avg_price'] or 0,
+                'avg_trend_score': summary['avg_trend_score'] or 0,
+                'min_price': summary['min_price'] or 0,
+                'max_price': summary['max_price'] or 0,
+                'extensions_distribution': {row['extension']: row['count'] for row in extensions},
+                'recent_domains': self.get_domains(limit=10),
+                'price_ranges': {key: price_ranges[key] or 0 for key in price_ranges.keys()},
+                'trend_score_ranges': {key: trend_ranges[key] or 0 for key in trend_ranges.keys()}
+            }
+
+        except Exception as e:
+            st.error(f"Error getting analytics: {e}")
+            return {}
+
+    def iter_rows(self, table):
+        """Stored records of a table in id order, fetched a chunk at a time"""
+        last_id = 0
+        while True:
+            # Keyset pagination; the lock is not held between chunks
+            with self._lock:
+                rows = self.conn.execute(
+                    f"SELECT id, data FROM {table} WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, data_transfer.CHUNK_SIZE)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield json.loads(row['data'])
+            last_id = rows[-1]['id']
+
+    def iter_domain_records(self):
+        """Every domain, streamed in chunks"""
+        return self.iter_rows('domains')
+
+    def iter_search_records(self):
+        """Every search, streamed in chunks"""
+        return self.iter_rows('searches')
+
+    def iter_export(self, format='jsonl', chunk_size=data_transfer.CHUNK_SIZE):
+        """Stream an export as JSON Lines or CSV text chunks with bounded memory"""
+        return data_transfer.iter_export(self, format, chunk_size)
+
+    def export_to_file(self, path, format='jsonl'):
+        """Stream an export into a file; returns the bytes written"""
+        try:
+            return data_transfer.export_to_file(self, path, format)
+        except Exception as e:
+            st.error(f"Error exporting data: {e}")
+            return 0
+
+    def import_stream(self, lines, format='jsonl', batch_size=data_transfer.CHUNK_SIZE):
+        """Import a JSON Lines or CSV file (or any iterable of lines), committing in batches"""
+        try:
+            return data_transfer.import_records(self, lines, format, batch_size)
+        except Exception as e:
+            st.error(f"Error importing data: {e}")
+            return None
+
+    def export_data(self, format='json'):
+        """Export all data"""
+        try:
+            if format in ('jsonl', 'csv'):
+                return ''.join(self.iter_export(format)) or "No data to export"
+
+            all_data = {
+                'domains': self.get_domains(),
+                'searches': self.get_searches(),
+                'analytics': self.get_analytics(),
+                'exported_at': datetime.now().isoformat()
+            }
+
+            if format == 'json':
+                return json.dumps(all_data, indent=2, default=str)
+
+        except Exception as e:
+            st.error(f"Error exporting data: {e}")
+            return None
+
+    def import_data(self, data, format='json'):
+        """Import data from external source"""
+        try:
+            if format in ('jsonl', 'csv'):
+                return self.import_stream(io.StringIO(data) if isinstance(data, str) else data, format) is not None
+
+            if format == 'json':
+                imported_data = json.loads(data) if isinstance(data, str) else data
+
+                # Import domains and searches in batches, keeping their timestamps
+                for chunk in data_transfer.iter_chunks(imported_data.get('domains', [])):
+                    self.save_domains(chunk, preserve_timestamps=True)
+                for chunk in data_transfer.iter_chunks(imported_data.get('searches', [])):
+                    self.save_searches(chunk, preserve_timestamps=True)
+
+                return True
+
+        except Exception as e:
+            st.error(f"Error importing data: {e}")
+            return False
+
+    def cleanup_old_data(self, days_old=30):
+        """Clean up old data"""
+        try:
+            cutoff = (datetime.now() - timedelta(days=days_old)).isoformat()
+
+            with self._lock, self.conn:
+                cleaned_count = self.conn.execute("DELETE FROM domains WHERE saved_at <= ?", (cutoff,)).rowcount
+                self.conn.execute("DELETE FROM searches WHERE timestamp <= ?", (cutoff,))
+
+            return cleaned_count
+
+        except Exception as e:
+            st.error(f"Error cleaning up data: {e}")
+            return 0
+
+    def clear(self):
+        """Delete all domains and searches"""
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM domains")
+                self.conn.execute("DELETE FROM searches")
+            return True
+        except Exception as e:
+            st.error(f"Error clearing database: {e}")
+            return False
+
+    def get_database_stats(self):
+        """Get database statistics"""
+        try:
+            stats = {}
+
+            for file_path in [self.db_file, self.db_file.with_name(self.db_file.name + '-wal')]:
+                if file_path.exists():
+                    file_size = file_path.stat().st_size
+                    stats[file_path.name] = {
+                        'size_bytes': file_size,
+                        'size_kb': round(file_size / 1024, 2),
+                        'last_modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    }
+
+            return stats
+
+        except Exception as e:
+            st.error(f"Error getting database stats: {e}")
+            return {}
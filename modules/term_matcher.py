@@ -0,0 +1,72 @@
+from collections import deque
+
+class TermMatcher:
+    """Aho-Corasick automaton matching many tagged terms in one pass"""
+
+    def __init__(self):
+        self.goto = [{}]      # Trie transitions per node
+        self.fail = [0]       # Failure link per node
+        self.output = [[]]    # (term, tag) pairs ending at each node
+        self.terms = set()
+        self.built = False
+
+    def add(self, term, tag):
+        """Add a term under a tag; the same term can carry several tags"""
+        term = term.lower()
+        node = 0
+        for char in term:
+            if char not in self.goto[node]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[node][char] = len(self.goto) - 1
+            node = self.goto[node][char]
+
+        self.output[node].append((term, tag))
+        self.terms.add(term)
+        self.built = False
+
+    def add_terms(self, terms, tag):
+        """Add every term of a list under one tag"""
+        for term in terms:
+            self.add(term, tag)
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them"""
+        queue = deque()
+        for node in self.goto[0].values():
+            self.fail[node] = 0
+            queue.append(node)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+        self.built = True
+
+    def match(self, text):
+        """Scan text once: {tag: set of matched terms}"""
+        if not self.built:
+            self.build()
+
+        matches = {}
+        node = 0
+        for char in text.lower():
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+
+            for term, tag in self.output[node]:
+                matches.setdefault(tag, set()).add(term)
+
+        return matches
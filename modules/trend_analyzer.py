@@ -1,31 +1,43 @@
 import requests
-import random
 import time
 from datetime import datetime, timedelta
 import json
 from textblob import TextBlob
 import numpy as np
+import pandas as pd
 import streamlit as st
+from modules.term_matcher import TermMatcher
+from modules.score_cache import ScoreCache
+from modules.seeding import derive_rng
 
 class EnhancedTrendAnalyzer:
     """Enhanced trend analysis for domain keywords"""
     
-    def __init__(self):
-        self.trending_cache = {}
+    def __init__(self, cache_file=None, cache_size=10000, trends_backend=None, seed=None,
+                 mention_index=None, competitor_finder=None):
         self.cache_duration = 3600  # 1 hour cache
         
-    def calculate_trend_score(self, keyword):
-        """Calculate comprehensive trend score (0-100)"""
-        scores = {
-            'search_volume': self.get_search_volume_score(keyword),
-            'social_mentions': self.get_social_media_score(keyword),
-            'news_mentions': self.get_news_mention_score(keyword),
-            'commercial_intent': self.get_commercial_intent_score(keyword),
-            'growth_trend': self.get_growth_trend_score(keyword)
-        }
+        # Run seed for reproducible scores; None draws from the shared random module
+        self.seed = seed
+        
+        # Optional TrendsBackend for real search interest instead of simulated scores
+        self.trends_backend = trends_backend
+        
+        # Optional MentionIndex over local news and social dumps
+        self.mention_index = mention_index
         
-        # Weighted average
-        weights = {
+        # Optional CompetitorFinder for real variant discovery over DNS
+        self.competitor_finder = competitor_finder
+        
+        # Trend, brandability and market value results, persisted if cache_file is given
+        self.trending_cache = ScoreCache(
+            max_size=cache_size,
+            ttl=self.cache_duration,
+            cache_file=cache_file
+        )
+        
+        # Weighted average of the trend components
+        self.weights = {
             'search_volume': 0.25,
             'social_mentions': 0.20,
             'news_mentions': 0.20,
@@ -33,22 +45,362 @@ class EnhancedTrendAnalyzer:
             'growth_trend': 0.15
         }
         
-        total_score = sum(scores[key] * weights[key] for key in scores if scores[key] is not None)
-        return min(100, max(0, int(total_score)))
-    
-    def get_search_volume_score(self, keyword):
-        """Estimate search volume score"""
-        # Simulate search volume based on keyword characteristics
-        base_score = random.randint(30, 80)
+        # Relative cost of computing each component, used to order early-exit scoring
+        self.component_costs = {
+            'search_volume': 1,
+            'social_mentions': 1,
+            'news_mentions': 1,
+            'commercial_intent': 1,
+            'growth_trend': 1
+        }
         
-        # High-value keywords get bonus
-        high_value_terms = [
+        # Components served by the trends backend when one is set
+        self.backend_components = ('search_volume', 'growth_trend')
+        
+        # High-value keywords get a search volume bonus
+        self.high_value_terms = [
             'ai', 'crypto', 'nft', 'web3', 'blockchain', 'defi',
             'health', 'fitness', 'finance', 'invest', 'tech', 'app'
         ]
         
-        if any(term in keyword.lower() for term in high_value_terms):
-            base_score += random.randint(10, 20)
+        # Trending topics get more social mentions
+        self.trending_keywords = [
+            'ai', 'chatgpt', 'crypto', 'bitcoin', 'nft', 'web3',
+            'metaverse', 'sustainability', 'climate', 'remote'
+        ]
+        
+        # Tech and finance keywords often in news
+        self.news_heavy_topics = [
+            'ai', 'artificial', 'intelligence', 'crypto', 'bitcoin',
+            'climate', 'health', 'finance', 'economy', 'tech'
+        ]
+        
+        self.commercial_indicators = [
+            'buy', 'purchase', 'price', 'cost', 'cheap', 'discount',
+            'deal', 'sale', 'shop', 'store', 'market', 'service',
+            'product', 'solution', 'software', 'app', 'tool', 'platform'
+        ]
+        
+        # Industry-specific commercial terms
+        self.industry_terms = {
+            'tech': ['app', 'software', 'platform', 'tool', 'api', 'saas'],
+            'health': ['care', 'treatment', 'therapy', 'supplement', 'service'],
+            'finance': ['invest', 'trading', 'bank', 'pay', 'fund', 'wealth']
+        }
+        
+        # Growth categories in priority order, with their score ranges
+        self.growth_categories = {
+            'explosive': ['ai', 'chatgpt', 'nft', 'web3', 'metaverse'],
+            'strong': ['crypto', 'defi', 'sustainability', 'remote', 'digital'],
+            'steady': ['health', 'fitness', 'finance', 'tech', 'app'],
+            'declining': ['flash', 'cd', 'dvd', 'fax']
+        }
+        self.growth_score_ranges = {
+            'explosive': (85, 100),
+            'strong': (70, 90),
+            'steady': (50, 75),
+            'declining': (10, 40)
+        }
+        
+        # Market value multipliers by extension
+        self.extension_multipliers = {
+            'com': 3.0,
+            'ai': 2.5,
+            'io': 2.0,
+            'co': 1.8,
+            'net': 1.5,
+            'org': 1.3,
+            'tech': 1.4,
+            'app': 1.6,
+            'dev': 1.3
+        }
+        
+        # Dictionary words that make a keyword more brandable
+        self.common_words = [
+            'smart', 'quick', 'fast', 'easy', 'simple', 'pro', 'max',
+            'ultra', 'super', 'mega', 'best', 'top', 'prime', 'elite'
+        ]
+        
+        # Market value multipliers for industry keywords, first match wins
+        self.industry_bonuses = {
+            'ai': 1.5,
+            'crypto': 1.4,
+            'health': 1.3,
+            'finance': 1.3,
+            'tech': 1.2
+        }
+        
+        self.term_matcher = self.build_term_matcher()
+        
+    def build_term_matcher(self):
+        """Compile every term list into one automaton tagged by list and category"""
+        matcher = TermMatcher()
+        matcher.add_terms(self.high_value_terms, 'high_value')
+        matcher.add_terms(self.trending_keywords, 'trending')
+        matcher.add_terms(self.news_heavy_topics, 'news')
+        matcher.add_terms(self.commercial_indicators, 'commercial')
+        for industry, terms in self.industry_terms.items():
+            matcher.add_terms(terms, ('industry', industry))
+        for category, terms in self.growth_categories.items():
+            matcher.add_terms(terms, ('growth', category))
+        for industry in self.industry_bonuses:
+            matcher.add(industry, ('industry_bonus', industry))
+        matcher.build()
+        return matcher
+    
+    def match_terms(self, keyword):
+        """All term-list matches for a keyword in a single pass"""
+        return self.term_matcher.match(keyword)
+    
+    def get_search_interest(self, keyword):
+        """Real search interest summary for a keyword, or None without a backend"""
+        if not self.trends_backend:
+            return None
+        try:
+            return self.trends_backend.get_interest(keyword)
+        except Exception:
+            return None
+    
+    def prefetch_trends(self, keywords, min_score=None):
+        """Fetch search interest for many keywords in full payloads ahead of scoring"""
+        if not self.trends_backend:
+            return {}
+        if min_score is not None:
+            # Skip keywords the local components already rule out
+            keywords = [keyword for keyword in keywords if self.local_trend_ceiling(keyword) >= min_score]
+        try:
+            return self.trends_backend.get_interest_many(keywords)
+        except Exception:
+            return {}
+    
+    def cache_key(self, kind, *parts):
+        """Score cache key; seeded runs never share entries with other seeds"""
+        if self.seed is not None:
+            parts = (f"seed={self.seed}",) + parts
+        return '|'.join(str(part) for part in (kind,) + parts)
+    
+    def get_cache_stats(self):
+        """Score cache hit/miss statistics"""
+        return self.trending_cache.get_stats()
+    
+    def save_cache(self):
+        """Persist the score cache, if it has a cache file"""
+        return self.trending_cache.save()
+    
+    def get_component_costs(self):
+        """Relative cost of each trend component; network-backed ones cost the most"""
+        costs = dict(self.component_costs)
+        if self.trends_backend:
+            for name in self.backend_components:
+                costs[name] = 100
+        return costs
+    
+    def get_component_score(self, name, keyword, matches=None):
+        """Score one trend component, cached per keyword"""
+        scorers = {
+            'search_volume': self.get_search_volume_score,
+            'social_mentions': self.get_social_media_score,
+            'news_mentions': self.get_news_mention_score,
+            'commercial_intent': self.get_commercial_intent_score,
+            'growth_trend': self.get_growth_trend_score
+        }
+        return self.trending_cache.get_or_compute(
+            self.cache_key(name, keyword.lower()),
+            lambda: scorers[name](keyword, matches)
+        )
+    
+    def iter_trend_bounds(self, keyword, matches=None):
+        """Yield (lowest, highest) reachable trend score after each component, cheapest first"""
+        if matches is None:
+            matches = self.match_terms(keyword)
+        
+        # Cheapest components first, heaviest first among equals
+        costs = self.get_component_costs()
+        order = sorted(self.weights, key=lambda name: (costs[name], -self.weights[name]))
+        
+        total_score = 0.0
+        remaining = sum(self.weights.values()) * 100
+        for name in order:
+            total_score += self.get_component_score(name, keyword, matches) * self.weights[name]
+            remaining -= self.weights[name] * 100
+            yield min(100, max(0, int(total_score))), min(100, max(0, int(total_score + remaining)))
+    
+    def calculate_trend_score(self, keyword, min_score=None, matches=None):
+        """Calculate comprehensive trend score (0-100), or None once min_score is unreachable"""
+        key = self.cache_key('trend', keyword.lower())
+        cached = self.trending_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        score = 0
+        for score, highest in self.iter_trend_bounds(keyword, matches):
+            # Even perfect scores on the remaining components cannot reach the threshold
+            if min_score is not None and highest < min_score:
+                return None
+        
+        self.trending_cache.set(key, score)
+        return score
+    
+    def local_trend_ceiling(self, keyword):
+        """Highest reachable trend score using only components that need no trends lookup"""
+        matches = self.match_terms(keyword)
+        total_score = 0.0
+        for name, weight in self.weights.items():
+            if name in self.backend_components:
+                total_score += 100 * weight
+            else:
+                total_score += self.get_component_score(name, keyword, matches) * weight
+        return min(100, max(0, int(total_score)))
+    
+    def meets_trend_threshold(self, keyword, min_score):
+        """True if the trend score reaches min_score, stopping as soon as the outcome is certain"""
+        cached = self.trending_cache.get(self.cache_key('trend', keyword.lower()))
+        if cached is not None:
+            return cached >= min_score
+        
+        for lowest, highest in self.iter_trend_bounds(keyword):
+            if lowest >= min_score:
+                return True
+            if highest < min_score:
+                return False
+        
+        return False
+    
+    def get_keyword_features(self, keyword, include_trend=True, min_trend_score=None):
+        """Per-keyword features computed once and shared by every extension and scorer"""
+        matches = self.match_terms(keyword)
+        
+        industry_bonus = 1.0
+        for industry, bonus in self.industry_bonuses.items():
+            if ('industry_bonus', industry) in matches:
+                industry_bonus = bonus
+                break
+        
+        # None when the keyword cannot reach min_trend_score
+        trend_score = None
+        if include_trend:
+            trend_score = self.calculate_trend_score(keyword, min_trend_score, matches)
+        
+        return {
+            'keyword': keyword,
+            'length': len(keyword),
+            'matches': matches,
+            'industry_bonus': industry_bonus,
+            'brandability_score': self.calculate_brandability_score(keyword),
+            'trend_score': trend_score
+        }
+    
+    def build_term_matrix(self, keywords, terms):
+        """Boolean matrix: [keyword, term] is True if term occurs in keyword"""
+        lowered = np.char.lower(np.asarray(keywords, dtype=str))
+        matrix = np.empty((len(lowered), len(terms)), dtype=bool)
+        for column, term in enumerate(terms):
+            matrix[:, column] = np.char.find(lowered, term) >= 0
+        return matrix
+    
+    def calculate_trend_scores(self, keywords, rng=None):
+        """Vectorized calculate_trend_score over a batch of keywords"""
+        rng = rng or np.random.default_rng()
+        keywords = list(keywords)
+        count = len(keywords)
+        if not count:
+            return np.empty(0, dtype=np.int64)
+        
+        if self.trends_backend:
+            self.prefetch_trends(keywords)
+        
+        # Seeded draws are derived per keyword, so seeded runs score exactly as calculate_trend_score
+        if self.seed is not None:
+            return np.fromiter((self.calculate_trend_score(keyword) for keyword in keywords), dtype=np.int64, count=count)
+        
+        # Components with a real source come from the same per-keyword scorers as calculate_trend_score
+        per_keyword = set()
+        if self.trends_backend:
+            per_keyword.update(self.backend_components)
+        if self.mention_index and self.mention_index.term_count:
+            per_keyword.update(['social_mentions', 'news_mentions'])
+        
+        # One match matrix over every distinct term, sliced per term list
+        terms = sorted(self.term_matcher.terms)
+        column = {term: index for index, term in enumerate(terms)}
+        matches = self.build_term_matrix(keywords, terms)
+        
+        def any_match(term_list):
+            return matches[:, [column[term] for term in term_list]].any(axis=1)
+        
+        lengths = np.fromiter((len(keyword) for keyword in keywords), dtype=np.int64, count=count)
+        components = {}
+        
+        for name in per_keyword:
+            components[name] = np.fromiter(
+                (self.get_component_score(name, keyword) for keyword in keywords), dtype=np.int64, count=count
+            )
+        
+        # Search volume
+        if 'search_volume' not in components:
+            search_volume = rng.integers(30, 81, count)
+            search_volume += np.where(any_match(self.high_value_terms), rng.integers(10, 21, count), 0)
+            search_volume -= np.where(lengths > 15, 10, np.where(lengths < 4, 5, 0))
+            components['search_volume'] = np.clip(search_volume, 0, 100)
+        
+        # Social mentions
+        if 'social_mentions' not in components:
+            mentions = rng.integers(50, 501, count).astype(np.float64)
+            mentions *= np.where(any_match(self.trending_keywords), rng.uniform(2, 5, count), 1.0)
+            components['social_mentions'] = np.minimum(100, (mentions / 10).astype(np.int64))
+        
+        # News mentions
+        if 'news_mentions' not in components:
+            news_mentions = rng.integers(20, 91, count)
+            news_mentions += np.where(any_match(self.news_heavy_topics), rng.integers(5, 16, count), 0)
+            components['news_mentions'] = np.minimum(100, news_mentions)
+        
+        # Commercial intent
+        if 'commercial_intent' not in components:
+            commercial = matches[:, [column[term] for term in self.commercial_indicators]].sum(axis=1) * 15
+            industry = np.zeros(count, dtype=bool)
+            for industry_terms in self.industry_terms.values():
+                industry |= any_match(industry_terms)
+            commercial = commercial + np.where(industry, 10, 0)
+            commercial = np.where(commercial == 0, rng.integers(20, 51, count), commercial)
+            components['commercial_intent'] = np.minimum(100, commercial)
+        
+        # Growth trend: first matching category wins
+        if 'growth_trend' not in components:
+            growth_trend = rng.integers(40, 71, count)
+            assigned = np.zeros(count, dtype=bool)
+            for category, category_terms in self.growth_categories.items():
+                low, high = self.growth_score_ranges[category]
+                hit = any_match(category_terms) & ~assigned
+                growth_trend = np.where(hit, rng.integers(low, high + 1, count), growth_trend)
+                assigned |= hit
+            components['growth_trend'] = growth_trend
+        
+        names = list(self.weights)
+        matrix = np.column_stack([components[name] for name in names]).astype(np.float64)
+        weights = np.array([self.weights[name] for name in names])
+        
+        total_scores = (matrix * weights).sum(axis=1)
+        return np.clip(total_scores.astype(np.int64), 0, 100)
+    
+    def get_search_volume_score(self, keyword, matches=None):
+        """Estimate search volume score"""
+        rng = derive_rng(self.seed, 'search_volume', keyword.lower())
+        
+        if matches is None:
+            matches = self.match_terms(keyword)
+        
+        interest = self.get_search_interest(keyword)
+        if interest:
+            # Google Trends interest is already on a 0-100 scale
+            base_score = int(interest['mean'])
+        else:
+            # Simulate search volume based on keyword characteristics
+            base_score = rng.randint(30, 80)
+            
+            # High-value keywords get bonus
+            if 'high_value' in matches:
+                base_score += rng.randint(10, 20)
         
         # Length penalty (very long keywords typically have lower search volume)
         if len(keyword) > 15:
@@ -58,20 +410,26 @@ class EnhancedTrendAnalyzer:
         
         return min(100, max(0, base_score))
     
-    def get_social_media_score(self, keyword):
+    def get_social_media_score(self, keyword, matches=None):
         """Analyze social media mentions and sentiment"""
+        rng = derive_rng(self.seed, 'social_mentions', keyword.lower())
+        
+        if matches is None:
+            matches = self.match_terms(keyword)
+        
+        if self.mention_index and self.mention_index.term_count:
+            # Mention volume, nudged up to 20 points by average sentiment
+            mentions = self.mention_index.get_mentions(keyword, 'social')
+            score = self.mention_index.count_score(mentions['count'], 'social')
+            return min(100, int(score * 0.8 + (mentions['sentiment'] + 1) * 10))
+        
         try:
             # Simulate social media analysis
-            base_mentions = random.randint(50, 500)
+            base_mentions = rng.randint(50, 500)
             
             # Trending topics get more mentions
-            trending_keywords = [
-                'ai', 'chatgpt', 'crypto', 'bitcoin', 'nft', 'web3',
-                'metaverse', 'sustainability', 'climate', 'remote'
-            ]
-            
-            if any(trend in keyword.lower() for trend in trending_keywords):
-                base_mentions *= random.uniform(2, 5)
+            if 'trending' in matches:
+                base_mentions *= rng.uniform(2, 5)
             
             # Convert mentions to score (0-100)
             score = min(100, int(base_mentions / 10))
@@ -79,137 +437,111 @@ class EnhancedTrendAnalyzer:
             return score
             
         except Exception:
-            return random.randint(40, 70)
+            return rng.randint(40, 70)
     
-    def get_news_mention_score(self, keyword):
+    def get_news_mention_score(self, keyword, matches=None):
         """Get news mention score"""
+        rng = derive_rng(self.seed, 'news_mentions', keyword.lower())
+        
+        if matches is None:
+            matches = self.match_terms(keyword)
+        
+        if self.mention_index and self.mention_index.term_count:
+            return self.mention_index.mention_score(keyword, 'news')
+        
         try:
             # Simulate news analysis
-            news_score = random.randint(20, 90)
+            news_score = rng.randint(20, 90)
             
             # Tech and finance keywords often in news
-            news_heavy_topics = [
-                'ai', 'artificial', 'intelligence', 'crypto', 'bitcoin',
-                'climate', 'health', 'finance', 'economy', 'tech'
-            ]
-            
-            if any(topic in keyword.lower() for topic in news_heavy_topics):
-                news_score += random.randint(5, 15)
+            if 'news' in matches:
+                news_score += rng.randint(5, 15)
             
             return min(100, news_score)
             
         except Exception:
-            return random.randint(30, 60)
+            return rng.randint(30, 60)
     
-    def get_commercial_intent_score(self, keyword):
+    def get_commercial_intent_score(self, keyword, matches=None):
         """Analyze commercial intent of keyword"""
-        commercial_indicators = [
-            'buy', 'purchase', 'price', 'cost', 'cheap', 'discount',
-            'deal', 'sale', 'shop', 'store', 'market', 'service',
-            'product', 'solution', 'software', 'app', 'tool', 'platform'
-        ]
+        rng = derive_rng(self.seed, 'commercial_intent', keyword.lower())
         
-        # Check for commercial terms
-        commercial_score = 0
-        keyword_lower = keyword.lower()
+        if matches is None:
+            matches = self.match_terms(keyword)
         
-        for indicator in commercial_indicators:
-            if indicator in keyword_lower:
-                commercial_score += 15
+        # Check for commercial terms
+        commercial_score = 15 * len(matches.get('commercial', ()))
         
         # Industry-specific commercial terms
-        industry_terms = {
-            'tech': ['app', 'software', 'platform', 'tool', 'api', 'saas'],
-            'health': ['care', 'treatment', 'therapy', 'supplement', 'service'],
-            'finance': ['invest', 'trading', 'bank', 'pay', 'fund', 'wealth']
-        }
-        
-        for industry, terms in industry_terms.items():
-            if any(term in keyword_lower for term in terms):
-                commercial_score += 10
-                break
+        if any(('industry', industry) in matches for industry in self.industry_terms):
+            commercial_score += 10
         
         # Base commercial potential
         if not commercial_score:
-            commercial_score = random.randint(20, 50)
+            commercial_score = rng.randint(20, 50)
         
         return min(100, commercial_score)
     
-    def get_growth_trend_score(self, keyword):
+    def get_growth_trend_score(self, keyword, matches=None):
         """Analyze growth trend of keyword"""
-        # Simulate growth trend analysis
-        growth_categories = {
-            'explosive': ['ai', 'chatgpt', 'nft', 'web3', 'metaverse'],
-            'strong': ['crypto', 'defi', 'sustainability', 'remote', 'digital'],
-            'steady': ['health', 'fitness', 'finance', 'tech', 'app'],
-            'declining': ['flash', 'cd', 'dvd', 'fax']
-        }
+        rng = derive_rng(self.seed, 'growth_trend', keyword.lower())
         
-        keyword_lower = keyword.lower()
+        if matches is None:
+            matches = self.match_terms(keyword)
         
-        for category, terms in growth_categories.items():
-            if any(term in keyword_lower for term in terms):
-                if category == 'explosive':
-                    return random.randint(85, 100)
-                elif category == 'strong':
-                    return random.randint(70, 90)
-                elif category == 'steady':
-                    return random.randint(50, 75)
-                elif category == 'declining':
-                    return random.randint(10, 40)
+        interest = self.get_search_interest(keyword)
+        if interest:
+            # Relative change between the first and last quarter of the timeframe
+            return min(100, max(0, int(50 + 50 * interest['growth'])))
+        
+        # Simulate growth trend analysis
+        for category in self.growth_categories:
+            if ('growth', category) in matches:
+                low, high = self.growth_score_ranges[category]
+                return rng.randint(low, high)
         
         # Default growth score
-        return random.randint(40, 70)
+        return rng.randint(40, 70)
+    
+    def get_market_value_estimate(self, domain, trend_score, features=None):
+        """Estimate market value based on trends and domain characteristics, cached"""
+        return self.trending_cache.get_or_compute(
+            self.cache_key('value', domain.lower(), trend_score),
+            lambda: self.compute_market_value(domain, trend_score, features)
+        )
     
-    def get_market_value_estimate(self, domain, trend_score):
-        """Estimate market value based on trends and domain characteristics"""
+    def compute_market_value(self, domain, trend_score, features=None):
+        """Estimate market value without the cache"""
+        rng = derive_rng(self.seed, 'market_value', domain.lower())
+        
         keyword = domain.split('.')[0]
         extension = domain.split('.')[-1]
+        if features is None:
+            features = self.get_keyword_features(keyword, include_trend=False)
         
         # Base value calculation
-        base_value = trend_score * random.uniform(8, 25)
+        base_value = trend_score * rng.uniform(8, 25)
         
         # Length bonus/penalty
-        if len(keyword) <= 4:
+        length = features['length']
+        if length <= 4:
             base_value *= 2.5  # Short domains are premium
-        elif len(keyword) <= 6:
+        elif length <= 6:
             base_value *= 1.8
-        elif len(keyword) <= 8:
+        elif length <= 8:
             base_value *= 1.3
-        elif len(keyword) > 12:
+        elif length > 12:
             base_value *= 0.7  # Long domains less valuable
         
         # Extension multipliers
-        extension_multipliers = {
-            'com': 3.0,
-            'ai': 2.5,
-            'io': 2.0,
-            'co': 1.8,
-            'net': 1.5,
-            'org': 1.3,
-            'tech': 1.4,
-            'app': 1.6
-        }
-        
-        multiplier = extension_multipliers.get(extension, 1.0)
+        multiplier = self.extension_multipliers.get(extension, 1.0)
         estimated_value = base_value * multiplier
         
         # Industry-specific bonuses
-        industry_bonuses = {
-            'ai': 1.5,
-            'crypto': 1.4,
-            'health': 1.3,
-            'finance': 1.3,
-            'tech': 1.2
-        }
-        
-        for industry, bonus in industry_bonuses.items():
-            if industry in keyword.lower():
-                estimated_value *= bonus
-                break
+        estimated_value *= features['industry_bonus']
         
         # Brandability bonus
-        brandability_score = self.calculate_brandability_score(keyword)
+        brandability_score = features['brandability_score']
         if brandability_score > 80:
             estimated_value *= 1.3
         elif brandability_score > 60:
@@ -217,8 +549,88 @@ class EnhancedTrendAnalyzer:
         
         return max(100, min(100000, int(estimated_value)))
     
+    def estimate_market_values(self, df, rng=None):
+        """Vectorized get_market_value_estimate over a DataFrame with domain and trend_score columns"""
+        rng = rng or np.random.default_rng(self.seed)
+        if df.empty:
+            return pd.Series(dtype='int64', index=df.index, name='market_value')
+        
+        parts = df['domain'].astype(str).str.split('.')
+        keywords = parts.str[0]
+        extensions = parts.str[-1].astype('category')
+        lengths = keywords.str.len().to_numpy()
+        
+        # Base value calculation
+        values = df['trend_score'].to_numpy(dtype=np.float64) * rng.uniform(8, 25, len(df))
+        
+        # Length bonus/penalty
+        values *= np.select(
+            [lengths <= 4, lengths <= 6, lengths <= 8, lengths > 12],
+            [2.5, 1.8, 1.3, 0.7],
+            default=1.0
+        )
+        
+        # Extension multipliers, looked up once per distinct extension
+        values *= extensions.map(self.extension_multipliers).astype(np.float64).fillna(1.0).to_numpy()
+        
+        # Industry-specific bonuses, first match in dict order wins
+        lowered = keywords.str.lower()
+        bonus = np.ones(len(df))
+        for industry, industry_bonus in reversed(list(self.industry_bonuses.items())):
+            bonus = np.where(lowered.str.contains(industry, regex=False).to_numpy(), industry_bonus, bonus)
+        values *= bonus
+        
+        # Brandability bonus
+        brandability = self.calculate_brandability_scores(keywords)
+        values *= np.where(brandability > 80, 1.3, np.where(brandability > 60, 1.1, 1.0))
+        
+        values = np.clip(values.astype(np.int64), 100, 100000)
+        return pd.Series(values, index=df.index, name='market_value')
+    
+    def calculate_brandability_scores(self, keywords):
+        """Vectorized calculate_brandability_score over a Series of keywords"""
+        keywords = pd.Series(keywords, dtype=object).astype(str).reset_index(drop=True)
+        lowered = keywords.str.lower()
+        lengths = keywords.str.len().to_numpy()
+        
+        # Length scoring
+        scores = 50 + np.select(
+            [(lengths >= 4) & (lengths <= 8), (lengths >= 9) & (lengths <= 10), lengths < 4],
+            [25, 15, 10],
+            default=-10
+        )
+        
+        # Pronounceability
+        vowels = lowered.str.count('[aeiou]').to_numpy()
+        consonants = lengths - vowels
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vowel_ratio = np.where(lengths > 0, vowels / np.maximum(lengths, 1), 0)
+        scores += np.where((vowels > 0) & (consonants > 0) & (vowel_ratio >= 0.2) & (vowel_ratio <= 0.6), 20, 0)
+        
+        # Avoid numbers and special characters
+        scores -= np.where(keywords.str.contains(r'[\d\-_]').to_numpy(), 25, 0)
+        
+        # Dictionary word bonus
+        scores += np.where(lowered.isin(self.common_words).to_numpy(), 15, 0)
+        
+        # Memorable patterns: distinct characters from the sorted code points of each keyword
+        width = max(1, int(lengths.max())) if len(lengths) else 1
+        codes = np.array(lowered.tolist(), dtype=f'U{width}').view(np.int32).reshape(-1, width)
+        codes = np.sort(codes, axis=1)
+        distinct = (np.diff(codes, axis=1) != 0).sum(axis=1) + 1 - (codes[:, 0] == 0)
+        scores += np.where(distinct < lengths * 0.7, 10, 0)
+        
+        return np.clip(scores, 0, 100)
+    
     def calculate_brandability_score(self, keyword):
-        """Calculate how brandable a keyword is"""
+        """Calculate how brandable a keyword is, cached per keyword"""
+        return self.trending_cache.get_or_compute(
+            self.cache_key('brand', keyword.lower()),
+            lambda: self.compute_brandability_score(keyword)
+        )
+    
+    def compute_brandability_score(self, keyword):
+        """Calculate how brandable a keyword is without the cache"""
         score = 50  # Base score
         
         # Length scoring
@@ -246,12 +658,7 @@ class EnhancedTrendAnalyzer:
             score -= 25
         
         # Dictionary word bonus
-        common_words = [
-            'smart', 'quick', 'fast', 'easy', 'simple', 'pro', 'max',
-            'ultra', 'super', 'mega', 'best', 'top', 'prime', 'elite'
-        ]
-        
-        if keyword.lower() in common_words:
+        if keyword.lower() in self.common_words:
             score += 15
         
         # Memorable patterns
@@ -260,8 +667,25 @@ class EnhancedTrendAnalyzer:
         
         return max(0, min(100, score))
     
+    def get_competitor_analyses(self, keywords):
+        """Competitors for many keywords, resolved together when a finder is set"""
+        if self.competitor_finder:
+            try:
+                return self.competitor_finder.discover(keywords)
+            except Exception:
+                pass
+        return {keyword.lower(): self.get_competitor_analysis(keyword) for keyword in keywords}
+    
     def get_competitor_analysis(self, keyword):
         """Analyze competitor domains"""
+        if self.competitor_finder:
+            try:
+                return self.competitor_finder.discover([keyword])[keyword.lower()]
+            except Exception:
+                pass
+        
+        rng = derive_rng(self.seed, 'competitors', keyword.lower())
+        
         # Simulate competitor analysis
         competitors = []
         
@@ -270,25 +694,27 @@ class EnhancedTrendAnalyzer:
         prefixes = ['get', 'my', 'the', 'pro', 'best']
         suffixes = ['app', 'hub', 'pro', 'ly', 'io']
         
-        for i in range(random.randint(3, 8)):
-            if random.choice([True, False]):
+        for i in range(rng.randint(3, 8)):
+            if rng.choice([True, False]):
                 # Prefix variation
-                competitor = f"{random.choice(prefixes)}{keyword}.{random.choice(extensions)}"
+                competitor = f"{rng.choice(prefixes)}{keyword}.{rng.choice(extensions)}"
             else:
                 # Suffix variation
-                competitor = f"{keyword}{random.choice(suffixes)}.{random.choice(extensions)}"
+                competitor = f"{keyword}{rng.choice(suffixes)}.{rng.choice(extensions)}"
             
             competitors.append({
                 'domain': competitor,
-                'estimated_traffic': random.randint(1000, 50000),
-                'domain_authority': random.randint(20, 80),
-                'backlinks': random.randint(100, 10000)
+                'estimated_traffic': rng.randint(1000, 50000),
+                'domain_authority': rng.randint(20, 80),
+                'backlinks': rng.randint(100, 10000)
             })
         
         return competitors
     
     def get_seasonal_trends(self, keyword):
         """Analyze seasonal trends for keyword"""
+        rng = derive_rng(self.seed, 'seasonal', keyword.lower())
+        
         # Simulate seasonal data
         months = [
             'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
@@ -296,25 +722,25 @@ class EnhancedTrendAnalyzer:
         ]
         
         seasonal_data = []
-        base_interest = random.randint(40, 80)
+        base_interest = rng.randint(40, 80)
         
         for i, month in enumerate(months):
             # Add seasonal variation
             if keyword.lower() in ['fitness', 'health', 'diet']:
                 # Health keywords peak in January (New Year resolutions)
                 if i == 0:  # January
-                    interest = base_interest + random.randint(20, 40)
+                    interest = base_interest + rng.randint(20, 40)
                 else:
-                    interest = base_interest + random.randint(-10, 15)
+                    interest = base_interest + rng.randint(-10, 15)
             elif keyword.lower() in ['crypto', 'invest', 'finance']:
                 # Finance keywords more stable with slight end-of-year increase
                 if i >= 10:  # Nov-Dec
-                    interest = base_interest + random.randint(5, 20)
+                    interest = base_interest + rng.randint(5, 20)
                 else:
-                    interest = base_interest + random.randint(-5, 10)
+                    interest = base_interest + rng.randint(-5, 10)
             else:
                 # General variation
-                interest = base_interest + random.randint(-15, 20)
+                interest = base_interest + rng.randint(-15, 20)
             
             seasonal_data.append({
                 'month': month,
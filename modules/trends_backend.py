@@ -0,0 +1,230 @@
+import time
+import hashlib
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from modules.registrars import RateLimiter
+from modules.score_cache import ScoreCache, MISSING
+
+# Google Trends compares at most five keywords per payload
+MAX_PAYLOAD_KEYWORDS = 5
+
+# Each payload carries a fixed anchor keyword, leaving four slots for lookups
+KEYWORDS_PER_PAYLOAD = MAX_PAYLOAD_KEYWORDS - 1
+
+class PyTrendsClient:
+    """Interest over time from Google Trends through pytrends"""
+
+    def __init__(self, hl='en-US', tz=360, timeframe='today 12-m', geo=''):
+        self.hl = hl
+        self.tz = tz
+        self.timeframe = timeframe
+        self.geo = geo
+        self.pytrends = None
+
+    def interest_over_time(self, keywords):
+        """Weekly interest series for up to five keywords: {keyword: [0-100, ...]}"""
+        if self.pytrends is None:
+            # TrendReq fetches a Google cookie on construction, so create it on first use
+            from pytrends.request import TrendReq
+            self.pytrends = TrendReq(hl=self.hl, tz=self.tz)
+
+        self.pytrends.build_payload(keywords, timeframe=self.timeframe, geo=self.geo)
+        frame = self.pytrends.interest_over_time()
+
+        return {
+            keyword: frame[keyword].astype(float).tolist() if keyword in frame else []
+            for keyword in keywords
+        }
+
+class StandInTrendsClient:
+    """Local stand-in for Google Trends with deterministic series per keyword"""
+
+    def __init__(self, latency=0.0, weeks=52):
+        self.latency = latency  # Seconds added to every request
+        self.weeks = weeks
+        self.payloads = []  # Keyword lists of every request, for inspection
+
+    def interest_over_time(self, keywords):
+        """Deterministic weekly series for up to five keywords, scaled to the payload maximum like Google's"""
+        if len(keywords) > MAX_PAYLOAD_KEYWORDS:
+            raise ValueError(f"at most {MAX_PAYLOAD_KEYWORDS} keywords per payload")
+
+        self.payloads.append(list(keywords))
+        if self.latency:
+            time.sleep(self.latency)
+
+        raw = {}
+        for keyword in keywords:
+            rng = random.Random(hashlib.md5(keyword.encode('utf-8')).hexdigest())
+            level = rng.uniform(5, 80)
+            slope = rng.uniform(-0.5, 1.0)
+            raw[keyword] = [max(0.0, level + slope * week + rng.uniform(-5, 5)) for week in range(self.weeks)]
+
+        peak = max((max(values) for values in raw.values()), default=0) or 1.0
+        return {keyword: [round(value * 100 / peak) for value in values] for keyword, values in raw.items()}
+
+def summarize_interest(values):
+    """Mean, recent and growth of an interest series, or None if empty"""
+    if not values:
+        return None
+
+    quarter = max(1, len(values) // 4)
+    earlier = sum(values[:quarter]) / quarter
+    recent = sum(values[-quarter:]) / quarter
+
+    return {
+        'mean': round(sum(values) / len(values), 2),
+        'recent': round(recent, 2),
+        'growth': round((recent - earlier) / max(earlier, 1.0), 3)
+    }
+
+def rescale_to_anchor(series, anchor_values, anchor_level):
+    """Rescale a payload's series so the anchor's mean is anchor_level, or None without an anchor"""
+    if not anchor_values:
+        return None
+    anchor_mean = sum(anchor_values) / len(anchor_values)
+    if anchor_mean <= 0:
+        return None
+    factor = anchor_level / anchor_mean
+    return {keyword: [value * factor for value in values] for keyword, values in series.items()}
+
+class TrendsBackend:
+    """Search interest lookups packed into full payloads, coalesced and cached"""
+
+    def __init__(self, client=None, cache_file="data/trends_cache.json", ttl=86400,
+                 batch_window=0.05, rate_limit=0.5, anchor='weather', anchor_level=50):
+        self.client = client or PyTrendsClient()
+        self.cache = ScoreCache(max_size=100000, ttl=ttl, cache_file=cache_file)
+
+        # Google scales every payload to its own maximum; a fixed anchor in each payload puts
+        # all keywords on one scale, where the anchor's mean interest is anchor_level
+        self.anchor = anchor.lower()
+        self.anchor_level = anchor_level
+        self.batch_window = batch_window  # Seconds to wait for a payload to fill up
+        self.limiter = RateLimiter(rate_limit)
+
+        self.pending = []    # Keywords queued for the next payload
+        self.in_flight = {}  # {keyword: Future} for queued or running lookups
+        self.stats = {'requests': 0, 'keywords_fetched': 0, 'coalesced': 0, 'errors': 0}
+
+        self._lock = threading.Lock()
+        self._timer = None
+
+        # One worker keeps requests to Google sequential
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def cache_key(self, keyword):
+        """Cache key; values are only comparable under the same anchor"""
+        return f"{self.anchor}={self.anchor_level}|{keyword}"
+
+    def request(self, keywords):
+        """Queue lookups and return {keyword: Future}; duplicates share one lookup"""
+        futures = {}
+        payloads = []
+
+        with self._lock:
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword in futures:
+                    continue
+
+                cached = self.cache.get(self.cache_key(keyword), MISSING)
+                if cached is not MISSING:
+                    future = Future()
+                    future.set_result(cached)
+                elif keyword in self.in_flight:
+                    future = self.in_flight[keyword]
+                    self.stats['coalesced'] += 1
+                else:
+                    future = Future()
+                    self.in_flight[keyword] = future
+                    self.pending.append(keyword)
+                futures[keyword] = future
+
+            # Full payloads go out now, a partial one after the batch window
+            while len(self.pending) >= KEYWORDS_PER_PAYLOAD:
+                payloads.append(self.pending[:KEYWORDS_PER_PAYLOAD])
+                del self.pending[:KEYWORDS_PER_PAYLOAD]
+
+            if self.pending and self._timer is None:
+                self._timer = threading.Timer(self.batch_window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        for payload in payloads:
+            self._executor.submit(self.fetch_payload, payload)
+
+        return futures
+
+    def flush(self):
+        """Send queued keywords without waiting for a full payload"""
+        with self._lock:
+            self._timer = None
+            payloads = [
+                self.pending[i:i + KEYWORDS_PER_PAYLOAD]
+                for i in range(0, len(self.pending), KEYWORDS_PER_PAYLOAD)
+            ]
+            self.pending = []
+
+        for payload in payloads:
+            self._executor.submit(self.fetch_payload, payload)
+
+    def fetch_payload(self, keywords):
+        """Fetch one payload (keywords plus the anchor) and resolve its futures"""
+        results = {}
+        try:
+            self.limiter.wait()
+            payload = keywords if self.anchor in keywords else keywords + [self.anchor]
+            series = self.client.interest_over_time(payload)
+            scaled = rescale_to_anchor(series, series.get(self.anchor), self.anchor_level)
+
+            with self._lock:
+                self.stats['requests'] += 1
+                self.stats['keywords_fetched'] += len(keywords)
+                if scaled is None:
+                    # Nothing to compare against, so the values would not be absolute
+                    self.stats['errors'] += 1
+
+            if scaled is not None:
+                results = {keyword: summarize_interest(scaled.get(keyword)) for keyword in keywords}
+        except Exception:
+            with self._lock:
+                self.stats['errors'] += 1
+
+        for keyword in keywords:
+            interest = results.get(keyword)
+            if keyword in results:
+                self.cache.set(self.cache_key(keyword), interest)
+
+            with self._lock:
+                future = self.in_flight.pop(keyword, None)
+            if future:
+                future.set_result(interest)
+
+    def get_interest_many(self, keywords, timeout=60):
+        """Interest summaries for many keywords: {keyword: summary or None}"""
+        futures = self.request(keywords)
+
+        results = {}
+        for keyword, future in futures.items():
+            try:
+                results[keyword] = future.result(timeout)
+            except Exception:
+                results[keyword] = None
+        return results
+
+    def get_interest(self, keyword, timeout=60):
+        """Interest summary for one keyword, or None"""
+        return self.get_interest_many([keyword], timeout).get(keyword.lower())
+
+    def get_stats(self):
+        """Request, coalescing and cache statistics"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats['cache'] = self.cache.get_stats()
+        return stats
+
+    def save_cache(self):
+        """Persist cached interest summaries"""
+        return self.cache.save()
@@ -0,0 +1,66 @@
+import io
+
+from modules import data_transfer
+
+class MemoryDB:
+    """Just enough of a database for data_transfer: record iterators and bulk saves"""
+
+    def __init__(self, domains=(), searches=()):
+        self.domains = list(domains)
+        self.searches = list(searches)
+
+    def iter_domain_records(self):
+        return iter(self.domains)
+
+    def iter_search_records(self):
+        return iter(self.searches)
+
+    def save_domains(self, domains, preserve_timestamps=False):
+        self.domains.extend(domains)
+        return True
+
+    def save_searches(self, searches, preserve_timestamps=False):
+        self.searches.extend(searches)
+        return True
+
+DOMAINS = [
+    {'id': 1, 'domain': '007.com', 'keyword': '007', 'extension': '.com', 'price': 12.5, 'premium': False,
+     'trend_score': 71, 'brandability_score': 80, 'market_value': 900, 'roi_potential': 7200.0,
+     'saved_at': '2026-10-19T10:00:00'},
+    {'id': 2, 'domain': 'nan.io', 'keyword': 'nan', 'extension': '.io', 'price': 40, 'premium': True,
+     'trend_score': 55, 'brandability_score': 62, 'market_value': 1500, 'roi_potential': 3750.0,
+     'saved_at': '2026-10-19T10:05:00'},
+    {'id': 3, 'domain': 'infinity.ai', 'keyword': 'infinity', 'extension': '.ai', 'price': 89.99, 'premium': False,
+     'trend_score': 90, 'brandability_score': 75, 'market_value': 4000, 'roi_potential': 4444.9,
+     'saved_at': '2026-10-19T10:10:00'},
+    {'id': 4, 'domain': 'inf.co', 'keyword': 'inf', 'extension': '.co', 'price': 30.0, 'premium': False,
+     'trend_score': 40, 'brandability_score': 90, 'market_value': 300, 'roi_potential': 1000.0,
+     'saved_at': '2026-10-19T10:15:00', 'notes': 'True'},
+]
+
+def round_trip(format):
+    text = ''.join(data_transfer.iter_export(MemoryDB(DOMAINS), format, chunk_size=2))
+    target = MemoryDB()
+    counts = data_transfer.import_records(target, io.StringIO(text, newline=''), format, batch_size=3)
+    return counts, target.domains
+
+def test_csv_round_trip_keeps_types():
+    counts, domains = round_trip('csv')
+    assert counts == {'domains': len(DOMAINS), 'searches': 0}
+    assert domains == DOMAINS
+
+def test_csv_round_trip_keeps_numeric_looking_strings():
+    _, domains = round_trip('csv')
+    assert [domain['keyword'] for domain in domains] == ['007', 'nan', 'infinity', 'inf']
+    assert domains[3]['notes'] == 'True'
+
+def test_jsonl_round_trip():
+    counts, domains = round_trip('jsonl')
+    assert counts == {'domains': len(DOMAINS), 'searches': 0}
+    assert domains == DOMAINS
+
+def test_numeric_fields_reject_non_finite_values():
+    assert data_transfer.parse_csv_value('price', 'nan') == 'nan'
+    assert data_transfer.parse_csv_value('trend_score', 'inf') == 'inf'
+    assert data_transfer.parse_csv_value('price', '12.99') == 12.99
+    assert data_transfer.parse_csv_value('keyword', '42') == '42'
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta
+
+from modules.database import EnhancedFileDB, empty_aggregates, update_aggregates
+
+def saved_domains(now):
+    """Domains saved 400, 31, 29 and 1 days ago, the oldest in partitions cleanup drops whole"""
+    domains = []
+    for n, days in enumerate([400, 400, 31, 29, 29, 1]):
+        domains.append({
+            'domain': f"name{n}.com",
+            'extension': '.com',
+            'price': 10.0 + n,
+            'trend_score': 50 + n,
+            'saved_at': (now - timedelta(days=days)).isoformat()
+        })
+    return domains
+
+def test_cleanup_keeps_aggregates_in_step(tmp_path):
+    now = datetime.now()
+    db = EnhancedFileDB(tmp_path / "data", flush_interval=0)
+    db.save_domains(saved_domains(now), preserve_timestamps=True)
+
+    assert db.cleanup_old_data(days_old=30) == 3
+
+    kept = list(db.iter_domain_records())
+    assert sorted(domain['domain'] for domain in kept) == ['name3.com', 'name4.com', 'name5.com']
+    assert db.get_aggregates() == update_aggregates(empty_aggregates(), kept)
+    assert db.get_analytics()['total_domains'] == 3
+    assert db.get_analytics()['min_price'] == 13.0
+
+    # Another process opening the directory finds the stored totals up to date
+    reopened = EnhancedFileDB(tmp_path / "data", flush_interval=0)
+    assert reopened.stale_partitions(reopened.read_analytics().get('partition_aggregates')) == set()
+    assert reopened.get_aggregates() == db.get_aggregates()
+
+def test_saves_survive_reopen(tmp_path):
+    db = EnhancedFileDB(tmp_path / "data", flush_interval=0)
+    db.save_domains([{'domain': f"name{n}.io", 'extension': '.io', 'price': 5.0} for n in range(10)])
+
+    reopened = EnhancedFileDB(tmp_path / "data")
+    domains = reopened.get_domains()
+    assert [domain['domain'] for domain in domains] == [f"name{n}.io" for n in range(10)]
+    assert len({domain['id'] for domain in domains}) == 10
+    assert reopened.get_analytics()['total_domains'] == 10
@@ -0,0 +1,74 @@
+import multiprocessing
+
+from modules import segment_log
+from modules.segment_log import SegmentLog, PartitionedLog
+
+def append_records(log, count, start=0):
+    ids = log.reserve_ids(count)
+    records = [{'id': record_id, 'domain': f"name{start + n}.com", 'pad': 'x' * 40} for n, record_id in enumerate(ids)]
+    log.append_many(records)
+    return records
+
+def test_append_and_reopen_across_segments(tmp_path):
+    log = SegmentLog(tmp_path / "log", max_segment_bytes=2000)
+    records = append_records(log, 200)
+    log.delete([records[0]['id'], records[150]['id']])
+    log.append(dict(records[10], domain='renamed.com'))
+    log.close()
+
+    reopened = SegmentLog(tmp_path / "log", max_segment_bytes=2000)
+    assert len(reopened.segments()) > 1
+    assert reopened.offsets == log.offsets
+    assert reopened.dead == log.dead
+    assert reopened.get(records[0]['id']) is None
+    assert reopened.get(records[10]['id'])['domain'] == 'renamed.com'
+    assert [record['id'] for record in reopened.iter_records()] == sorted(log.offsets, key=log.offsets.get)
+
+def test_reopen_from_checkpoint_scans_only_the_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(segment_log, 'CHECKPOINT_BYTES', 1000)
+    log = SegmentLog(tmp_path / "log")
+    records = append_records(log, 100)
+    log.delete([records[5]['id']])
+    checkpoint = log._checkpointed
+    append_records(log, 3, start=100)  # Less than CHECKPOINT_BYTES past the checkpoint
+    log.close()
+
+    assert 0 < checkpoint < log._scanned
+    assert log.checkpoint_path(1).exists()
+
+    reopened = SegmentLog(tmp_path / "log")
+    assert reopened.offsets == log.offsets
+    assert reopened.dead == log.dead
+    assert reopened.get(records[5]['id']) is None
+
+    # A checkpoint that no longer matches its segment is ignored
+    log.compact()
+    reopened = SegmentLog(tmp_path / "log")
+    assert reopened.offsets == log.offsets
+
+def append_from_process(root_dir, worker, batches):
+    log = PartitionedLog(root_dir, 'saved_at')
+    for batch in range(batches):
+        ids = log.reserve_ids(5)
+        log.append_many([
+            {'id': record_id, 'worker': worker, 'saved_at': f"2026-{1 + (batch % 3):02d}-15T12:00:00"}
+            for record_id in ids
+        ])
+    log.close()
+
+def test_concurrent_processes_get_unique_ids(tmp_path):
+    processes = [
+        multiprocessing.Process(target=append_from_process, args=(tmp_path / "log", worker, 20))
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    log = PartitionedLog(tmp_path / "log", 'saved_at')
+    ids = [record['id'] for record in log.iter_records()]
+    assert len(ids) == 4 * 20 * 5
+    assert len(set(ids)) == len(ids)
+    assert log.max_id == max(ids)